@@ -0,0 +1,51 @@
+import asyncio
+import time
+from datetime import timedelta
+
+from benchmarks.delayed_node import DelayedNode
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout, BatchConfiguration
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+BATCH_SIZES = (1, 16, 256, 4096)
+FOLLOWERS = 2
+ROUND_TRIP_TIME = timedelta(milliseconds=2)
+DURATION = timedelta(seconds=3)
+MESSAGES = 200_000
+
+
+async def measure_throughput(max_batch_size: int) -> float:
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=60), min_timeout=timedelta(seconds=60)),
+        heartbeat_period=timedelta(seconds=0.05),
+        batching=BatchConfiguration(max_batch_size=max_batch_size),
+    )
+    leader: Node[str] = Node(lambda node: Leader(node))
+    followers: list[Node[str]] = [Node(lambda node: Subject(node)) for _ in range(FOLLOWERS)]
+    for follower in followers:
+        leader.register_node(DelayedNode(follower, ROUND_TRIP_TIME))
+    tasks = [asyncio.create_task(node.run(configuration)) for node in (leader, *followers)]
+
+    for index in range(MESSAGES):
+        await leader.send_message(f'message {index}')
+    start = time.perf_counter()
+    await asyncio.sleep(DURATION.total_seconds())
+    committed = (await leader.get_messages()).next_index
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    return committed / elapsed
+
+
+async def main() -> None:
+    print(f'{FOLLOWERS} followers, round trip time {ROUND_TRIP_TIME.total_seconds() * 1000:.1f}ms')
+    print(f'{"max batch size":>16} {"messages/sec":>14}')
+    for max_batch_size in BATCH_SIZES:
+        throughput = await measure_throughput(max_batch_size)
+        print(f'{max_batch_size:>16} {throughput:>14.0f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
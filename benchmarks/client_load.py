@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any
+
+from quorum.client.quorum_client import QuorumClient
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.message_box.commit_outcome import Committed
+from quorum.node.node import Node
+from quorum.node.node_http_client import NodeHttpClient
+from quorum.node.node_http_server import NodeServer
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+PORTS = (8097, 8098, 8099)
+CONCURRENCIES = (1, 16, 64, 256)
+MESSAGES = 2000
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def generate_load(client: QuorumClient, concurrency: int) -> tuple[float, float, float, int]:
+    latencies: list[float] = []
+    failures = 0
+
+    async def producer(producer_index: int) -> None:
+        nonlocal failures
+        for message_index in range(MESSAGES // concurrency):
+            start = time.perf_counter()
+            outcome = await client.send_message(f'Milkshake {producer_index}/{message_index}')
+            if isinstance(outcome, Committed):
+                latencies.append(time.perf_counter() - start)
+            else:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[producer(index) for index in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), failures
+
+
+async def main() -> None:
+    urls = [f'http://localhost:{port}' for port in PORTS]
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(timedelta(seconds=600), timedelta(seconds=600)),
+        heartbeat_period=timedelta(seconds=0.05),
+    )
+    nodes: list[Node[str]] = [Node(lambda node: Leader(node), address=urls[0])]
+    nodes += [Node(lambda node: Subject(node), address=url) for url in urls[1:]]
+    remote_clients = [NodeHttpClient(url) for url in urls]
+    servers: list[asyncio.Task[Any]] = [
+        asyncio.create_task(NodeServer(
+            node=node,
+            remote_nodes=[client for client in remote_clients if client is not remote_clients[index]],
+            cluster_configuration=configuration,
+        ).run(port))
+        for index, (node, port) in enumerate(zip(nodes, PORTS))
+    ]
+    await asyncio.sleep(1)
+    logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
+
+    client = QuorumClient(list(reversed(urls)))
+    print(f'{MESSAGES} messages per run against {len(PORTS)} nodes')
+    print(f'{"concurrency":>12} {"msgs/sec":>9} {"p50 (ms)":>9} {"p99 (ms)":>9} {"failed":>7}')
+    for concurrency in CONCURRENCIES:
+        messages_per_second, p50, p99, failures = await generate_load(client, concurrency)
+        print(f'{concurrency:>12} {messages_per_second:>9.0f} {p50 * 1000:>9.2f} {p99 * 1000:>9.2f} {failures:>7}')
+
+    await client.close()
+    for server in servers:
+        server.cancel()
+    await asyncio.gather(*servers, return_exceptions=True)
+    for remote_client in remote_clients:
+        await remote_client.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
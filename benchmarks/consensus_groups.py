@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import multiprocessing
+import time
+from datetime import timedelta
+from multiprocessing.queues import Queue
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.consensus_groups import ConsensusGroups
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.commit_outcome import Committed
+from quorum.node.node import Node
+from quorum.node.node_tcp_client import NodeTcpClient
+from quorum.node.node_tcp_server import NodeTcpServer
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+FIRST_PORT = 8110
+CONNECT_TIME = timedelta(seconds=1)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--group-counts', nargs='+', type=int, default=[1, 3, 6, 12])
+    parser.add_argument('--hosts', type=int, default=3)
+    parser.add_argument('--concurrency', type=int, default=256)
+    parser.add_argument('--messages', type=int, default=20000)
+    return parser.parse_args()
+
+
+async def run_host(host_index: int, host_count: int, group_count: int, concurrency: int, messages: int) -> tuple[int, float]:
+    host = ConsensusGroups[str](range(group_count), lambda group_id, node_id: Node(
+        lambda node: Leader(node) if group_id % host_count == host_index else Subject(node),
+        node_id=node_id,
+    ), address=f'tcp://localhost:{FIRST_PORT + host_index}')
+    clients = [
+        NodeTcpClient[str]('localhost', FIRST_PORT + other_index, JsonCodec())
+        for other_index in range(host_count)
+        if other_index != host_index
+    ]
+    for client in clients:
+        host.register_host(client)
+    server_task = asyncio.create_task(NodeTcpServer(host, JsonCodec()).run(FIRST_PORT + host_index, host='localhost'))
+    host_task = asyncio.create_task(host.run(ClusterConfiguration(
+        election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=600), min_timeout=timedelta(seconds=600)),
+        heartbeat_period=timedelta(seconds=0.05),
+    )))
+    await asyncio.sleep(CONNECT_TIME.total_seconds())
+    keys = [key for key in (f'key-{index}' for index in range(messages)) if host.leads(key)]
+    committed = 0
+
+    async def producer(producer_index: int) -> None:
+        nonlocal committed
+        for key in keys[producer_index::concurrency]:
+            if isinstance(await (await host.submit_message(key, key)), Committed):
+                committed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[producer(index) for index in range(concurrency)])
+    seconds = time.perf_counter() - start
+    await asyncio.sleep(CONNECT_TIME.total_seconds())
+    host_task.cancel()
+    await asyncio.gather(host_task, return_exceptions=True)
+    for client in clients:
+        await client.close()
+    await asyncio.sleep(CONNECT_TIME.total_seconds())
+    server_task.cancel()
+    await asyncio.gather(server_task, return_exceptions=True)
+    return committed, seconds
+
+
+def host_process(results: 'Queue[tuple[int, float]]', *arguments: int) -> None:
+    results.put(asyncio.run(run_host(*arguments)))
+
+
+def measure(host_count: int, group_count: int, concurrency: int, messages: int) -> tuple[float, int]:
+    context = multiprocessing.get_context('spawn')
+    results: Queue[tuple[int, float]] = context.Queue()
+    processes = [
+        context.Process(target=host_process, args=(results, host_index, host_count, group_count, concurrency, messages))
+        for host_index in range(host_count)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    committed = sum(committed for committed, _ in outcomes)
+    return committed / max(seconds for _, seconds in outcomes), committed
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    print(f'{arguments.hosts} host processes over tcp, {arguments.concurrency} concurrent producers per host, '
+          f'{arguments.messages} messages')
+    print(f'{"groups":>6} {"msgs/sec":>9} {"committed":>10}')
+    for group_count in arguments.group_counts:
+        messages_per_second, committed = measure(arguments.hosts, group_count, arguments.concurrency, arguments.messages)
+        print(f'{group_count:>6} {messages_per_second:>9.0f} {committed:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Generic
+
+from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node import Node
+from quorum.node.node_interface import InternalNode
+from quorum.node.request_vote import VoteRequest, VoteResponse
+
+
+class DelayedNode(InternalNode[MessageType], Generic[MessageType]):
+    def __init__(self, node: Node[MessageType], round_trip_time: timedelta) -> None:
+        self._actual_node = node
+        self._one_way_delay = round_trip_time.total_seconds() / 2
+
+    def _get_id(self) -> int:
+        return self._actual_node._get_id()
+
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        await asyncio.sleep(self._one_way_delay)
+        vote = await self._actual_node.request_vote(request)
+        await asyncio.sleep(self._one_way_delay)
+        return vote
+
+    async def append_entries(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
+        await asyncio.sleep(self._one_way_delay)
+        response = await self._actual_node.append_entries(request)
+        await asyncio.sleep(self._one_way_delay)
+        return response
+
+    async def timeout_now(self, term: int) -> None:
+        await asyncio.sleep(self._one_way_delay)
+        await self._actual_node.timeout_now(term)
+        await asyncio.sleep(self._one_way_delay)
+
+    async def read_index(self) -> int | None:
+        await asyncio.sleep(self._one_way_delay)
+        read_index = await self._actual_node.read_index()
+        await asyncio.sleep(self._one_way_delay)
+        return read_index
+
+    async def send_message(self, message: MessageType) -> None:
+        await asyncio.sleep(self._one_way_delay)
+        await self._actual_node.send_message(message)
+        await asyncio.sleep(self._one_way_delay)
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
+        await asyncio.sleep(self._one_way_delay)
+        page = await self._actual_node.get_messages(since_index, limit)
+        await asyncio.sleep(self._one_way_delay)
+        return page
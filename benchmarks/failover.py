@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import statistics
+from dataclasses import dataclass
+from datetime import timedelta
+
+from benchmarks.delayed_node import DelayedNode
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.node import Node
+from quorum.node.request_vote import VoteRequest, VoteResponse
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+from quorum.simulation.simulated_clock import SimulatedClock
+
+ROUND_TRIP_TIME = timedelta(milliseconds=1)
+HEARTBEAT_PERIOD = timedelta(milliseconds=50)
+MIN_ELECTION_TIMEOUT = timedelta(milliseconds=150)
+MAX_ELECTION_TIMEOUT = timedelta(milliseconds=300)
+SETTLE_TIME = timedelta(seconds=1)
+GIVE_UP_AFTER = timedelta(seconds=60)
+
+
+class KillableNode(DelayedNode[str]):
+    def __init__(self, node: Node[str], round_trip_time: timedelta) -> None:
+        super().__init__(node, round_trip_time)
+        self.node = node
+        self.killed = False
+
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        if self.killed:
+            raise ConnectionError
+        return await super().request_vote(request)
+
+    async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+        if self.killed:
+            raise ConnectionError
+        return await super().append_entries(request)
+
+
+@dataclass(frozen=True)
+class Failover:
+    seconds: float
+    elections: int
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--modes', nargs='+', choices=('kill', 'transfer'), default=['kill', 'transfer'])
+    parser.add_argument('--cluster-sizes', nargs='+', type=int, default=[3, 5, 7])
+    parser.add_argument('--trials', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def wait_for_leader(nodes: list[KillableNode]) -> KillableNode:
+    while True:
+        leaders = [node for node in nodes if not node.killed and isinstance(node.node.role, Leader)]
+        if len(leaders) == 1:
+            return leaders[0]
+        await asyncio.sleep(0.001)
+
+
+async def start_cluster(clock: SimulatedClock, cluster_size: int) -> tuple[list[KillableNode], dict[KillableNode, asyncio.Task[None]]]:
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(
+            max_timeout=MAX_ELECTION_TIMEOUT,
+            min_timeout=MIN_ELECTION_TIMEOUT,
+            randomization=clock.randomization(),
+        ),
+        heartbeat_period=HEARTBEAT_PERIOD,
+    )
+    nodes = [KillableNode(Node(lambda node: Subject(node), node_id=node_id), ROUND_TRIP_TIME) for node_id in range(cluster_size)]
+    for node in nodes:
+        for other_node in nodes:
+            node.node.register_node(other_node)
+    tasks = {node: asyncio.create_task(node.node.run(configuration)) for node in nodes}
+    await wait_for_leader(nodes)
+    await asyncio.sleep(SETTLE_TIME.total_seconds())
+    return nodes, tasks
+
+
+async def stop_cluster(tasks: dict[KillableNode, asyncio.Task[None]]) -> None:
+    for task in tasks.values():
+        task.cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+async def kill_leader_once(clock: SimulatedClock, cluster_size: int) -> Failover:
+    nodes, tasks = await start_cluster(clock, cluster_size)
+    old_leader = await wait_for_leader(nodes)
+    term_before = old_leader.node.current_term
+
+    killed_at = asyncio.get_running_loop().time()
+    old_leader.killed = True
+    tasks[old_leader].cancel()
+    await asyncio.gather(tasks[old_leader], return_exceptions=True)
+    old_leader.node.role.stop_running()
+    new_leader = await asyncio.wait_for(wait_for_leader(nodes), timeout=GIVE_UP_AFTER.total_seconds())
+    failover = Failover(
+        seconds=asyncio.get_running_loop().time() - killed_at,
+        elections=new_leader.node.current_term - term_before,
+    )
+    await stop_cluster(tasks)
+    return failover
+
+
+async def transfer_leadership_once(clock: SimulatedClock, cluster_size: int) -> Failover:
+    nodes, tasks = await start_cluster(clock, cluster_size)
+    old_leader = await wait_for_leader(nodes)
+    term_before = old_leader.node.current_term
+
+    transfer_started = asyncio.get_running_loop().time()
+    await old_leader.node.transfer_leadership()
+    new_leader = await asyncio.wait_for(wait_for_leader(nodes), timeout=GIVE_UP_AFTER.total_seconds())
+    failover = Failover(
+        seconds=asyncio.get_running_loop().time() - transfer_started,
+        elections=new_leader.node.current_term - term_before,
+    )
+    await stop_cluster(tasks)
+    return failover
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    runners = {'kill': kill_leader_once, 'transfer': transfer_leadership_once}
+    print(f'election timeout {MIN_ELECTION_TIMEOUT.total_seconds() * 1000:.0f}-{MAX_ELECTION_TIMEOUT.total_seconds() * 1000:.0f}ms, '
+          f'heartbeat period {HEARTBEAT_PERIOD.total_seconds() * 1000:.0f}ms, '
+          f'round trip time {ROUND_TRIP_TIME.total_seconds() * 1000:.0f}ms, {arguments.trials} simulated failovers each')
+    print(f'{"mode":>8} {"cluster size":>12} {"p50 (ms)":>9} {"p90 (ms)":>9} {"p99 (ms)":>9} {"max (ms)":>9} {"elections":>10}')
+    for mode in arguments.modes:
+        for cluster_size in arguments.cluster_sizes:
+            failovers = []
+            for trial in range(arguments.trials):
+                clock = SimulatedClock(arguments.seed + trial)
+                failovers.append(clock.run(runners[mode](clock, cluster_size)))
+            milliseconds = [failover.seconds * 1000 for failover in failovers]
+            print(
+                f'{mode:>8} {cluster_size:>12} {percentile(milliseconds, 0.5):>9.1f} {percentile(milliseconds, 0.9):>9.1f} '
+                f'{percentile(milliseconds, 0.99):>9.1f} {max(milliseconds):>9.1f} '
+                f'{statistics.mean(failover.elections for failover in failovers):>10.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
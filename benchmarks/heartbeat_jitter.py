@@ -0,0 +1,75 @@
+import asyncio
+import statistics
+from datetime import timedelta
+
+from benchmarks.delayed_node import DelayedNode
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+CLUSTER_SIZES = (3, 5, 9, 17, 33)
+HEARTBEAT_PERIOD = timedelta(milliseconds=10)
+ROUND_TRIP_TIME = timedelta(milliseconds=1)
+SLOW_ROUND_TRIP_TIME = timedelta(milliseconds=200)
+DURATION = timedelta(seconds=2)
+
+
+class HeartbeatRecordingNode(DelayedNode[str]):
+    def __init__(self, node: Node[str], round_trip_time: timedelta) -> None:
+        super().__init__(node, round_trip_time)
+        self.arrivals: list[float] = []
+
+    async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+        response = await super().append_entries(request)
+        self.arrivals.append(asyncio.get_running_loop().time())
+        return response
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure_intervals(cluster_size: int) -> list[float]:
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=60), min_timeout=timedelta(seconds=60)),
+        heartbeat_period=HEARTBEAT_PERIOD,
+    )
+    leader: Node[str] = Node(lambda node: Leader(node))
+    healthy_followers = [
+        HeartbeatRecordingNode(Node(lambda node: Subject(node)), ROUND_TRIP_TIME)
+        for _ in range(cluster_size - 2)
+    ]
+    slow_follower: DelayedNode[str] = DelayedNode(Node(lambda node: Subject(node)), SLOW_ROUND_TRIP_TIME)
+    for follower in (*healthy_followers, slow_follower):
+        leader.register_node(follower)
+
+    leader_task = asyncio.create_task(leader.run(configuration))
+    await asyncio.sleep(DURATION.total_seconds())
+    leader_task.cancel()
+    leader.role.stop_running()
+    await asyncio.sleep(0)
+
+    return [
+        later - earlier
+        for follower in healthy_followers
+        for earlier, later in zip(follower.arrivals, follower.arrivals[1:])
+    ]
+
+
+async def main() -> None:
+    print(f'heartbeat period {HEARTBEAT_PERIOD.total_seconds() * 1000:.0f}ms, one follower with round trip time '
+          f'{SLOW_ROUND_TRIP_TIME.total_seconds() * 1000:.0f}ms, the rest {ROUND_TRIP_TIME.total_seconds() * 1000:.0f}ms')
+    print(f'{"cluster size":>12} {"mean (ms)":>10} {"stdev (ms)":>11} {"p99 (ms)":>9} {"max (ms)":>9}')
+    for cluster_size in CLUSTER_SIZES:
+        intervals = [interval * 1000 for interval in await measure_intervals(cluster_size)]
+        print(
+            f'{cluster_size:>12} {statistics.mean(intervals):>10.2f} {statistics.stdev(intervals):>11.2f} '
+            f'{percentile(intervals, 0.99):>9.2f} {max(intervals):>9.2f}'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
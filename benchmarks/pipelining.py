@@ -0,0 +1,55 @@
+import asyncio
+import time
+from datetime import timedelta
+
+from benchmarks.delayed_node import DelayedNode
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout, BatchConfiguration
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+PIPELINE_DEPTHS = (1, 2, 4, 8)
+MAX_BATCH_SIZE = 16
+FOLLOWERS = 2
+ROUND_TRIP_TIME = timedelta(milliseconds=20)
+DURATION = timedelta(seconds=3)
+MESSAGES = 50_000
+
+
+async def measure_throughput(pipeline_depth: int) -> float:
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=60), min_timeout=timedelta(seconds=60)),
+        heartbeat_period=timedelta(seconds=0.05),
+        batching=BatchConfiguration(max_batch_size=MAX_BATCH_SIZE, pipeline_depth=pipeline_depth),
+    )
+    leader: Node[str] = Node(lambda node: Leader(node))
+    followers: list[Node[str]] = [Node(lambda node: Subject(node)) for _ in range(FOLLOWERS)]
+    for follower in followers:
+        leader.register_node(DelayedNode(follower, ROUND_TRIP_TIME))
+    tasks = [asyncio.create_task(node.run(configuration)) for node in (leader, *followers)]
+
+    for index in range(MESSAGES):
+        await leader.send_message(f'message {index}')
+    start = time.perf_counter()
+    await asyncio.sleep(DURATION.total_seconds())
+    committed = (await leader.get_messages()).next_index
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    leader.role.stop_running()
+    await asyncio.sleep(0)
+    return committed / elapsed
+
+
+async def main() -> None:
+    print(f'{FOLLOWERS} followers, round trip time {ROUND_TRIP_TIME.total_seconds() * 1000:.1f}ms, '
+          f'max batch size {MAX_BATCH_SIZE}')
+    print(f'{"pipeline depth":>16} {"messages/sec":>14}')
+    for pipeline_depth in PIPELINE_DEPTHS:
+        throughput = await measure_throughput(pipeline_depth)
+        print(f'{pipeline_depth:>16} {throughput:>14.0f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
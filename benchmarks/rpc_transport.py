@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.node import Node
+from quorum.node.node_http_client import NodeHttpClient
+from quorum.node.node_http_server import NodeServer
+from quorum.node.node_interface import InternalNode
+from quorum.node.node_tcp_client import NodeTcpClient
+from quorum.node.node_tcp_server import NodeTcpServer
+from quorum.node.role.subject import Subject
+
+HTTP_PORT = 8095
+TCP_PORT = 8096
+CONCURRENCIES = (1, 32)
+CALLS = 5000
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(client: InternalNode[str], concurrency: int) -> tuple[float, float]:
+    latencies: list[float] = []
+
+    async def caller() -> None:
+        for _ in range(CALLS // concurrency):
+            start = time.perf_counter()
+            await client.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[caller() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, percentile(latencies, 0.99)
+
+
+async def main() -> None:
+    node: Node[str] = Node(lambda node: Subject(node))
+    servers: list[asyncio.Task[Any]] = [
+        asyncio.create_task(NodeServer(
+            node=node,
+            remote_nodes=tuple(),
+            cluster_configuration=ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=600), timedelta(seconds=600)),
+                heartbeat_period=timedelta(seconds=1),
+            ),
+        ).run(HTTP_PORT)),
+        asyncio.create_task(NodeTcpServer(node, JsonCodec()).run(TCP_PORT, host='localhost')),
+    ]
+    await asyncio.sleep(1)
+    logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
+
+    http_client = NodeHttpClient(f'http://localhost:{HTTP_PORT}')
+    tcp_client: NodeTcpClient[str] = NodeTcpClient('localhost', TCP_PORT, JsonCodec())
+    clients: dict[str, InternalNode[str]] = {'http+json': http_client, 'tcp frames': tcp_client}
+    print(f'{CALLS} heartbeat calls per run')
+    print(f'{"transport":>10} {"concurrency":>12} {"rpcs/sec":>9} {"p99 (ms)":>9}')
+    for name, client in clients.items():
+        for concurrency in CONCURRENCIES:
+            rpcs_per_second, p99 = await measure(client, concurrency)
+            print(f'{name:>10} {concurrency:>12} {rpcs_per_second:>9.0f} {p99 * 1000:>9.2f}')
+
+    await http_client.close()
+    await tcp_client.close()
+    await asyncio.sleep(0.1)
+    for server in servers:
+        server.cancel()
+    await asyncio.gather(*servers, return_exceptions=True)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
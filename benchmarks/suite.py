@@ -0,0 +1,204 @@
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from quorum.client.quorum_client import QuorumClient
+from quorum.cluster.cluster import Cluster
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.message_box.commit_outcome import CommitOutcome, Committed
+from quorum.node.node import Node
+from quorum.node.node_http_client import NodeHttpClient
+from quorum.node.node_http_server import NodeServer
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+FIRST_PORT = 8100
+
+Send = Callable[[str], Awaitable[CommitOutcome]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    transport: str
+    cluster_size: int
+    message_size: int
+    concurrency: int
+    messages: int
+
+
+@dataclass(frozen=True)
+class Result:
+    committed: int
+    failed: int
+    seconds: float
+    messages_per_second: float
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--transports', nargs='+', choices=('in-process', 'http'), default=['in-process', 'http'])
+    parser.add_argument('--cluster-sizes', nargs='+', type=int, default=[1, 3, 5, 7])
+    parser.add_argument('--message-sizes', nargs='+', type=int, default=[16, 1024])
+    parser.add_argument('--concurrencies', nargs='+', type=int, default=[1, 64])
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--http-messages', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None)
+    return parser.parse_args()
+
+
+def get_configuration() -> ClusterConfiguration:
+    return ClusterConfiguration(
+        election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=600), min_timeout=timedelta(seconds=600)),
+        heartbeat_period=timedelta(seconds=0.05),
+    )
+
+
+def create_nodes(cluster_size: int, addresses: list[str | None]) -> list[Node[str]]:
+    nodes: list[Node[str]] = [Node(lambda node: Leader(node), address=addresses[0])]
+    nodes += [Node(lambda node: Subject(node), address=address) for address in addresses[1:cluster_size]]
+    return nodes
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else float('nan')
+
+
+async def generate_load(send: Send, scenario: Scenario, seed: int) -> Result:
+    payload = ''.join(random.Random(seed).choices(string.ascii_letters, k=scenario.message_size))
+    latencies: list[float] = []
+    failed = 0
+
+    async def producer(producer_index: int) -> None:
+        nonlocal failed
+        for message_index in range(producer_index, scenario.messages, scenario.concurrency):
+            start = time.perf_counter()
+            outcome = await send(f'{message_index}:{payload}'[:scenario.message_size])
+            if isinstance(outcome, Committed):
+                latencies.append(time.perf_counter() - start)
+            else:
+                failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[producer(index) for index in range(scenario.concurrency)])
+    seconds = time.perf_counter() - start
+    return Result(
+        committed=len(latencies),
+        failed=failed,
+        seconds=seconds,
+        messages_per_second=len(latencies) / seconds,
+        p50_ms=percentile(latencies, 0.5) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        p999_ms=percentile(latencies, 0.999) * 1000,
+    )
+
+
+async def run_in_process(scenario: Scenario, seed: int) -> Result:
+    nodes = create_nodes(scenario.cluster_size, [None] * scenario.cluster_size)
+    cluster = Cluster[str](set(nodes), get_configuration())
+    cluster_task = asyncio.create_task(cluster.run())
+    leader = nodes[0]
+
+    async def send(message: str) -> CommitOutcome:
+        return await (await leader.submit_message(message))
+
+    try:
+        return await generate_load(send, scenario, seed)
+    finally:
+        cluster_task.cancel()
+        await asyncio.gather(cluster_task, return_exceptions=True)
+        nodes[0].role.stop_running()
+
+
+async def run_over_http(scenario: Scenario, seed: int) -> Result:
+    urls = [f'http://localhost:{FIRST_PORT + index}' for index in range(scenario.cluster_size)]
+    nodes = create_nodes(scenario.cluster_size, list(urls))
+    remote_clients = [NodeHttpClient(url) for url in urls]
+    servers = [
+        asyncio.create_task(NodeServer(
+            node=node,
+            remote_nodes=[client for client in remote_clients if client is not remote_clients[index]],
+            cluster_configuration=get_configuration(),
+        ).run(FIRST_PORT + index))
+        for index, node in enumerate(nodes)
+    ]
+    await asyncio.sleep(1)
+    logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
+    client = QuorumClient(urls)
+
+    try:
+        return await generate_load(client.send_message, scenario, seed)
+    finally:
+        await client.close()
+        for server in servers:
+            server.cancel()
+        await asyncio.gather(*servers, return_exceptions=True)
+        nodes[0].role.stop_running()
+        for remote_client in remote_clients:
+            await remote_client.close()
+
+
+def describe_environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+    }
+
+
+async def main() -> None:
+    arguments = parse_arguments()
+    logging.getLogger().setLevel(logging.WARNING)
+    runners = {'in-process': run_in_process, 'http': run_over_http}
+    scenarios = [
+        Scenario(
+            transport=transport,
+            cluster_size=cluster_size,
+            message_size=message_size,
+            concurrency=concurrency,
+            messages=arguments.http_messages if transport == 'http' else arguments.messages,
+        )
+        for transport in arguments.transports
+        for cluster_size in arguments.cluster_sizes
+        for message_size in arguments.message_sizes
+        for concurrency in arguments.concurrencies
+    ]
+    results = []
+    print(f'{"transport":>10} {"nodes":>5} {"bytes":>6} {"concurrency":>11} {"msgs/sec":>9} '
+          f'{"p50 (ms)":>9} {"p99 (ms)":>9} {"p999 (ms)":>10}', file=sys.stderr)
+    for scenario in scenarios:
+        result = await runners[scenario.transport](scenario, arguments.seed)
+        results.append({**asdict(scenario), **asdict(result)})
+        print(f'{scenario.transport:>10} {scenario.cluster_size:>5} {scenario.message_size:>6} {scenario.concurrency:>11} '
+              f'{result.messages_per_second:>9.0f} {result.p50_ms:>9.2f} {result.p99_ms:>9.2f} {result.p999_ms:>10.2f}',
+              file=sys.stderr)
+
+    report = json.dumps({'environment': describe_environment(), 'seed': arguments.seed, 'results': results}, indent=2)
+    if arguments.output is None:
+        print(report)
+    else:
+        arguments.output.write_text(report + '\n')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+import asyncio
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.write_ahead_log import WriteAheadLog, Durability, FsyncPerBatch, FsyncInterval, NoFsync
+
+DURABILITIES: tuple[Durability, ...] = (FsyncPerBatch(), FsyncInterval(timedelta(milliseconds=10)), NoFsync())
+CONCURRENT_WRITERS = 32
+APPENDS_PER_WRITER = 200
+BATCH_SIZE = 16
+MESSAGE = 'x' * 100
+
+
+async def measure(durability: Durability, directory: Path) -> tuple[float, int, float]:
+    write_ahead_log = WriteAheadLog[str](directory=directory, codec=JsonCodec(), durability=durability)
+    write_ahead_log.recover()
+
+    async def writer() -> None:
+        for _ in range(APPENDS_PER_WRITER):
+            await write_ahead_log.append((MESSAGE,) * BATCH_SIZE)
+
+    with mock.patch('os.fsync', wraps=os.fsync) as fsync:
+        start = time.perf_counter()
+        await asyncio.gather(*[writer() for _ in range(CONCURRENT_WRITERS)])
+        await write_ahead_log.close()
+        elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    recovered = WriteAheadLog[str](directory=directory, codec=JsonCodec()).recover()
+    recovery_time = time.perf_counter() - start
+    assert len(recovered) == CONCURRENT_WRITERS * APPENDS_PER_WRITER * BATCH_SIZE
+
+    return len(recovered) / elapsed, fsync.call_count, recovery_time
+
+
+async def main() -> None:
+    messages = CONCURRENT_WRITERS * APPENDS_PER_WRITER * BATCH_SIZE
+    print(f'{CONCURRENT_WRITERS} concurrent writers, {messages} messages of {len(MESSAGE)} bytes in batches of {BATCH_SIZE}')
+    print(f'{"durability":>14} {"messages/sec":>13} {"fsyncs":>7} {"recovery (ms)":>14}')
+    for durability in DURABILITIES:
+        with tempfile.TemporaryDirectory() as directory:
+            throughput, fsyncs, recovery_time = await measure(durability, Path(directory))
+        print(f'{type(durability).__name__:>14} {throughput:>13.0f} {fsyncs:>7} {recovery_time * 1000:>14.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Sequence
+
+import aiohttp
+
+from quorum.node.message_box.commit_outcome import CommitOutcome, CommitFailed, CommitUnknown, Committed
+from quorum.node.message_box.messages_page import MessagesPage
+
+_NOT_LANDED_ERRORS = frozenset({'leadership transfer in progress', 'no known leader'})
+
+
+@dataclass(frozen=True)
+class RetryConfiguration:
+    attempts: int = 10
+    min_backoff: timedelta = timedelta(seconds=0.01)
+    max_backoff: timedelta = timedelta(seconds=1)
+
+
+@dataclass(frozen=True)
+class NoLeaderAvailable:
+    pass
+
+
+class QuorumClient:
+    def __init__(
+        self,
+        urls: Sequence[str],
+        retry: RetryConfiguration = RetryConfiguration(),
+        max_connections: int = 100,
+        request_timeout: timedelta = timedelta(seconds=5),
+        seed: int | None = None,
+    ) -> None:
+        self._urls = list(urls)
+        self._retry = retry
+        self._client_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_connections),
+            timeout=aiohttp.ClientTimeout(total=request_timeout.total_seconds()),
+        )
+        self._random = random.Random(seed)
+        self._leader: str | None = None
+        self._discovery: asyncio.Task[str | None] | None = None
+
+    @property
+    def leader(self) -> str | None:
+        return self._leader
+
+    async def send_message(self, message: str) -> CommitOutcome:
+        try:
+            response = await self._call_leader(
+                'POST',
+                '/send_message',
+                idempotent=False,
+                params={'wait_for_commit': 'true'},
+                json={'message': message},
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return CommitUnknown()
+        if response is None:
+            return CommitFailed()
+        status, response_data = response
+        if status == 200:
+            return Committed(index=int(response_data['index']))
+        if status == 503 and response_data.get('error') == 'message was not committed':
+            return CommitFailed()
+        return CommitUnknown()
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[str] | NoLeaderAvailable:
+        params = {'since_index': str(since_index), 'linearizable': 'true'}
+        if limit is not None:
+            params['limit'] = str(limit)
+        response = await self._call_leader('GET', '/get_messages', params=params)
+        if response is None:
+            return NoLeaderAvailable()
+        _, response_data = response
+        return MessagesPage(messages=tuple(response_data['messages']), next_index=int(response_data['next_index']))
+
+    async def close(self) -> None:
+        await self._client_session.close()
+
+    async def _call_leader(self, method: str, path: str, idempotent: bool = True, **kwargs: Any) -> tuple[int, Any] | None:
+        backoff = self._retry.min_backoff.total_seconds()
+        for _ in range(self._retry.attempts):
+            leader = await self._find_leader()
+            if leader is not None:
+                try:
+                    async with self._client_session.request(method, f'{leader}{path}', allow_redirects=False, **kwargs) as response:
+                        status, response_data = response.status, await response.json()
+                except aiohttp.ClientConnectorError:
+                    self._forget_leader(leader)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    self._forget_leader(leader)
+                    if not idempotent:
+                        raise
+                else:
+                    if status == 200:
+                        return status, response_data
+                    if status == 307:
+                        self._leader = response_data['leader']
+                        continue
+                    if status != 429:
+                        if not idempotent and not _did_not_land(status, response_data):
+                            return status, response_data
+                        self._forget_leader(leader)
+            await asyncio.sleep(self._random.uniform(0, backoff))
+            backoff = min(backoff * 2, self._retry.max_backoff.total_seconds())
+        return None
+
+    def _forget_leader(self, leader: str) -> None:
+        if self._leader == leader:
+            self._leader = None
+
+    async def _find_leader(self) -> str | None:
+        if self._leader is not None:
+            return self._leader
+        if self._discovery is None or self._discovery.done():
+            self._discovery = asyncio.create_task(self._discover_leader())
+        return await asyncio.shield(self._discovery)
+
+    async def _discover_leader(self) -> str | None:
+        answers = await asyncio.gather(*[self._ask_for_leader(url) for url in self._urls])
+        confirmed = [url for url, answer in zip(self._urls, answers) if answer == url]
+        hinted = [answer for answer in answers if answer is not None]
+        if confirmed:
+            self._leader = confirmed[0]
+        elif hinted:
+            self._leader = hinted[0]
+        return self._leader
+
+    async def _ask_for_leader(self, url: str) -> str | None:
+        try:
+            async with self._client_session.get(f'{url}/leader') as response:
+                response_data = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        if response_data['is_leader']:
+            return url
+        return None if response_data['leader'] is None else str(response_data['leader'])
+
+
+def _did_not_land(status: int, response_data: Any) -> bool:
+    return status == 503 and isinstance(response_data, dict) and response_data.get('error') in _NOT_LANDED_ERRORS
@@ -1,11 +1,13 @@
 import asyncio
+import itertools
 import logging
 from dataclasses import dataclass
-from typing import Generic
+from typing import Generic, Sequence
 
 from quorum.cluster.message_type import MessageType
 from quorum.node.role.leader import Leader
 from quorum.node.node import Node
+from quorum.node.read_index import ReadIndexUnavailable
 from tests.downable_node import DownableNode
 from quorum.cluster.configuration import ClusterConfiguration
 
@@ -20,11 +22,17 @@ class Cluster(Generic[MessageType]):
         self,
         nodes: set[Node[MessageType]] | set[DownableNode[MessageType]],
         cluster_configuration: ClusterConfiguration,
+        check_single_leader: bool = False,
     ) -> None:
         self._set_up_logger()
 
         self._configuration = cluster_configuration
         self._nodes: list[Node[MessageType] | DownableNode[MessageType]] = list(nodes)
+        self._read_rotation = itertools.count()
+        self._check_single_leader = check_single_leader
+        self._leader: Node[MessageType] | DownableNode[MessageType] | NoLeaderInCluster | None = None
+        for node in self._nodes:
+            node.on_role_change(self._forget_leader)
 
         self._let_nodes_know_of_each_others_existence()
 
@@ -47,13 +55,23 @@ class Cluster(Generic[MessageType]):
             return
         await maybe_leader.send_message(message)
 
-    async def get_messages(self) -> tuple[MessageType, ...] | NoLeaderInCluster:
+    async def get_messages(self) -> Sequence[MessageType] | NoLeaderInCluster:
+        first = next(self._read_rotation) % len(self._nodes)
+        for node in self._nodes[first:] + self._nodes[:first]:
+            maybe_page = await node.read_messages()
+            if not isinstance(maybe_page, ReadIndexUnavailable):
+                return maybe_page.messages
         maybe_leader = self.take_me_to_a_leader()
         if isinstance(maybe_leader, NoLeaderInCluster):
             return NoLeaderInCluster()
-        return await maybe_leader.get_messages()
+        return (await maybe_leader.get_messages()).messages
 
     def take_me_to_a_leader(self) -> Node[MessageType] | DownableNode[MessageType] | NoLeaderInCluster:
+        if self._leader is None or self._check_single_leader:
+            self._leader = self._find_leader()
+        return self._leader
+
+    def _find_leader(self) -> Node[MessageType] | DownableNode[MessageType] | NoLeaderInCluster:
         current_leaders = {node for node in self._nodes if isinstance(node.role, Leader)}
         if len(current_leaders) == 0:
             return NoLeaderInCluster()
@@ -61,6 +79,9 @@ class Cluster(Generic[MessageType]):
             raise TooManyLeaders
         return next(iter(current_leaders))
 
+    def _forget_leader(self) -> None:
+        self._leader = None
+
     async def run(self) -> None:
         await asyncio.gather(*[node.run(self._configuration) for node in self._nodes])
 
@@ -1,5 +1,5 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from itertools import count
 from random import random
@@ -17,12 +17,53 @@ class ElectionTimeout:
         self._max_timeout = max_timeout
         self._randomization = iter(randomization)
 
+    @property
+    def min_timeout(self) -> timedelta:
+        return self._min_timeout
+
+    def draw(self) -> timedelta:
+        return self._min_timeout + next(self._randomization) * (self._max_timeout - self._min_timeout)
+
     async def wait(self) -> None:
-        boh = self._min_timeout + next(self._randomization) * (self._max_timeout - self._min_timeout)
-        await asyncio.sleep(boh.total_seconds())
+        await asyncio.sleep(self.draw().total_seconds())
+
+    def backoff(self, failed_elections: int) -> timedelta:
+        doublings = min(failed_elections, 4) - 1
+        return self._max_timeout * next(self._randomization) * float(2 ** doublings)
+
+
+@dataclass(frozen=True)
+class BatchConfiguration:
+    max_batch_size: int = 256
+    max_linger: timedelta = timedelta(seconds=0)
+    pipeline_depth: int = 1
+
+
+@dataclass(frozen=True)
+class ReplicationConfiguration:
+    max_batch_size: int = 1024
+    max_in_flight: int = 4
+    request_timeout: timedelta = timedelta(seconds=0.5)
+    commit_timeout: timedelta = timedelta(seconds=0.5)
+    min_backoff: timedelta = timedelta(seconds=0.01)
+    max_backoff: timedelta = timedelta(seconds=1)
+
+
+@dataclass(frozen=True)
+class LeaseConfiguration:
+    enabled: bool = False
+    clock_drift_bound: float = 0.1
 
 
 @dataclass(frozen=True)
 class ClusterConfiguration:
     election_timeout: ElectionTimeout
     heartbeat_period: timedelta
+    batching: BatchConfiguration = field(default_factory=BatchConfiguration)
+    replication: ReplicationConfiguration = field(default_factory=ReplicationConfiguration)
+    leases: LeaseConfiguration = field(default_factory=LeaseConfiguration)
+
+    def lease_duration(self) -> timedelta | None:
+        if not self.leases.enabled:
+            return None
+        return self.election_timeout.min_timeout * (1 - self.leases.clock_drift_bound)
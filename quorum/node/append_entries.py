@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Generic
+
+from quorum.cluster.message_type import MessageType
+
+
+@dataclass(frozen=True)
+class AppendEntriesRequest(Generic[MessageType]):
+    prev_index: int
+    entries: tuple[MessageType, ...]
+    leader_commit: int
+    leader_address: str | None = None
+    term: int = 0
+    prev_term: int = 0
+    entry_terms: tuple[int, ...] | None = None
+
+    @property
+    def terms(self) -> tuple[int, ...]:
+        return self.entry_terms if self.entry_terms is not None else (self.term,) * len(self.entries)
+
+
+@dataclass(frozen=True)
+class AppendEntriesResponse:
+    success: bool
+    match_index: int
+    term: int = 0
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from typing import Callable, Generic, Mapping, Sequence
+
+from quorum.cluster.configuration import ClusterConfiguration
+from quorum.cluster.message_type import MessageType
+from quorum.node.message_box.commit_outcome import CommitHandle
+from quorum.node.node import Node, node_id_for
+from quorum.node.node_interface import GroupHost
+from quorum.node.role.leader import Leader
+
+
+class KeyRouter:
+    def __init__(self, group_ids: Sequence[int]) -> None:
+        if len(group_ids) == 0:
+            raise ValueError('at least one group is needed to route keys')
+        self._group_ids = tuple(group_ids)
+
+    def group_for(self, key: str) -> int:
+        return max(self._group_ids, key=lambda group_id: self._weight(group_id, key))
+
+    @staticmethod
+    def _weight(group_id: int, key: str) -> int:
+        digest = hashlib.blake2b(f'{group_id}:{key}'.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big')
+
+
+class ConsensusGroups(GroupHost[MessageType], Generic[MessageType]):
+    def __init__(
+        self,
+        group_ids: Sequence[int],
+        create_node: Callable[[int, int], Node[MessageType]],
+        address: str | None = None,
+    ) -> None:
+        self._nodes = {group_id: create_node(group_id, node_id_for(address, group_id)) for group_id in group_ids}
+        self._router = KeyRouter(group_ids)
+
+    @property
+    def nodes(self) -> Mapping[int, Node[MessageType]]:
+        return self._nodes
+
+    def group(self, group_id: int) -> Node[MessageType]:
+        if group_id not in self._nodes:
+            raise UnknownGroup(group_id)
+        return self._nodes[group_id]
+
+    def group_for(self, key: str) -> int:
+        return self._router.group_for(key)
+
+    def register_host(self, host: GroupHost[MessageType]) -> None:
+        for group_id, node in self._nodes.items():
+            node.register_node(host.group(group_id))
+
+    def led_groups(self) -> list[int]:
+        return [group_id for group_id, node in self._nodes.items() if isinstance(node.role, Leader)]
+
+    def leads(self, key: str) -> bool:
+        return isinstance(self.group(self.group_for(key)).role, Leader)
+
+    async def submit_message(self, key: str, message: MessageType) -> CommitHandle:
+        group_id = self.group_for(key)
+        node = self.group(group_id)
+        if not isinstance(node.role, Leader):
+            raise NotGroupLeader(group_id, node.leader_address)
+        return await node.submit_message(message)
+
+    async def run(self, cluster_configuration: ClusterConfiguration) -> None:
+        await asyncio.gather(*(node.run(cluster_configuration) for node in self._nodes.values()))
+
+
+class UnknownGroup(Exception):
+    pass
+
+
+class NotGroupLeader(Exception):
+    pass
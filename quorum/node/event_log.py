@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any
+
+
+@dataclass(frozen=True)
+class NodeRegistered:
+    peer: str
+
+    def __str__(self) -> str:
+        return f'registering {self.peer}'
+
+
+@dataclass(frozen=True)
+class RoleChanged:
+    old_role: str
+    new_role: str
+
+    def __str__(self) -> str:
+        return f'changing role from {self.old_role} to {self.new_role}'
+
+
+@dataclass(frozen=True)
+class WentDown:
+    def __str__(self) -> str:
+        return 'going down'
+
+
+@dataclass(frozen=True)
+class CameBackUp:
+    def __str__(self) -> str:
+        return 'going back up'
+
+
+@dataclass(frozen=True)
+class Voted:
+    vote: bool
+
+    def __str__(self) -> str:
+        return f'voting {self.vote}'
+
+
+@dataclass(frozen=True)
+class TermChanged:
+    term: int
+
+    def __str__(self) -> str:
+        return f'entering term {self.term}'
+
+
+@dataclass(frozen=True)
+class RunIterationStarted:
+    def __str__(self) -> str:
+        return 'starting new run iteration'
+
+
+@dataclass(frozen=True)
+class EntriesReceived:
+    prev_index: int
+    entries: int
+
+    def __str__(self) -> str:
+        return f'receiving {self.entries} entries after {self.prev_index}'
+
+
+Event = NodeRegistered | RoleChanged | WentDown | CameBackUp | Voted | TermChanged | RunIterationStarted | EntriesReceived
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    at: float
+    node_id: int
+    role: str
+    event: Event
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'at': self.at,
+            'node_id': self.node_id,
+            'role': self.role,
+            'event': type(self.event).__name__,
+            **asdict(self.event),
+        }
+
+
+class EventLog:
+    def __init__(self, capacity: int = 0, logger: logging.Logger | None = None) -> None:
+        self._events: deque[RecordedEvent] = deque(maxlen=capacity)
+        self._capacity = capacity
+        self._logger = logger if logger is not None else logging.getLogger()
+
+    @property
+    def enabled(self) -> bool:
+        return self._capacity > 0 or self._logger.isEnabledFor(logging.DEBUG)
+
+    def record(self, node_id: int, role: object, event: Event) -> None:
+        if self._capacity > 0:
+            self._events.append(RecordedEvent(at=time.time(), node_id=node_id, role=str(role), event=event))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug('%s %s: %s', role, node_id, event)
+
+    def recent(self, limit: int | None = None) -> list[RecordedEvent]:
+        events = list(self._events)
+        return events if limit is None else events[max(0, len(events) - limit):]
+
+    def dump(self, limit: int | None = None) -> list[dict[str, Any]]:
+        return [event.as_dict() for event in self.recent(limit)]
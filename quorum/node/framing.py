@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+FRAME_HEADER = struct.Struct('>IIBI')
+_COUNT = struct.Struct('>I')
+_INDEX = struct.Struct('>Q')
+_LIMIT = struct.Struct('>q')
+_APPEND_ENTRIES_REQUEST = struct.Struct('>QQQQ')
+_APPEND_ENTRIES_RESPONSE = struct.Struct('>?QQ')
+_VOTE_REQUEST = struct.Struct('>QqQQ??')
+_VOTE_RESPONSE = struct.Struct('>Q?')
+
+APPEND_ENTRIES = 1
+REQUEST_VOTE = 2
+SEND_MESSAGE = 3
+GET_MESSAGES = 5
+READ_INDEX = 6
+TIMEOUT_NOW = 7
+
+OK = 0
+ERROR = 1
+NOT_LEADER = 2
+
+
+@dataclass(frozen=True)
+class Frame:
+    correlation_id: int
+    kind: int
+    payload: bytes
+    group_id: int = 0
+
+
+def encode_frame(frame: Frame) -> bytes:
+    return FRAME_HEADER.pack(len(frame.payload), frame.correlation_id, frame.kind, frame.group_id) + frame.payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Frame:
+    length, correlation_id, kind, group_id = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    return Frame(correlation_id=correlation_id, kind=kind, payload=await reader.readexactly(length), group_id=group_id)
+
+
+def encode_records(records: Iterable[bytes]) -> bytes:
+    records = list(records)
+    return _COUNT.pack(len(records)) + b''.join(_COUNT.pack(len(record)) + record for record in records)
+
+
+def decode_records(payload: bytes, offset: int = 0) -> list[bytes]:
+    (count,) = _COUNT.unpack_from(payload, offset)
+    offset += _COUNT.size
+    records = []
+    for _ in range(count):
+        (length,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        records.append(payload[offset:offset + length])
+        offset += length
+    return records
+
+
+def encode_get_messages_request(since_index: int, limit: int | None) -> bytes:
+    return _INDEX.pack(since_index) + _LIMIT.pack(-1 if limit is None else limit)
+
+
+def decode_get_messages_request(payload: bytes) -> tuple[int, int | None]:
+    (since_index,) = _INDEX.unpack_from(payload, 0)
+    (limit,) = _LIMIT.unpack_from(payload, _INDEX.size)
+    return since_index, None if limit < 0 else limit
+
+
+def encode_messages_page(next_index: int, records: Iterable[bytes]) -> bytes:
+    return _INDEX.pack(next_index) + encode_records(records)
+
+
+def decode_messages_page(payload: bytes) -> tuple[int, list[bytes]]:
+    (next_index,) = _INDEX.unpack_from(payload, 0)
+    return next_index, decode_records(payload, _INDEX.size)
+
+
+def encode_append_entries_request(
+    prev_index: int,
+    leader_commit: int,
+    records: Iterable[bytes],
+    leader_address: str | None = None,
+    term: int = 0,
+    prev_term: int = 0,
+    entry_terms: Sequence[int] = (),
+    no_ops: Sequence[bool] = (),
+) -> bytes:
+    no_ops = no_ops or (False,) * len(entry_terms)
+    address = (leader_address or '').encode()
+    return (
+        _APPEND_ENTRIES_REQUEST.pack(prev_index, leader_commit, term, prev_term)
+        + _COUNT.pack(len(address))
+        + address
+        + _COUNT.pack(len(entry_terms))
+        + struct.pack(f'>{len(entry_terms)}Q', *entry_terms)
+        + struct.pack(f'>{len(no_ops)}?', *no_ops)
+        + encode_records(records)
+    )
+
+
+def decode_append_entries_request(
+    payload: bytes,
+) -> tuple[int, int, list[bytes], str | None, int, int, tuple[int, ...], tuple[bool, ...]]:
+    prev_index, leader_commit, term, prev_term = _APPEND_ENTRIES_REQUEST.unpack_from(payload, 0)
+    offset = _APPEND_ENTRIES_REQUEST.size
+    (address_length,) = _COUNT.unpack_from(payload, offset)
+    offset += _COUNT.size
+    leader_address = payload[offset:offset + address_length].decode() or None
+    offset += address_length
+    (term_count,) = _COUNT.unpack_from(payload, offset)
+    offset += _COUNT.size
+    entry_terms = struct.unpack_from(f'>{term_count}Q', payload, offset)
+    offset += term_count * _INDEX.size
+    no_ops = struct.unpack_from(f'>{term_count}?', payload, offset)
+    offset += term_count
+    records = decode_records(payload, offset)
+    return prev_index, leader_commit, records, leader_address, term, prev_term, entry_terms, no_ops
+
+
+def encode_append_entries_response(success: bool, match_index: int, term: int = 0) -> bytes:
+    return _APPEND_ENTRIES_RESPONSE.pack(success, match_index, term)
+
+
+def decode_append_entries_response(payload: bytes) -> tuple[bool, int, int]:
+    success, match_index, term = _APPEND_ENTRIES_RESPONSE.unpack(payload)
+    return success, match_index, term
+
+
+def encode_vote_request(
+    term: int,
+    candidate_id: int,
+    last_log_index: int,
+    last_log_term: int,
+    pre_vote: bool,
+    leadership_transfer: bool = False,
+) -> bytes:
+    return _VOTE_REQUEST.pack(term, candidate_id, last_log_index, last_log_term, pre_vote, leadership_transfer)
+
+
+def decode_vote_request(payload: bytes) -> tuple[int, int, int, int, bool, bool]:
+    term, candidate_id, last_log_index, last_log_term, pre_vote, leadership_transfer = _VOTE_REQUEST.unpack(payload)
+    return term, candidate_id, last_log_index, last_log_term, pre_vote, leadership_transfer
+
+
+def encode_vote_response(term: int, granted: bool) -> bytes:
+    return _VOTE_RESPONSE.pack(term, granted)
+
+
+def decode_vote_response(payload: bytes) -> tuple[int, bool]:
+    term, granted = _VOTE_RESPONSE.unpack(payload)
+    return term, granted
+
+
+def encode_timeout_now(term: int) -> bytes:
+    return _INDEX.pack(term)
+
+
+def decode_timeout_now(payload: bytes) -> int:
+    (term,) = _INDEX.unpack(payload)
+    return int(term)
+
+
+def encode_read_index(read_index: int | None) -> bytes:
+    return _LIMIT.pack(-1 if read_index is None else read_index)
+
+
+def decode_read_index(payload: bytes) -> int | None:
+    (read_index,) = _LIMIT.unpack(payload)
+    return None if read_index < 0 else read_index
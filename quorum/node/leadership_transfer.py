@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LeadershipTransferred:
+    leader: str
+
+
+@dataclass(frozen=True)
+class LeadershipTransferFailed:
+    reason: str
+
+
+LeadershipTransferOutcome = LeadershipTransferred | LeadershipTransferFailed
+
+
+class LeadershipTransferInProgress(Exception):
+    pass
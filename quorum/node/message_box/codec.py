@@ -0,0 +1,23 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Generic, Any
+
+from quorum.cluster.message_type import MessageType
+
+
+class Codec(ABC, Generic[MessageType]):
+    @abstractmethod
+    def encode(self, message: MessageType) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> MessageType:
+        pass
+
+
+class JsonCodec(Codec[Any]):
+    def encode(self, message: Any) -> bytes:
+        return json.dumps(message, separators=(',', ':')).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
@@ -0,0 +1,21 @@
+import asyncio
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Committed:
+    index: int
+
+
+@dataclass(frozen=True)
+class CommitFailed:
+    pass
+
+
+@dataclass(frozen=True)
+class CommitUnknown:
+    pass
+
+
+CommitOutcome = Committed | CommitFailed | CommitUnknown
+CommitHandle = asyncio.Future[CommitOutcome]
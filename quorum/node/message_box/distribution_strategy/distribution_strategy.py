@@ -8,14 +8,25 @@ from typing import Generic
 from quorum.cluster.message_type import MessageType
 
 if typing.TYPE_CHECKING:
+    from quorum.cluster.configuration import ReplicationConfiguration
+    from quorum.node.message_box.message_box import MessageBox
     from quorum.node.node_interface import InternalNode
 
 
 class DistributionStrategy(ABC, Generic[MessageType]):
     @abstractmethod
-    async def distribute(self, message: MessageType, other_nodes: set[InternalNode[MessageType]]) -> DistributionSuccessful | DistributionFailed:
+    async def distribute(
+        self,
+        message_box: MessageBox[MessageType],
+        up_to_index: int,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionSuccessful | DistributionFailed:
         pass
 
+    def accepts_messages(self) -> bool:
+        return True
+
 
 @dataclass(frozen=True)
 class DistributionSuccessful:
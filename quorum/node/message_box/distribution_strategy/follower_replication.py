@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+from typing import Callable, Generic
+
+from quorum.cluster.configuration import ReplicationConfiguration
+from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.metrics import Histogram, Counter
+from quorum.node.node_interface import InternalNode
+from quorum.node.tracing import Tracer
+
+if typing.TYPE_CHECKING:
+    from quorum.node.message_box.message_box import MessageBox
+
+
+class FollowerReplication(Generic[MessageType]):
+    def __init__(
+        self,
+        node: InternalNode[MessageType],
+        message_box: MessageBox[MessageType],
+        configuration: ReplicationConfiguration,
+        on_match_advanced: Callable[[], None],
+        on_response: Callable[[], None],
+        leader_address: str | None = None,
+        rpc_latency: Histogram | None = None,
+        rpc_failures: Counter | None = None,
+        tracer: Tracer[MessageType] | None = None,
+        term: int = 0,
+        on_higher_term: Callable[[int], None] | None = None,
+    ) -> None:
+        self._node = node
+        self._message_box = message_box
+        self._configuration = configuration
+        self._on_match_advanced = on_match_advanced
+        self._on_response = on_response
+        self._leader_address = leader_address
+        self._rpc_latency = rpc_latency if rpc_latency is not None else Histogram()
+        self._rpc_failures = rpc_failures if rpc_failures is not None else Counter()
+        self._tracer: Tracer[MessageType] = tracer if tracer is not None else Tracer()
+        self._term = term
+        self._on_higher_term = on_higher_term
+        self._peer = node.metrics_label()
+        self.next_index = len(message_box.log)
+        self.match_index = 0
+        self.last_contact = float('-inf')
+        self.last_sent = float('-inf')
+        self.last_acknowledged = float('-inf')
+        self.last_failed = float('-inf')
+        self._in_flight = 0
+        self._heartbeat_due = True
+        self._backoff = 0.0
+        self._backing_off_until = float('-inf')
+        self._wake_up = asyncio.Event()
+        self._responses: set[asyncio.Task[None]] = set()
+
+    def failed_since(self, moment: float) -> bool:
+        return self.last_failed >= moment or asyncio.get_running_loop().time() < self._backing_off_until
+
+    def notify(self) -> None:
+        self._wake_up.set()
+
+    def request_heartbeat(self) -> None:
+        self._heartbeat_due = True
+        self._wake_up.set()
+
+    async def run(self) -> None:
+        try:
+            while True:
+                await self._wake_up.wait()
+                self._wake_up.clear()
+                while self._can_send():
+                    self._send_next_batch()
+        finally:
+            for response in self._responses:
+                response.cancel()
+
+    def _can_send(self) -> bool:
+        if self._in_flight >= self._configuration.max_in_flight:
+            return False
+        if asyncio.get_running_loop().time() < self._backing_off_until:
+            return False
+        return self._heartbeat_due or self.next_index < len(self._message_box.log)
+
+    def _send_next_batch(self) -> None:
+        log = self._message_box.log
+        stop = self.next_index + self._configuration.max_batch_size
+        entries = tuple(log.slice(self.next_index, stop))
+        request = AppendEntriesRequest(
+            prev_index=self.next_index,
+            entries=entries,
+            leader_commit=self._message_box.commit_index,
+            leader_address=self._leader_address,
+            term=self._term,
+            prev_term=log.term(self.next_index - 1) if self.next_index > 0 else 0,
+            entry_terms=log.terms(self.next_index, stop),
+        )
+        self.next_index += len(entries)
+        self._in_flight += 1
+        self._heartbeat_due = False
+        self.last_sent = asyncio.get_running_loop().time()
+        response = asyncio.create_task(self._send(request))
+        self._responses.add(response)
+        response.add_done_callback(self._responses.discard)
+
+    async def _send(self, request: AppendEntriesRequest[MessageType]) -> None:
+        sent_at = asyncio.get_running_loop().time()
+        self._tracer.append_entries_sent(self._peer, request)
+        try:
+            response = await asyncio.wait_for(
+                self._node.append_entries(request),
+                timeout=self._configuration.request_timeout.total_seconds(),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._rpc_failures.increment()
+            self._tracer.append_entries_answered(self._peer, request, None)
+            self._back_off(sent_at)
+        else:
+            self._rpc_latency.observe(asyncio.get_running_loop().time() - sent_at)
+            self._tracer.append_entries_answered(self._peer, request, response)
+            self._handle_response(request, response, sent_at)
+        finally:
+            self._in_flight -= 1
+            self._wake_up.set()
+
+    def _handle_response(
+        self,
+        request: AppendEntriesRequest[MessageType],
+        response: AppendEntriesResponse,
+        sent_at: float,
+    ) -> None:
+        if response.term > self._term:
+            if self._on_higher_term is not None:
+                self._on_higher_term(response.term)
+            self._back_off(sent_at)
+        elif response.success:
+            self.last_contact = asyncio.get_running_loop().time()
+            self.last_acknowledged = max(self.last_acknowledged, sent_at)
+            self._backoff = 0.0
+            self._on_response()
+            if response.match_index > self.match_index:
+                self.match_index = response.match_index
+                self._on_match_advanced()
+        else:
+            if response.match_index < request.prev_index:
+                self.match_index = min(self.match_index, response.match_index)
+                self.next_index = min(self.next_index, response.match_index)
+            self._back_off(sent_at)
+
+    def _back_off(self, sent_at: float) -> None:
+        self.last_failed = sent_at
+        self._on_response()
+        self.next_index = min(self.next_index, self.match_index)
+        self._backoff = min(
+            self._configuration.max_backoff.total_seconds(),
+            max(self._configuration.min_backoff.total_seconds(), 2 * self._backoff),
+        )
+        loop = asyncio.get_running_loop()
+        self._backing_off_until = loop.time() + self._backoff
+        loop.call_later(self._backoff, self._wake_up.set)
@@ -1,26 +1,199 @@
+from __future__ import annotations
+
 import asyncio
-from typing import Generic
+import typing
+from datetime import timedelta
+from typing import Callable, Generic
 
+from quorum.cluster.configuration import ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
 from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy, \
     DistributionSuccessful, DistributionFailed
+from quorum.node.message_box.distribution_strategy.follower_replication import FollowerReplication
+from quorum.node.metrics import NodeMetrics
 from quorum.node.node_interface import InternalNode
+from quorum.node.tracing import Tracer
+
+if typing.TYPE_CHECKING:
+    from quorum.node.message_box.message_box import MessageBox
 
 
 class LeaderDistribution(DistributionStrategy[MessageType], Generic[MessageType]):
-    async def distribute(self, message: MessageType, other_nodes: set[InternalNode[MessageType]]) -> DistributionFailed | DistributionSuccessful:
-        majority = (len(other_nodes | {self}) // 2) + 1
-        message_sending_tasks = asyncio.as_completed(
-            [
-                asyncio.create_task(node.send_message(message))
-                for node in other_nodes
-            ],
-            timeout=0.5,
-        )
+    def __init__(
+        self,
+        leader_address: str | None = None,
+        metrics: NodeMetrics | None = None,
+        tracer: Tracer[MessageType] | None = None,
+        term: int = 0,
+        on_higher_term: Callable[[int], None] | None = None,
+    ) -> None:
+        self._leader_address = leader_address
+        self._metrics = metrics if metrics is not None else NodeMetrics()
+        self._tracer: Tracer[MessageType] = tracer if tracer is not None else Tracer()
+        self._term = term
+        self._on_higher_term = on_higher_term
+        self._stopped = False
+        self._followers: dict[InternalNode[MessageType], FollowerReplication[MessageType]] = {}
+        self._replication_tasks: list[asyncio.Task[None]] = []
+        self._committing: asyncio.Task[None] | None = None
+        self._commit_advanced = asyncio.Condition()
+        self._responded = asyncio.Event()
 
-        for message_sent, _ in zip(message_sending_tasks, range(majority - 1)):
-            try:
-                await message_sent
-            except asyncio.TimeoutError:
-                return DistributionFailed()
+    async def distribute(
+        self,
+        message_box: MessageBox[MessageType],
+        up_to_index: int,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionFailed | DistributionSuccessful:
+        if self._stopped:
+            return DistributionFailed()
+        self._metrics.distribution_rounds.increment()
+        for follower in self._start_followers(message_box, other_nodes, configuration):
+            follower.notify()
+        self._advance_commit(message_box, other_nodes)
+        try:
+            async with self._commit_advanced:
+                await asyncio.wait_for(
+                    self._commit_advanced.wait_for(lambda: message_box.commit_index >= up_to_index),
+                    timeout=configuration.commit_timeout.total_seconds(),
+                )
+        except asyncio.TimeoutError:
+            return DistributionFailed()
         return DistributionSuccessful()
+
+    def heartbeat(
+        self,
+        message_box: MessageBox[MessageType],
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+        idle_since: float,
+    ) -> None:
+        if self._stopped:
+            return
+        for follower in self._start_followers(message_box, other_nodes, configuration):
+            if follower.last_sent < idle_since:
+                follower.request_heartbeat()
+        self._advance_commit(message_box, other_nodes)
+
+    async def confirm_leadership(
+        self,
+        message_box: MessageBox[MessageType],
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> bool:
+        if self._stopped:
+            return False
+        confirmation_started = asyncio.get_running_loop().time()
+        followers = self._start_followers(message_box, other_nodes, configuration)
+        for follower in followers:
+            follower.request_heartbeat()
+        try:
+            confirmed = await asyncio.wait_for(
+                self._wait_for_majority_acknowledging(followers, confirmation_started),
+                timeout=configuration.request_timeout.total_seconds(),
+            )
+        except asyncio.TimeoutError:
+            return False
+        return confirmed and not self._stopped
+
+    async def _wait_for_majority_acknowledging(
+        self,
+        followers: list[FollowerReplication[MessageType]],
+        moment: float,
+    ) -> bool:
+        majority = ((len(followers) + 1) // 2) + 1
+        while True:
+            if 1 + sum(follower.last_acknowledged >= moment for follower in followers) >= majority:
+                return True
+            if 1 + sum(not follower.failed_since(moment) for follower in followers) < majority:
+                return False
+            await self._responded.wait()
+
+    async def catch_up(
+        self,
+        message_box: MessageBox[MessageType],
+        node: InternalNode[MessageType],
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> None:
+        self._start_followers(message_box, other_nodes, configuration)
+        follower = self._followers[node]
+        while message_box.ingestion_queue.depth > 0 or follower.match_index < len(message_box.log):
+            responded = self._responded
+            follower.request_heartbeat()
+            await responded.wait()
+
+    def lease_started(self, other_nodes: set[InternalNode[MessageType]]) -> float:
+        acknowledgements = sorted(
+            (self._followers[node].last_acknowledged if node in self._followers else float('-inf') for node in other_nodes),
+            reverse=True,
+        )
+        majority = ((len(acknowledgements) + 1) // 2) + 1
+        if majority == 1:
+            return float('inf')
+        return acknowledgements[majority - 2]
+
+    def holds_lease(self, other_nodes: set[InternalNode[MessageType]], lease_duration: timedelta) -> bool:
+        if self._stopped:
+            return False
+        now = asyncio.get_running_loop().time()
+        return now < self.lease_started(other_nodes) + lease_duration.total_seconds()
+
+    def _notify_response(self) -> None:
+        self._responded.set()
+        self._responded = asyncio.Event()
+
+    def match_index(self, node: InternalNode[MessageType]) -> int:
+        return self._followers[node].match_index if node in self._followers else 0
+
+    def next_index(self, node: InternalNode[MessageType]) -> int | None:
+        return self._followers[node].next_index if node in self._followers else None
+
+    def stop(self) -> None:
+        self._stopped = True
+        for task in self._replication_tasks:
+            task.cancel()
+
+    def _start_followers(
+        self,
+        message_box: MessageBox[MessageType],
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> list[FollowerReplication[MessageType]]:
+        for node in other_nodes - self._followers.keys():
+            follower = FollowerReplication(
+                node,
+                message_box,
+                configuration,
+                on_match_advanced=lambda: self._advance_commit(message_box, other_nodes),
+                on_response=self._notify_response,
+                leader_address=self._leader_address,
+                rpc_latency=self._metrics.rpc_latency[node.metrics_label()],
+                rpc_failures=self._metrics.rpc_failures[node.metrics_label()],
+                tracer=self._tracer,
+                term=self._term,
+                on_higher_term=self._on_higher_term,
+            )
+            self._followers[node] = follower
+            self._replication_tasks.append(asyncio.create_task(follower.run()))
+        return [self._followers[node] for node in other_nodes]
+
+    def _advance_commit(self, message_box: MessageBox[MessageType], other_nodes: set[InternalNode[MessageType]]) -> None:
+        if self._committing is None or self._committing.done():
+            self._committing = asyncio.create_task(self._commit(message_box, other_nodes))
+
+    async def _commit(self, message_box: MessageBox[MessageType], other_nodes: set[InternalNode[MessageType]]) -> None:
+        while True:
+            match_indices = sorted(
+                [message_box.persisted_index, *(self.match_index(node) for node in other_nodes)],
+                reverse=True,
+            )
+            majority = (len(match_indices) // 2) + 1
+            commit_index = match_indices[majority - 1]
+            if commit_index <= message_box.commit_index or message_box.log.term(commit_index - 1) != self._term:
+                return
+            self._tracer.quorum_reached(commit_index)
+            await message_box.commit(commit_index)
+            async with self._commit_advanced:
+                self._commit_advanced.notify_all()
@@ -1,11 +1,27 @@
+from __future__ import annotations
+
+import typing
 from typing import Generic
 
 from quorum.cluster.message_type import MessageType
 from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy, \
-    DistributionSuccessful
-from quorum.node.node_interface import InternalNode
+    DistributionFailed
+
+if typing.TYPE_CHECKING:
+    from quorum.cluster.configuration import ReplicationConfiguration
+    from quorum.node.message_box.message_box import MessageBox
+    from quorum.node.node_interface import InternalNode
 
 
 class NoDistribution(DistributionStrategy[MessageType], Generic[MessageType]):
-    async def distribute(self, message: MessageType, other_nodes: set[InternalNode[MessageType]]) -> DistributionSuccessful:
-        return DistributionSuccessful()
+    async def distribute(
+        self,
+        message_box: MessageBox[MessageType],
+        up_to_index: int,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionFailed:
+        return DistributionFailed()
+
+    def accepts_messages(self) -> bool:
+        return False
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+Item = TypeVar('Item')
+
+
+@dataclass(frozen=True)
+class BlockWhenFull:
+    pass
+
+
+@dataclass(frozen=True)
+class RejectWhenFull:
+    pass
+
+
+@dataclass(frozen=True)
+class DropOldestWhenFull:
+    pass
+
+
+OverflowPolicy = BlockWhenFull | RejectWhenFull | DropOldestWhenFull
+
+
+class IngestionQueue(Generic[Item]):
+    def __init__(self, capacity: int | None = None, overflow: OverflowPolicy = BlockWhenFull()) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError('an ingestion queue needs room for at least one item')
+        self._queue: asyncio.Queue[Item] = asyncio.Queue(maxsize=capacity if capacity is not None else 0)
+        self._overflow = overflow
+        self.capacity = capacity
+        self.rejected = 0
+        self.dropped = 0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, item: Item) -> Item | None:
+        if not self._queue.full() or isinstance(self._overflow, BlockWhenFull):
+            await self._queue.put(item)
+            return None
+        if isinstance(self._overflow, RejectWhenFull):
+            self.rejected += 1
+            raise IngestionQueueFull
+        dropped = self._queue.get_nowait()
+        self.dropped += 1
+        self._queue.put_nowait(item)
+        return dropped
+
+    async def get(self) -> Item:
+        return await self._queue.get()
+
+    def get_nowait(self) -> Item:
+        return self._queue.get_nowait()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+
+class IngestionQueueFull(Exception):
+    pass
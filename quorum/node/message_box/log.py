@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import typing
+from bisect import bisect_left
+from typing import Generic, Sequence, overload, Iterable, Iterator, Any
+
+from quorum.cluster.message_type import MessageType
+
+if typing.TYPE_CHECKING:
+    from quorum.node.message_box.snapshot import Snapshot
+
+
+class NoOp:
+    def __repr__(self) -> str:
+        return 'NoOp()'
+
+
+NO_OP: Any = NoOp()
+
+
+class Log(Generic[MessageType]):
+    def __init__(
+        self,
+        messages: Iterable[MessageType] = tuple(),
+        snapshot: Snapshot[MessageType] | None = None,
+        terms: Iterable[int] | None = None,
+    ) -> None:
+        self._snapshot = snapshot
+        self._offset = len(snapshot) if snapshot is not None else 0
+        self._messages: list[MessageType] = list(messages)
+        self._terms: list[int] = list(terms) if terms is not None else [0] * len(self._messages)
+        if len(self._terms) != len(self._messages):
+            raise ValueError('every message needs a term')
+        self._no_ops: list[int] = list(snapshot.no_op_indices()) if snapshot is not None else []
+        self._record_no_ops(self._offset, self._messages)
+
+    def append(self, message: MessageType, term: int = 0) -> None:
+        self._record_no_ops(len(self), (message,))
+        self._messages.append(message)
+        self._terms.append(term)
+
+    def extend(self, messages: Sequence[MessageType], terms: Sequence[int] | None = None) -> None:
+        if terms is not None and len(terms) != len(messages):
+            raise ValueError('every message needs a term')
+        self._record_no_ops(len(self), messages)
+        self._messages.extend(messages)
+        self._terms.extend(terms if terms is not None else [0] * len(messages))
+
+    def truncate(self, length: int) -> None:
+        if length < self._offset:
+            raise ValueError('cannot truncate a log into its snapshot')
+        del self._messages[length - self._offset:]
+        del self._terms[length - self._offset:]
+        del self._no_ops[bisect_left(self._no_ops, length):]
+
+    def contains_no_op(self, start: int, stop: int) -> bool:
+        position = bisect_left(self._no_ops, start)
+        return position < len(self._no_ops) and self._no_ops[position] < stop
+
+    def _record_no_ops(self, first_index: int, messages: Iterable[MessageType]) -> None:
+        self._no_ops.extend(first_index + offset for offset, message in enumerate(messages) if isinstance(message, NoOp))
+
+    def __len__(self) -> int:
+        return self._offset + len(self._messages)
+
+    def __getitem__(self, index: int) -> MessageType:
+        if index < 0:
+            index += len(self)
+        if index < self._offset:
+            assert self._snapshot is not None
+            return self._snapshot[index]
+        return self._messages[index - self._offset]
+
+    def term(self, index: int) -> int:
+        if not 0 <= index < len(self):
+            raise IndexError('log index out of range')
+        if index < self._offset:
+            assert self._snapshot is not None
+            return self._snapshot.term(index)
+        return self._terms[index - self._offset]
+
+    @property
+    def last_term(self) -> int:
+        return self.term(len(self) - 1) if len(self) > 0 else 0
+
+    def terms(self, start: int, stop: int) -> tuple[int, ...]:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= self._offset:
+            return tuple(self._terms[start - self._offset:stop - self._offset])
+        return tuple(self.term(index) for index in range(start, stop))
+
+    @property
+    def snapshot(self) -> Snapshot[MessageType] | None:
+        return self._snapshot
+
+    @property
+    def tail_length(self) -> int:
+        return len(self._messages)
+
+    def compact(self, snapshot: Snapshot[MessageType]) -> None:
+        if not self._offset <= len(snapshot) <= len(self):
+            raise ValueError('snapshot does not cover a prefix of the log')
+        self._messages = self._messages[len(snapshot) - self._offset:]
+        self._terms = self._terms[len(snapshot) - self._offset:]
+        self._snapshot = snapshot
+        self._offset = len(snapshot)
+
+    def slice(self, start: int, stop: int) -> LogView[MessageType]:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return LogView(self._snapshot, self._offset, self._messages, start, max(start, stop))
+
+    def view(self) -> LogView[MessageType]:
+        return self.slice(0, len(self))
+
+
+class LogView(Sequence[MessageType], Generic[MessageType]):
+    def __init__(
+        self,
+        snapshot: Snapshot[MessageType] | None,
+        offset: int,
+        messages: list[MessageType],
+        start: int,
+        stop: int,
+    ) -> None:
+        self._snapshot = snapshot
+        self._offset = offset
+        self._messages = messages
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> MessageType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LogView[MessageType]: ...
+
+    def __getitem__(self, index: int | slice) -> MessageType | LogView[MessageType]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError('log views can only be sliced contiguously')
+            return LogView(
+                self._snapshot,
+                self._offset,
+                self._messages,
+                self._start + start,
+                self._start + max(start, stop),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('log view index out of range')
+        return self._get(self._start + index)
+
+    def _get(self, index: int) -> MessageType:
+        if index < self._offset:
+            assert self._snapshot is not None
+            return self._snapshot[index]
+        return self._messages[index - self._offset]
+
+    def __iter__(self) -> Iterator[MessageType]:
+        if self._start < self._offset:
+            assert self._snapshot is not None
+            yield from self._snapshot.iterate(self._start, min(self._stop, self._offset))
+        messages = self._messages
+        for index in range(max(self._start, self._offset) - self._offset, self._stop - self._offset):
+            yield messages[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence):
+            return False
+        return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f'LogView({list(self)!r})'
@@ -1,28 +1,307 @@
 from __future__ import annotations
 import asyncio
-from typing import Generic, NoReturn
+from collections import deque
+from typing import Callable, Generic, NoReturn, Sequence
 
+from quorum.cluster.configuration import BatchConfiguration, ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
 from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy, DistributionFailed
+from quorum.node.message_box.commit_outcome import CommitHandle, Committed, CommitFailed, CommitUnknown
+from quorum.node.message_box.ingestion_queue import IngestionQueue
+from quorum.node.message_box.log import Log, NoOp, NO_OP
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.message_box.snapshot import Snapshotter
+from quorum.node.message_box.write_ahead_log import WriteAheadLog
+from quorum.node.metrics import NodeMetrics
 from quorum.node.node_interface import InternalNode
+from quorum.node.tracing import Tracer
 
 
 class MessageBox(Generic[MessageType]):
-    def __init__(self, distribution_strategy: DistributionStrategy[MessageType]):
-        self._messages: tuple[MessageType, ...] = tuple()
-        self._waiting_messages: asyncio.Queue[MessageType] = asyncio.Queue()
+    def __init__(
+        self,
+        distribution_strategy: DistributionStrategy[MessageType],
+        write_ahead_log: WriteAheadLog[MessageType] | None = None,
+        snapshotter: Snapshotter[MessageType] | None = None,
+        ingestion_queue: IngestionQueue[tuple[MessageType, CommitHandle]] | None = None,
+        metrics: NodeMetrics | None = None,
+        tracer: Tracer[MessageType] | None = None,
+        current_term: Callable[[], int] | None = None,
+    ):
+        self._metrics = metrics if metrics is not None else NodeMetrics()
+        self._tracer: Tracer[MessageType] = tracer if tracer is not None else Tracer()
+        self._current_term = current_term if current_term is not None else lambda: 0
+        self._write_ahead_log = write_ahead_log
+        self._snapshotter = snapshotter
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._log: Log[MessageType] = self._recover()
+        self._commit_index = self._recover_commit_index()
+        self._applied_index = self._commit_index
+        self._persisted_index = len(self._log)
+        self._truncations = 0
+        self._applied = asyncio.Event()
+        self._waiting_messages = ingestion_queue if ingestion_queue is not None else IngestionQueue()
+        self._pending_commits: deque[tuple[int, CommitHandle]] = deque()
         self.distribution_strategy = distribution_strategy
 
-    async def append(self, message: MessageType) -> None:
-        await self._waiting_messages.put(message)
+    @property
+    def log(self) -> Log[MessageType]:
+        return self._log
 
-    async def get_messages(self) -> tuple[MessageType, ...]:
-        return self._messages
+    @property
+    def commit_index(self) -> int:
+        return self._commit_index
 
-    async def run(self, other_nodes: set[InternalNode[MessageType]]) -> NoReturn:
-        while True:
-            message = await self._waiting_messages.get()
-            response = await self.distribution_strategy.distribute(message, other_nodes)
-            if isinstance(response, DistributionFailed):
+    @property
+    def persisted_index(self) -> int:
+        return min(self._persisted_index, len(self._log))
+
+    @property
+    def ingestion_queue(self) -> IngestionQueue[tuple[MessageType, CommitHandle]]:
+        return self._waiting_messages
+
+    def _recover(self) -> Log[MessageType]:
+        snapshot = self._snapshotter.load_latest() if self._snapshotter is not None else None
+        snapshot_length = len(snapshot) if snapshot is not None else 0
+        if self._write_ahead_log is None:
+            return Log(snapshot=snapshot)
+        messages = self._write_ahead_log.recover(from_index=snapshot_length)
+        return Log(messages, snapshot=snapshot, terms=self._write_ahead_log.recovered_terms)
+
+    def _recover_commit_index(self) -> int:
+        snapshot_length = len(self._log.snapshot) if self._log.snapshot is not None else 0
+        if self._write_ahead_log is None or self._write_ahead_log.recovered_commit_index is None:
+            return len(self._log)
+        return max(snapshot_length, min(len(self._log), self._write_ahead_log.recovered_commit_index))
+
+    async def append(self, message: MessageType) -> CommitHandle:
+        handle: CommitHandle = asyncio.get_running_loop().create_future()
+        self._tracer.enqueued(handle)
+        dropped = await self._waiting_messages.put((message, handle))
+        if dropped is not None:
+            _, dropped_handle = dropped
+            dropped_handle.set_result(CommitFailed())
+        return handle
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
+        stop = self._applied_index if limit is None else min(self._applied_index, since_index + limit)
+        entries = self._log.slice(since_index, stop)
+        next_index = since_index + len(entries)
+        if not self._log.contains_no_op(since_index, next_index):
+            return MessagesPage(messages=entries, next_index=next_index)
+        messages = tuple(message for message in entries if not isinstance(message, NoOp))
+        return MessagesPage(messages=messages, next_index=next_index)
+
+    async def append_no_op(self) -> int:
+        term = self._current_term()
+        self._log.append(NO_OP, term)
+        self._write([NO_OP], [term])
+        await self._sync(len(self._log))
+        return len(self._log)
+
+    async def wait_until_applied(self, index: int) -> None:
+        while self._applied_index < index:
+            await self._applied.wait()
+
+    async def replicate(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
+        if request.prev_index > len(self._log):
+            return AppendEntriesResponse(success=False, match_index=len(self._log))
+        if request.prev_index > 0 and self._log.term(request.prev_index - 1) != request.prev_term:
+            return AppendEntriesResponse(success=False, match_index=self._first_index_of_term(request.prev_index - 1))
+        terms = request.terms
+        first_new = self._first_conflict(request.prev_index, terms)
+        new_entries = request.entries[first_new - request.prev_index:]
+        if new_entries:
+            new_terms = terms[first_new - request.prev_index:]
+            self._truncate(first_new)
+            self._log.extend(new_entries, new_terms)
+            self._write(new_entries, new_terms)
+            await self._sync(len(self._log))
+        match_index = request.prev_index + len(request.entries)
+        await self.commit(min(request.leader_commit, match_index))
+        return AppendEntriesResponse(success=True, match_index=match_index)
+
+    def _first_index_of_term(self, index: int) -> int:
+        term = self._log.term(index)
+        first_index = len(self._log) - self._log.tail_length
+        while index > first_index and self._log.term(index - 1) == term:
+            index -= 1
+        return index
+
+    def _first_conflict(self, prev_index: int, terms: Sequence[int]) -> int:
+        index = prev_index
+        stop = min(len(self._log), prev_index + len(terms))
+        while index < stop and self._log.term(index) == terms[index - prev_index]:
+            index += 1
+        return index
+
+    def _truncate(self, length: int) -> None:
+        if length >= len(self._log):
+            return
+        self._log.truncate(length)
+        self._truncations += 1
+        self._commit_index = min(self._commit_index, length)
+        self._applied_index = min(self._applied_index, length)
+        self._persisted_index = min(self._persisted_index, length)
+        if self._write_ahead_log is not None:
+            self._write_ahead_log.truncate(length)
+            self._write_ahead_log.mark_committed(self._commit_index)
+        self._abandon_pending_commits(from_index=length)
+
+    def _write(self, messages: Sequence[MessageType], terms: Sequence[int]) -> None:
+        encoded_bytes = self._write_ahead_log.write(messages, terms) if self._write_ahead_log is not None else None
+        if self._snapshotter is not None:
+            self._snapshotter.record_appended(messages, encoded_bytes)
+
+    async def _sync(self, up_to_index: int) -> None:
+        truncations = self._truncations
+        if self._write_ahead_log is not None:
+            await self._write_ahead_log.sync()
+        if truncations == self._truncations:
+            self._persisted_index = max(self._persisted_index, up_to_index)
+
+    async def run(
+        self,
+        other_nodes: set[InternalNode[MessageType]],
+        batch_configuration: BatchConfiguration,
+        replication_configuration: ReplicationConfiguration = ReplicationConfiguration(),
+    ) -> NoReturn:
+        pipeline = asyncio.Semaphore(batch_configuration.pipeline_depth)
+        rounds: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                await pipeline.acquire()
+                batch = await self._next_batch(batch_configuration)
+                if not self.distribution_strategy.accepts_messages():
+                    self._refuse(batch)
+                    pipeline.release()
+                    continue
+                self._metrics.batch_size.observe(len(batch))
+                first_index = len(self._log)
+                self._tracer.appended(first_index, batch)
+                self._pending_commits.extend(
+                    (first_index + offset, handle) for offset, (_, handle) in enumerate(batch)
+                )
+                messages = [message for message, _ in batch]
+                terms = [self._current_term()] * len(messages)
+                self._log.extend(messages, terms)
+                self._write(messages, terms)
+                persisting = asyncio.ensure_future(self._sync(len(self._log)))
+                distribution_round = asyncio.create_task(
+                    self._distribute(
+                        first_index,
+                        len(self._log),
+                        persisting,
+                        other_nodes,
+                        replication_configuration,
+                        pipeline,
+                    )
+                )
+                rounds.add(distribution_round)
+                distribution_round.add_done_callback(rounds.discard)
+        finally:
+            for distribution_round in rounds:
+                distribution_round.cancel()
+
+    async def _distribute(
+        self,
+        from_index: int,
+        up_to_index: int,
+        persisting: asyncio.Future[None],
+        other_nodes: set[InternalNode[MessageType]],
+        replication_configuration: ReplicationConfiguration,
+        pipeline: asyncio.Semaphore,
+    ) -> None:
+        started = asyncio.get_running_loop().time()
+        try:
+            response = await self.distribution_strategy.distribute(
+                self,
+                up_to_index,
+                other_nodes,
+                replication_configuration,
+            )
+            if isinstance(response, DistributionFailed) or len(self._log) < up_to_index:
+                self._metrics.distribution_failures.increment()
+                self._give_up_on_pending_commits(from_index, up_to_index)
+                return
+            await persisting
+            await self.commit(up_to_index)
+            self._metrics.commit_latency.observe(asyncio.get_running_loop().time() - started)
+        finally:
+            pipeline.release()
+
+    async def commit(self, index: int) -> None:
+        if index <= self._commit_index:
+            return
+        newly_committed = self._log.slice(self._commit_index, index)
+        self._commit_index = index
+        self._metrics.messages_committed.increment(len(newly_committed))
+        if self._write_ahead_log is not None:
+            self._write_ahead_log.mark_committed(index)
+        self._applied_index = max(self._applied_index, index)
+        self._applied.set()
+        self._applied = asyncio.Event()
+        self._resolve_pending_commits(before_index=self._applied_index)
+        self._tracer.committed(index)
+        self._maybe_take_snapshot()
+
+    def _resolve_pending_commits(self, before_index: int) -> None:
+        while self._pending_commits and self._pending_commits[0][0] < before_index:
+            index, handle = self._pending_commits.popleft()
+            if not handle.done():
+                handle.set_result(Committed(index))
+
+    def refuse_messages(self) -> None:
+        while not self._waiting_messages.empty():
+            self._refuse([self._waiting_messages.get_nowait()])
+        self._give_up_on_pending_commits(0, len(self._log))
+
+    def _refuse(self, batch: Sequence[tuple[MessageType, CommitHandle]]) -> None:
+        for _, handle in batch:
+            if not handle.done():
+                handle.set_result(CommitFailed())
+
+    def _give_up_on_pending_commits(self, from_index: int, before_index: int) -> None:
+        for index, handle in reversed(self._pending_commits):
+            if index < from_index:
+                break
+            if index < before_index and not handle.done():
+                handle.set_result(CommitUnknown())
+
+    def _abandon_pending_commits(self, from_index: int) -> None:
+        while self._pending_commits and self._pending_commits[-1][0] >= from_index:
+            _, handle = self._pending_commits.pop()
+            if not handle.done():
+                handle.set_result(CommitFailed())
+
+    def _maybe_take_snapshot(self) -> None:
+        if self._snapshotter is None:
+            return
+        if self._snapshot_task is None and self._snapshotter.should_snapshot(self._log):
+            self._snapshot_task = asyncio.create_task(self._take_snapshot(self._snapshotter))
+
+    async def _take_snapshot(self, snapshotter: Snapshotter[MessageType]) -> None:
+        try:
+            snapshot = await snapshotter.take(self._log, self._applied_index)
+            if self._write_ahead_log is not None:
+                self._write_ahead_log.discard_before(len(snapshot))
+        finally:
+            self._snapshot_task = None
+
+    async def _next_batch(self, batch_configuration: BatchConfiguration) -> list[tuple[MessageType, CommitHandle]]:
+        batch = [await self._waiting_messages.get()]
+        loop = asyncio.get_running_loop()
+        linger_deadline = loop.time() + batch_configuration.max_linger.total_seconds()
+        while len(batch) < batch_configuration.max_batch_size:
+            if not self._waiting_messages.empty():
+                batch.append(self._waiting_messages.get_nowait())
                 continue
-            self._messages = (*self._messages, message)
+            remaining_linger = linger_deadline - loop.time()
+            if remaining_linger <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._waiting_messages.get(), timeout=remaining_linger))
+            except asyncio.TimeoutError:
+                break
+        return batch
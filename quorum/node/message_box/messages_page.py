@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Generic, Sequence
+
+from quorum.cluster.message_type import MessageType
+
+
+@dataclass(frozen=True)
+class MessagesPage(Generic[MessageType]):
+    messages: Sequence[MessageType]
+    next_index: int
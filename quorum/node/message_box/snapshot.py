@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generic, Iterator, Sequence, cast
+
+from quorum.cluster.message_type import MessageType
+from quorum.node.message_box.codec import Codec
+from quorum.node.message_box.log import Log, NoOp, NO_OP
+
+_MAGIC = b'QSNP'
+_VERSION = 3
+_HEADER = struct.Struct('<4sIQQQH')
+_INDEX = struct.Struct('<Q')
+_SNAPSHOT_SUFFIX = '.snapshot'
+
+
+class _SnapshotFile:
+    def __init__(self, path: Path) -> None:
+        with open(path, 'rb') as snapshot_file:
+            self._map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, start, length, no_op_count, base_name_length = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise CorruptSnapshot(path)
+        self.start = int(start)
+        self.length = int(length)
+        position = _HEADER.size
+        self.base_name = self._map[position:position + base_name_length].decode() or None
+        position += base_name_length
+        self.no_ops: tuple[int, ...] = struct.unpack_from(f'<{no_op_count}Q', self._map, position)
+        self._offsets_start = position + no_op_count * _INDEX.size
+        self._terms_start = self._offsets_start + (self.length + 1) * _INDEX.size
+        self._data_start = self._terms_start + self.length * _INDEX.size
+
+    def record(self, index: int) -> bytes:
+        (start,) = _INDEX.unpack_from(self._map, self._offsets_start + index * _INDEX.size)
+        (stop,) = _INDEX.unpack_from(self._map, self._offsets_start + (index + 1) * _INDEX.size)
+        return self._map[self._data_start + start:self._data_start + stop]
+
+    def term(self, index: int) -> int:
+        (term,) = _INDEX.unpack_from(self._map, self._terms_start + index * _INDEX.size)
+        return int(term)
+
+
+class Snapshot(Generic[MessageType]):
+    def __init__(self, path: Path, codec: Codec[MessageType]) -> None:
+        self._path = path
+        self._codec = codec
+        files = [_SnapshotFile(path)]
+        while files[-1].base_name is not None:
+            files.append(_SnapshotFile(path.parent / files[-1].base_name))
+        files.reverse()
+        for base, extension in zip(files, files[1:]):
+            if extension.start != base.start + base.length:
+                raise CorruptSnapshot(path)
+        self._files = files
+        self._starts = [snapshot_file.start for snapshot_file in files]
+        self._length = files[-1].start + files[-1].length
+        self._no_ops = frozenset(self.no_op_indices())
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> MessageType:
+        snapshot_file = self._file(index)
+        if index in self._no_ops:
+            return cast(MessageType, NO_OP)
+        return self._codec.decode(snapshot_file.record(index - snapshot_file.start))
+
+    def term(self, index: int) -> int:
+        snapshot_file = self._file(index)
+        return snapshot_file.term(index - snapshot_file.start)
+
+    def no_op_indices(self) -> list[int]:
+        return [index for snapshot_file in self._files for index in snapshot_file.no_ops]
+
+    def iterate(self, start: int, stop: int) -> Iterator[MessageType]:
+        for index in range(start, stop):
+            yield self[index]
+
+    def _file(self, index: int) -> _SnapshotFile:
+        if not 0 <= index < self._length:
+            raise IndexError('snapshot index out of range')
+        return self._files[bisect_right(self._starts, index) - 1]
+
+
+def write_snapshot(
+    path: Path,
+    base: Snapshot[MessageType] | None,
+    messages: Sequence[MessageType],
+    codec: Codec[MessageType],
+    terms: Sequence[int] | None = None,
+) -> None:
+    start = len(base) if base is not None else 0
+    base_name = base.path.name.encode() if base is not None else b''
+    terms = terms if terms is not None else [0] * len(messages)
+    encoded_messages = [b'' if isinstance(message, NoOp) else codec.encode(message) for message in messages]
+    no_ops = [start + offset for offset, message in enumerate(messages) if isinstance(message, NoOp)]
+    offsets = [0]
+    for encoded_message in encoded_messages:
+        offsets.append(offsets[-1] + len(encoded_message))
+
+    temporary_path = path.with_suffix('.tmp')
+    with open(temporary_path, 'wb') as snapshot_file:
+        snapshot_file.write(_HEADER.pack(_MAGIC, _VERSION, start, len(messages), len(no_ops), len(base_name)))
+        snapshot_file.write(base_name)
+        snapshot_file.write(struct.pack(f'<{len(no_ops)}Q', *no_ops))
+        snapshot_file.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        snapshot_file.write(struct.pack(f'<{len(messages)}Q', *terms))
+        for encoded_message in encoded_messages:
+            snapshot_file.write(encoded_message)
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary_path, path)
+
+
+@dataclass(frozen=True)
+class SnapshotEveryEntries:
+    entries: int
+
+
+@dataclass(frozen=True)
+class SnapshotEveryBytes:
+    bytes: int
+
+
+SnapshotTrigger = SnapshotEveryEntries | SnapshotEveryBytes
+
+
+class Snapshotter(Generic[MessageType]):
+    def __init__(
+        self,
+        directory: Path,
+        codec: Codec[MessageType],
+        trigger: SnapshotTrigger = SnapshotEveryEntries(100_000),
+    ) -> None:
+        self._directory = directory
+        self._codec = codec
+        self._trigger = trigger
+        self._bytes_since_snapshot = 0
+
+    def load_latest(self) -> Snapshot[MessageType] | None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        snapshots = self._snapshots()
+        if not snapshots:
+            return None
+        return Snapshot(snapshots[-1], self._codec)
+
+    def record_appended(self, messages: Sequence[MessageType], encoded_bytes: int | None = None) -> None:
+        if isinstance(self._trigger, SnapshotEveryBytes):
+            if encoded_bytes is None:
+                encoded_bytes = sum(len(self._codec.encode(message)) for message in messages if not isinstance(message, NoOp))
+            self._bytes_since_snapshot += encoded_bytes
+
+    def should_snapshot(self, log: Log[MessageType]) -> bool:
+        if isinstance(self._trigger, SnapshotEveryBytes):
+            return self._bytes_since_snapshot >= self._trigger.bytes
+        return log.tail_length >= self._trigger.entries
+
+    async def take(self, log: Log[MessageType], length: int) -> Snapshot[MessageType]:
+        base = log.snapshot
+        bytes_in_snapshot = self._bytes_since_snapshot
+        path = self._directory / f'{length:020d}{_SNAPSHOT_SUFFIX}'
+        start = len(base) if base is not None else 0
+        tail = log.slice(start, length)
+        terms = log.terms(start, length)
+        await asyncio.get_running_loop().run_in_executor(None, write_snapshot, path, base, tail, self._codec, terms)
+        self._bytes_since_snapshot -= bytes_in_snapshot
+
+        snapshot = Snapshot(path, self._codec)
+        log.compact(snapshot)
+        return snapshot
+
+    def _snapshots(self) -> list[Path]:
+        return sorted(self._directory.glob(f'*{_SNAPSHOT_SUFFIX}'))
+
+
+class CorruptSnapshot(Exception):
+    pass
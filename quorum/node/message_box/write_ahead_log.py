@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Generic, Sequence, cast
+
+from quorum.cluster.message_type import MessageType
+from quorum.node.message_box.codec import Codec
+from quorum.node.message_box.log import NoOp, NO_OP
+
+_RECORD_HEADER = struct.Struct('>II')
+_ENTRY = struct.Struct('>Q?')
+_COMMIT_INDEX = struct.Struct('>Q')
+_SEGMENT_SUFFIX = '.wal'
+_COMMIT_INDEX_FILE = 'commit_index'
+
+
+@dataclass(frozen=True)
+class FsyncPerBatch:
+    pass
+
+
+@dataclass(frozen=True)
+class FsyncInterval:
+    interval: timedelta
+
+
+@dataclass(frozen=True)
+class NoFsync:
+    pass
+
+
+Durability = FsyncPerBatch | FsyncInterval | NoFsync
+
+
+class WriteAheadLog(Generic[MessageType]):
+    def __init__(
+        self,
+        directory: Path,
+        codec: Codec[MessageType],
+        durability: Durability = FsyncPerBatch(),
+        segment_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        self._directory = directory
+        self._codec = codec
+        self._durability = durability
+        self._segment_size = segment_size
+        self._fd: int | None = None
+        self._segment_bytes = 0
+        self._next_index = 0
+        self._bytes_written = 0
+        self._bytes_synced = 0
+        self._sync_in_progress: asyncio.Future[None] | None = None
+        self._retired_fds: list[int] = []
+        self._interval_sync_task: asyncio.Task[None] | None = None
+        self._commit_index_fd: int | None = None
+        self._recovered_commit_index: int | None = None
+        self._recovered_terms: list[int] = []
+
+    @property
+    def recovered_commit_index(self) -> int | None:
+        return self._recovered_commit_index
+
+    @property
+    def recovered_terms(self) -> list[int]:
+        return self._recovered_terms
+
+    def recover(self, from_index: int = 0) -> list[MessageType]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._recover_commit_index()
+        messages: list[MessageType] = []
+        terms: list[int] = []
+        segments = self._segments()
+        last_segment_end: int | None = None
+        for segment, next_segment in zip(segments, [*segments[1:], None]):
+            if next_segment is not None and self._first_index(next_segment) <= from_index:
+                continue
+            segment_messages: list[MessageType] = []
+            segment_terms: list[int] = []
+            valid_bytes = self._read_segment(segment, segment_messages, segment_terms)
+            if next_segment is None and valid_bytes < segment.stat().st_size:
+                os.truncate(segment, valid_bytes)
+            first_index = self._first_index(segment)
+            messages.extend(segment_messages[max(0, from_index - first_index):])
+            terms.extend(segment_terms[max(0, from_index - first_index):])
+            last_segment_end = first_index + len(segment_messages)
+        if last_segment_end is not None and last_segment_end >= from_index:
+            self._next_index = last_segment_end
+            self._open_segment(segments[-1])
+        else:
+            self._next_index = from_index
+            self._open_segment(self._segment_path(from_index))
+        self._recovered_terms = terms
+        return messages
+
+    def discard_before(self, index: int) -> None:
+        segments = self._segments()
+        for segment, next_segment in zip(segments, segments[1:]):
+            if self._first_index(next_segment) > index:
+                break
+            segment.unlink()
+
+    async def append(self, messages: Sequence[MessageType], terms: Sequence[int] | None = None) -> int:
+        encoded_bytes = self.write(messages, terms)
+        await self.sync()
+        return encoded_bytes
+
+    def write(self, messages: Sequence[MessageType], terms: Sequence[int] | None = None) -> int:
+        if self._fd is None:
+            raise WriteAheadLogNotRecovered
+        terms = terms if terms is not None else [0] * len(messages)
+        records = b''.join(self._encode_record(message, term) for message, term in zip(messages, terms))
+        if self._segment_bytes > 0 and self._segment_bytes + len(records) > self._segment_size:
+            self._roll_segment()
+        os.write(self._fd, records)
+        self._segment_bytes += len(records)
+        self._bytes_written += len(records)
+        self._next_index += len(messages)
+        return len(records)
+
+    async def sync(self) -> None:
+        if isinstance(self._durability, FsyncPerBatch):
+            await self._wait_until_synced(self._bytes_written)
+        elif isinstance(self._durability, FsyncInterval) and self._interval_sync_task is None:
+            self._interval_sync_task = asyncio.create_task(self._sync_periodically(self._durability.interval))
+
+    def truncate(self, length: int) -> None:
+        if self._fd is None:
+            raise WriteAheadLogNotRecovered
+        if length >= self._next_index:
+            return
+        self._retire_segment()
+        kept_segments = []
+        for segment in self._segments():
+            if self._first_index(segment) < length:
+                kept_segments.append(segment)
+            else:
+                segment.unlink()
+        if kept_segments:
+            last_segment = kept_segments[-1]
+            os.truncate(last_segment, self._record_offset(last_segment, length - self._first_index(last_segment)))
+            self._open_segment(last_segment)
+        else:
+            self._open_segment(self._segment_path(length))
+        if not isinstance(self._durability, NoFsync):
+            os.fsync(self._fd)
+        self._next_index = length
+
+    def mark_committed(self, index: int) -> None:
+        if self._commit_index_fd is not None:
+            os.pwrite(self._commit_index_fd, _COMMIT_INDEX.pack(index), 0)
+
+    async def close(self) -> None:
+        if self._interval_sync_task is not None:
+            self._interval_sync_task.cancel()
+            self._interval_sync_task = None
+        if self._sync_in_progress is not None:
+            await asyncio.shield(self._sync_in_progress)
+        for fd in self._retired_fds:
+            os.close(fd)
+        self._retired_fds = []
+        if self._fd is not None:
+            if not isinstance(self._durability, NoFsync):
+                os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = None
+        if self._commit_index_fd is not None:
+            os.close(self._commit_index_fd)
+            self._commit_index_fd = None
+
+    def _recover_commit_index(self) -> None:
+        self._commit_index_fd = os.open(self._directory / _COMMIT_INDEX_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        data = os.pread(self._commit_index_fd, _COMMIT_INDEX.size, 0)
+        self._recovered_commit_index = _COMMIT_INDEX.unpack(data)[0] if len(data) == _COMMIT_INDEX.size else None
+
+    def _segments(self) -> list[Path]:
+        return sorted(self._directory.glob(f'*{_SEGMENT_SUFFIX}'))
+
+    def _first_index(self, segment: Path) -> int:
+        return int(segment.name.removesuffix(_SEGMENT_SUFFIX))
+
+    def _segment_path(self, first_index: int) -> Path:
+        return self._directory / f'{first_index:020d}{_SEGMENT_SUFFIX}'
+
+    def _read_segment(self, segment: Path, messages: list[MessageType], terms: list[int]) -> int:
+        data = memoryview(segment.read_bytes())
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+            payload = data[offset + _RECORD_HEADER.size:offset + _RECORD_HEADER.size + length]
+            if len(payload) < length or length < _ENTRY.size or zlib.crc32(payload) != checksum:
+                break
+            term, no_op = _ENTRY.unpack_from(payload)
+            terms.append(term)
+            messages.append(cast(MessageType, NO_OP) if no_op else self._codec.decode(bytes(payload[_ENTRY.size:])))
+            offset += _RECORD_HEADER.size + length
+        return offset
+
+    def _record_offset(self, segment: Path, records: int) -> int:
+        data = segment.read_bytes()
+        offset = 0
+        for _ in range(records):
+            length, _ = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size + length
+        return offset
+
+    def _encode_record(self, message: MessageType, term: int) -> bytes:
+        if isinstance(message, NoOp):
+            payload = _ENTRY.pack(term, True)
+        else:
+            payload = _ENTRY.pack(term, False) + self._codec.encode(message)
+        return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _open_segment(self, segment: Path) -> None:
+        is_new_segment = not segment.exists()
+        self._fd = os.open(segment, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._segment_bytes = os.fstat(self._fd).st_size
+        if is_new_segment and not isinstance(self._durability, NoFsync):
+            self._sync_directory()
+
+    def _sync_directory(self) -> None:
+        directory_fd = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def _roll_segment(self) -> None:
+        assert self._fd is not None
+        if not isinstance(self._durability, NoFsync):
+            os.fsync(self._fd)
+        self._retire_segment()
+        self._open_segment(self._segment_path(self._next_index))
+
+    def _retire_segment(self) -> None:
+        assert self._fd is not None
+        if self._sync_in_progress is None:
+            os.close(self._fd)
+        else:
+            self._retired_fds.append(self._fd)
+
+    async def _wait_until_synced(self, bytes_written: int) -> None:
+        while self._bytes_synced < bytes_written:
+            if self._sync_in_progress is None:
+                self._sync_in_progress = asyncio.ensure_future(self._sync())
+            await asyncio.shield(self._sync_in_progress)
+
+    async def _sync(self) -> None:
+        assert self._fd is not None
+        bytes_written = self._bytes_written
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, os.fsync, self._fd)
+            self._bytes_synced = max(self._bytes_synced, bytes_written)
+        finally:
+            self._sync_in_progress = None
+            for fd in self._retired_fds:
+                os.close(fd)
+            self._retired_fds = []
+
+    async def _sync_periodically(self, interval: timedelta) -> None:
+        while True:
+            await asyncio.sleep(interval.total_seconds())
+            if self._bytes_synced < self._bytes_written:
+                await self._wait_until_synced(self._bytes_written)
+
+
+class WriteAheadLogNotRecovered(Exception):
+    pass
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from typing import Mapping
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0, 512.0, 1024.0)
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def increment(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class NodeMetrics:
+    def __init__(self) -> None:
+        self.messages_committed = Counter()
+        self.commit_latency = Histogram()
+        self.batch_size = Histogram(SIZE_BUCKETS)
+        self.distribution_rounds = Counter()
+        self.distribution_failures = Counter()
+        self.heartbeat_rounds = Counter()
+        self.pre_votes_lost = Counter()
+        self.elections_started = Counter()
+        self.elections_won = Counter()
+        self.leaderless_seconds = Counter()
+        self.lease_hits = Counter()
+        self.lease_misses = Counter()
+        self.rpc_latency: defaultdict[str, Histogram] = defaultdict(Histogram)
+        self.rpc_failures: defaultdict[str, Counter] = defaultdict(Counter)
+        self.role_transitions: defaultdict[tuple[str, str], Counter] = defaultdict(Counter)
+
+    def expose(self, exposition: PrometheusExposition) -> None:
+        exposition.counter('quorum_messages_committed_total', 'Messages committed by this node.', self.messages_committed.value)
+        exposition.histogram('quorum_commit_latency_seconds', 'Time from batching to commit on the leader.', self.commit_latency)
+        exposition.histogram('quorum_batch_size_messages', 'Messages per batch appended by the leader.', self.batch_size)
+        exposition.counter('quorum_distribution_rounds_total', 'Distribution rounds started.', self.distribution_rounds.value)
+        exposition.counter('quorum_distribution_failures_total', 'Distribution rounds that did not commit.', self.distribution_failures.value)
+        exposition.counter('quorum_heartbeat_rounds_total', 'Heartbeat rounds run by the leader.', self.heartbeat_rounds.value)
+        exposition.counter('quorum_pre_votes_lost_total', 'Pre-vote rounds that did not reach a majority.', self.pre_votes_lost.value)
+        exposition.counter('quorum_elections_started_total', 'Elections this node ran as candidate.', self.elections_started.value)
+        exposition.counter('quorum_elections_won_total', 'Elections this node won.', self.elections_won.value)
+        exposition.counter('quorum_leaderless_seconds_total', 'Seconds this node spent without a known leader.', self.leaderless_seconds.value)
+        exposition.counter('quorum_lease_reads_total', 'Reads answered from the leader lease.', self.lease_hits.value)
+        exposition.counter('quorum_lease_misses_total', 'Reads that had to confirm leadership.', self.lease_misses.value)
+        exposition.histograms(
+            'quorum_append_entries_latency_seconds',
+            'Append entries round trip per follower.',
+            {(('peer', peer),): histogram for peer, histogram in self.rpc_latency.items()},
+        )
+        exposition.counters(
+            'quorum_append_entries_failures_total',
+            'Append entries calls that failed or timed out per follower.',
+            {(('peer', peer),): counter.value for peer, counter in self.rpc_failures.items()},
+        )
+        exposition.counters(
+            'quorum_role_transitions_total',
+            'Role changes of this node.',
+            {(('from', old), ('to', new)): counter.value for (old, new), counter in self.role_transitions.items()},
+        )
+
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class PrometheusExposition:
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def counter(self, name: str, help_text: str, value: float) -> None:
+        self.counters(name, help_text, {(): value})
+
+    def counters(self, name: str, help_text: str, values: Mapping[Labels, float]) -> None:
+        self._header(name, help_text, 'counter')
+        for labels, value in values.items():
+            self._sample(name, labels, value)
+
+    def gauge(self, name: str, help_text: str, value: float) -> None:
+        self._header(name, help_text, 'gauge')
+        self._sample(name, (), value)
+
+    def histogram(self, name: str, help_text: str, histogram: Histogram) -> None:
+        self.histograms(name, help_text, {(): histogram})
+
+    def histograms(self, name: str, help_text: str, histograms: Mapping[Labels, Histogram]) -> None:
+        self._header(name, help_text, 'histogram')
+        for labels, histogram in histograms.items():
+            cumulative = 0
+            for bucket, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                cumulative += bucket_count
+                self._sample(f'{name}_bucket', (*labels, ('le', _format_value(bucket))), cumulative)
+            self._sample(f'{name}_bucket', (*labels, ('le', '+Inf')), histogram.count)
+            self._sample(f'{name}_sum', labels, histogram.sum)
+            self._sample(f'{name}_count', labels, histogram.count)
+
+    def render(self) -> str:
+        return '\n'.join(self._lines) + '\n'
+
+    def _header(self, name: str, help_text: str, metric_type: str) -> None:
+        self._lines.append(f'# HELP {name} {help_text}')
+        self._lines.append(f'# TYPE {name} {metric_type}')
+
+    def _sample(self, name: str, labels: Labels, value: float) -> None:
+        if labels:
+            rendered_labels = ','.join(f'{label}="{_escape(label_value)}"' for label, label_value in labels)
+            name = f'{name}{{{rendered_labels}}}'
+        self._lines.append(f'{name} {_format_value(value)}')
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
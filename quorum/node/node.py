@@ -1,30 +1,83 @@
 from __future__ import annotations
 
 import asyncio
-import random
-from logging import getLogger
+import hashlib
+import itertools
+from dataclasses import replace
+from datetime import timedelta
 from typing import Callable, Generic
 
-from quorum.cluster.configuration import ClusterConfiguration
+from quorum.cluster.configuration import ClusterConfiguration, ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.commit_outcome import CommitHandle
+from quorum.node.message_box.ingestion_queue import IngestionQueue
 from quorum.node.message_box.message_box import MessageBox
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.message_box.snapshot import Snapshotter
+from quorum.node.message_box.write_ahead_log import WriteAheadLog
+from quorum.node.event_log import EventLog, NodeRegistered, RoleChanged, WentDown, CameBackUp, Voted, \
+    TermChanged, RunIterationStarted, EntriesReceived
+from quorum.node.leadership_transfer import LeadershipTransferOutcome, LeadershipTransferred, \
+    LeadershipTransferFailed, LeadershipTransferInProgress
+from quorum.node.metrics import NodeMetrics
 from quorum.node.node_interface import InternalNode
-from quorum.node.role.heartbeat_response import HeartbeatResponse
+from quorum.node.not_leader import NotLeader
+from quorum.node.read_index import ReadIndexUnavailable
+from quorum.node.request_vote import VoteRequest, VoteResponse
+from quorum.node.tracing import Tracer
 from quorum.node.role.role import Role
 
+_unaddressed_node_ids = itertools.count(1)
+
+
+def node_id_for(address: str | None, group_id: int = 0) -> int:
+    if address is None:
+        return next(_unaddressed_node_ids)
+    digest = hashlib.blake2b(f'{address}#{group_id}'.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 1
+
 
 class Node(InternalNode[MessageType], Generic[MessageType]):
     def __init__(
         self,
         initial_role: Callable[[Node[MessageType]], Role[MessageType]],
+        write_ahead_log: WriteAheadLog[MessageType] | None = None,
+        snapshotter: Snapshotter[MessageType] | None = None,
+        ingestion_queue: IngestionQueue[tuple[MessageType, CommitHandle]] | None = None,
+        address: str | None = None,
+        tracer: Tracer[MessageType] | None = None,
+        event_log: EventLog | None = None,
+        node_id: int | None = None,
     ) -> None:
+        self.address = address
+        self.event_log = event_log if event_log is not None else EventLog()
+        self.tracer: Tracer[MessageType] = tracer if tracer is not None else Tracer()
+        self.leader_address: str | None = None
+        self.metrics = NodeMetrics()
         self._running_task_lock = asyncio.Lock()
-        self._id = random.randint(0, 365)
+        self._role_change_listeners: list[Callable[[], None]] = []
+        self._id = node_id if node_id is not None else node_id_for(address)
+        self._current_term = 0
+        self._voted_for: int | None = None
+        self._last_leader_contact = float('-inf')
+        self._leaderless_since: float | None = None
+        self._min_election_timeout = timedelta(seconds=0)
+        self._transferring_leadership = False
+        self._leader_heard = asyncio.Event()
         self._role = initial_role(self)
         self._other_nodes: set[InternalNode[MessageType]] = set()
-        self._messages: tuple[MessageType, ...] = tuple()
+        self._leader_hint: InternalNode[MessageType] | None = None
+        self._replication_configuration = ReplicationConfiguration()
+        self._lease_duration: timedelta | None = None
         self._message_box = MessageBox(
             distribution_strategy=self._role.get_distribution_strategy(),
+            write_ahead_log=write_ahead_log,
+            snapshotter=snapshotter,
+            ingestion_queue=ingestion_queue,
+            metrics=self.metrics,
+            tracer=self.tracer,
+            current_term=lambda: self._current_term,
         )
 
     def _get_id(self) -> int:
@@ -32,55 +85,206 @@ class Node(InternalNode[MessageType], Generic[MessageType]):
 
     def register_node(self, node: InternalNode[MessageType]) -> None:
         if node != self:
-            self._log(f'registering {node}')
+            if self.event_log.enabled:
+                self.event_log.record(self._id, self._role, NodeRegistered(peer=node.metrics_label()))
             self._other_nodes.add(node)
 
     @property
     def role(self) -> Role[MessageType]:
         return self._role
 
+    @property
+    def current_term(self) -> int:
+        return self._current_term
+
+    def observe_term(self, term: int) -> None:
+        if term > self._current_term:
+            self._enter_term(term)
+            self._role.step_down()
+
+    def start_election(self) -> int:
+        self._enter_term(self._current_term + 1)
+        self._voted_for = self._id
+        return self._current_term
+
+    def _enter_term(self, term: int) -> None:
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, TermChanged(term=term))
+        self._current_term = term
+        self._voted_for = None
+
     def change_role(self, new_role: Role[MessageType]) -> None:
-        self._log(f'changing role from {self._role} to {new_role}')
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, RoleChanged(old_role=str(self._role), new_role=str(new_role)))
         self._role.stop_running()
+        self.metrics.role_transitions[(str(self._role), str(new_role))].increment()
         self._role = new_role
         self._message_box.distribution_strategy = new_role.get_distribution_strategy()
+        if self._message_box.distribution_strategy.accepts_messages():
+            self._leader_found()
+        else:
+            self._message_box.refuse_messages()
+        from quorum.node.role.candidate import Candidate
+        if isinstance(new_role, Candidate):
+            self._leader_lost()
+        for listener in self._role_change_listeners:
+            listener()
+
+    def _leader_lost(self) -> None:
+        if self._leaderless_since is None:
+            now = asyncio.get_running_loop().time()
+            self._leaderless_since = self._last_leader_contact if self._last_leader_contact > float('-inf') else now
+
+    def _leader_found(self) -> None:
+        if self._leaderless_since is not None:
+            self.metrics.leaderless_seconds.increment(asyncio.get_running_loop().time() - self._leaderless_since)
+            self._leaderless_since = None
+
+    def on_role_change(self, listener: Callable[[], None]) -> None:
+        self._role_change_listeners.append(listener)
 
     async def pause(self) -> None:
-        self._log('going down')
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, WentDown())
         await self._running_task_lock.acquire()
 
     async def unpause(self) -> None:
-        self._log('going back up')
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, CameBackUp())
         self._running_task_lock.release()
 
-    async def request_vote(self) -> bool:
-        vote = self._role.request_vote()
-        self._log(f'voting {vote}')
-        return vote
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        vote = self._decide_vote(request)
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, Voted(vote=vote))
+        return VoteResponse(term=self._current_term, granted=vote)
+
+    def _decide_vote(self, request: VoteRequest) -> bool:
+        if request.term < self._current_term:
+            return False
+        if self._heard_from_leader_recently() and not request.leadership_transfer:
+            return False
+        log = self._message_box.log
+        up_to_date = (request.last_log_term, request.last_log_index) >= (log.last_term, len(log))
+        if request.pre_vote:
+            return request.term > self._current_term and up_to_date and self._role.grants_pre_vote()
+        self.observe_term(request.term)
+        if self._voted_for not in (None, request.candidate_id) or not up_to_date:
+            return False
+        self._voted_for = request.candidate_id
+        self._role.heartbeat()
+        return True
+
+    def _heard_from_leader_recently(self) -> bool:
+        elapsed = asyncio.get_running_loop().time() - self._last_leader_contact
+        return elapsed < self._min_election_timeout.total_seconds()
 
     async def run(self, cluster_configuration: ClusterConfiguration) -> None:
-        asyncio.create_task(self._message_box.run(self._other_nodes))
-        while True:
-            async with self._running_task_lock:
-                self._log('starting new run iteration')
-                await self._role.run(
-                    other_nodes=self._other_nodes,
-                    cluster_configuration=cluster_configuration,
-                )
-
-    async def heartbeat(self) -> HeartbeatResponse:
-        self._log('receiving heartbeat')
-        return self._role.heartbeat()
+        self._replication_configuration = cluster_configuration.replication
+        self._lease_duration = cluster_configuration.lease_duration()
+        self._min_election_timeout = cluster_configuration.election_timeout.min_timeout
+        message_box_task = asyncio.create_task(self._message_box.run(
+            self._other_nodes,
+            cluster_configuration.batching,
+            cluster_configuration.replication,
+        ))
+        try:
+            while True:
+                async with self._running_task_lock:
+                    if self.event_log.enabled:
+                        self.event_log.record(self._id, self._role, RunIterationStarted())
+                    await self._role.run(
+                        other_nodes=self._other_nodes,
+                        cluster_configuration=cluster_configuration,
+                    )
+        finally:
+            message_box_task.cancel()
+
+    async def append_entries(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
+        if self.event_log.enabled:
+            self.event_log.record(self._id, self._role, EntriesReceived(prev_index=request.prev_index, entries=len(request.entries)))
+        if request.term < self._current_term:
+            return AppendEntriesResponse(success=False, match_index=len(self._message_box.log), term=self._current_term)
+        self.observe_term(request.term)
+        self._leader_found()
+        self._last_leader_contact = asyncio.get_running_loop().time()
+        self._leader_heard.set()
+        self._leader_heard = asyncio.Event()
+        self._role.heartbeat()
+        self.leader_address = request.leader_address
+        return replace(await self._message_box.replicate(request), term=self._current_term)
+
+    async def timeout_now(self, term: int) -> None:
+        if term < self._current_term or (term > self._current_term and self._heard_from_leader_recently()):
+            return
+        from quorum.node.role.candidate import Candidate
+        self.change_role(Candidate(self, term=self.start_election(), leadership_transfer=True))
+
+    async def transfer_leadership(self, target: str | None = None) -> LeadershipTransferOutcome:
+        target_node = next((node for node in self._other_nodes if node.metrics_label() == target), None)
+        if target is not None and target_node is None:
+            return LeadershipTransferFailed(reason=f'{target} is not a member of the cluster')
+        self._transferring_leadership = True
+        new_leader_heard = self._leader_heard
+        try:
+            outcome = await self._role.transfer_leadership(target_node, self._other_nodes, self._replication_configuration)
+            if isinstance(outcome, LeadershipTransferred):
+                timeout = self._replication_configuration.request_timeout.total_seconds()
+                await asyncio.wait_for(new_leader_heard.wait(), timeout=timeout)
+            return outcome
+        except asyncio.TimeoutError:
+            return LeadershipTransferFailed(reason='no new leader took over')
+        finally:
+            self._transferring_leadership = False
+
+    async def read_index(self) -> int | None:
+        return await self._role.read_index(self._other_nodes, self._replication_configuration, self._lease_duration)
+
+    async def read_messages(
+        self,
+        since_index: int = 0,
+        limit: int | None = None,
+    ) -> MessagesPage[MessageType] | ReadIndexUnavailable:
+        timeout = self._replication_configuration.request_timeout.total_seconds()
+        read_index = await self.read_index()
+        if read_index is None:
+            read_index = await self._ask_for_read_index(timeout)
+        if read_index is None:
+            return ReadIndexUnavailable()
+        try:
+            await asyncio.wait_for(self._message_box.wait_until_applied(read_index), timeout=timeout)
+        except asyncio.TimeoutError:
+            return ReadIndexUnavailable()
+        return await self._message_box.get_messages(since_index, limit)
+
+    async def _ask_for_read_index(self, timeout: float) -> int | None:
+        hint = [self._leader_hint] if self._leader_hint in self._other_nodes else []
+        for node in [*hint, *(node for node in self._other_nodes if node != self._leader_hint)]:
+            try:
+                read_index = await asyncio.wait_for(node.read_index(), timeout=timeout)
+            except Exception:
+                continue
+            if read_index is not None:
+                self._leader_hint = node
+                return read_index
+        return None
+
+    @property
+    def message_box(self) -> MessageBox[MessageType]:
+        return self._message_box
 
     def __str__(self) -> str:
         return f'{self._role} {self._id}'
 
-    def _log(self, message: str) -> None:
-        full_message = f'{self}: {message}'
-        getLogger().debug(full_message)
-
     async def send_message(self, message: MessageType) -> None:
-        await self._message_box.append(message)
+        await self.submit_message(message)
+
+    async def submit_message(self, message: MessageType) -> CommitHandle:
+        if not self._message_box.distribution_strategy.accepts_messages():
+            raise NotLeader(self.leader_address)
+        if self._transferring_leadership:
+            raise LeadershipTransferInProgress
+        return await self._message_box.append(message)
 
-    async def get_messages(self) -> tuple[MessageType, ...]:
-        return await self._message_box.get_messages()
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
+        return await self._message_box.get_messages(since_index, limit)
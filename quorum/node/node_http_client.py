@@ -1,7 +1,11 @@
 import aiohttp
 
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.commit_outcome import CommitOutcome, CommitFailed, CommitUnknown, Committed
+from quorum.node.message_box.log import NoOp
+from quorum.node.message_box.messages_page import MessagesPage
 from quorum.node.node_interface import InternalNode
-from quorum.node.role.heartbeat_response import HeartbeatResponse
+from quorum.node.request_vote import VoteRequest, VoteResponse
 
 
 class NodeHttpClient(InternalNode[str]):
@@ -9,15 +13,55 @@ class NodeHttpClient(InternalNode[str]):
         self._url = url
         self._client_session = aiohttp.ClientSession()
 
-    async def request_vote(self) -> bool:
-        async with self._client_session.post(f'{self._url}/request_vote') as response:
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        async with self._client_session.post(
+            f'{self._url}/request_vote',
+            json={
+                'term': request.term,
+                'candidate_id': request.candidate_id,
+                'last_log_index': request.last_log_index,
+                'last_log_term': request.last_log_term,
+                'pre_vote': request.pre_vote,
+                'leadership_transfer': request.leadership_transfer,
+            },
+            headers={'Content-Type': 'application/json'},
+        ) as response:
             response_data = await response.json()
-        return bool(response_data['vote'])
+        return VoteResponse(term=int(response_data['term']), granted=bool(response_data['vote']))
 
-    async def heartbeat(self) -> HeartbeatResponse:
-        async with self._client_session.post(f'{self._url}/heartbeat') as response:
+    async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+        async with self._client_session.post(
+            f'{self._url}/append_entries',
+            json={
+                'prev_index': request.prev_index,
+                'entries': [None if isinstance(entry, NoOp) else entry for entry in request.entries],
+                'leader_commit': request.leader_commit,
+                'leader_address': request.leader_address,
+                'term': request.term,
+                'prev_term': request.prev_term,
+                'entry_terms': list(request.terms),
+            },
+            headers={'Content-Type': 'application/json'},
+        ) as response:
+            response_data = await response.json()
+        return AppendEntriesResponse(
+            success=bool(response_data['success']),
+            match_index=int(response_data['match_index']),
+            term=int(response_data['term']),
+        )
+
+    async def timeout_now(self, term: int) -> None:
+        async with self._client_session.post(
+            f'{self._url}/timeout_now',
+            json={'term': term},
+            headers={'Content-Type': 'application/json'},
+        ) as response:
             await response.json()
-        return HeartbeatResponse()
+
+    async def read_index(self) -> int | None:
+        async with self._client_session.post(f'{self._url}/read_index') as response:
+            response_data = await response.json()
+        return None if response_data['read_index'] is None else int(response_data['read_index'])
 
     async def send_message(self, message: str) -> None:
         async with self._client_session.post(
@@ -27,10 +71,33 @@ class NodeHttpClient(InternalNode[str]):
         ) as response:
             await response.json()
 
-    async def get_messages(self) -> tuple[str, ...]:
-        async with self._client_session.get(f'{self._url}/get_messages') as response:
+    async def send_message_and_wait(self, message: str) -> CommitOutcome:
+        async with self._client_session.post(
+            f'{self._url}/send_message',
+            params={'wait_for_commit': 'true'},
+            json={'message': message},
+            headers={'Content-Type': 'application/json'},
+        ) as response:
+            response_data = await response.json()
+        if response.status == 504:
+            return CommitUnknown()
+        if response.status != 200:
+            return CommitFailed()
+        return Committed(index=int(response_data['index']))
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[str]:
+        params = {'since_index': since_index}
+        if limit is not None:
+            params['limit'] = limit
+        async with self._client_session.get(f'{self._url}/get_messages', params=params) as response:
             response_data = await response.json()
-        return tuple(response_data['messages'])
+        return MessagesPage(messages=tuple(response_data['messages']), next_index=int(response_data['next_index']))
+
+    async def close(self) -> None:
+        await self._client_session.close()
 
     def _get_id(self) -> int:
         return hash(self._url)
+
+    def metrics_label(self) -> str:
+        return self._url
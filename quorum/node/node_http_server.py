@@ -1,15 +1,42 @@
 import asyncio
+from dataclasses import dataclass
 from typing import Iterable
 
+import aiohttp
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response, PlainTextResponse
 from starlette.routing import Route
 from uvicorn import Server, Config
 
 from quorum.cluster.configuration import ClusterConfiguration
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.message_box.commit_outcome import CommitFailed, CommitUnknown
+from quorum.node.message_box.ingestion_queue import IngestionQueueFull
+from quorum.node.message_box.log import NO_OP
+from quorum.node.leadership_transfer import LeadershipTransferFailed, LeadershipTransferInProgress
+from quorum.node.metrics import PrometheusExposition
 from quorum.node.node import Node
 from quorum.node.node_interface import InternalNode
+from quorum.node.not_leader import NotLeader
+from quorum.node.read_index import ReadIndexUnavailable
+from quorum.node.request_vote import VoteRequest
+from quorum.node.role.leader import Leader
+
+_FORWARDED_HEADER = 'X-Quorum-Forwarded'
+
+
+@dataclass(frozen=True)
+class ProxyToLeader:
+    pass
+
+
+@dataclass(frozen=True)
+class RedirectToLeader:
+    pass
+
+
+Forwarding = ProxyToLeader | RedirectToLeader
 
 
 class NodeServer:
@@ -18,20 +45,30 @@ class NodeServer:
         node: Node[str],
         remote_nodes: Iterable[InternalNode[str]],
         cluster_configuration: ClusterConfiguration,
+        forwarding: Forwarding = ProxyToLeader(),
     ) -> None:
         self._node = node
         self._cluster_configuration = cluster_configuration
+        self._forwarding = forwarding
+        self._forwarding_session: aiohttp.ClientSession | None = None
         for remote_node in remote_nodes:
             self._node.register_node(remote_node)
 
     async def run(self, port: int) -> None:
-        asyncio.create_task(self._node.run(self._cluster_configuration))
+        node_task = asyncio.create_task(self._node.run(self._cluster_configuration))
         app = Starlette(
             routes=[
-                Route(path='/heartbeat', endpoint=self.heartbeat, methods=['POST']),
+                Route(path='/append_entries', endpoint=self.append_entries, methods=['POST']),
                 Route(path='/request_vote', endpoint=self.request_vote, methods=['POST']),
+                Route(path='/read_index', endpoint=self.read_index, methods=['POST']),
+                Route(path='/timeout_now', endpoint=self.timeout_now, methods=['POST']),
+                Route(path='/transfer_leadership', endpoint=self.transfer_leadership, methods=['POST']),
                 Route(path='/send_message', endpoint=self.send_message, methods=['POST']),
                 Route(path='/get_messages', endpoint=self.get_messages, methods=['GET']),
+                Route(path='/ingestion_queue', endpoint=self.ingestion_queue, methods=['GET']),
+                Route(path='/leader', endpoint=self.leader, methods=['GET']),
+                Route(path='/metrics', endpoint=self.metrics, methods=['GET']),
+                Route(path='/events', endpoint=self.events, methods=['GET']),
             ]
         )
         server = Server(config=Config(host='0.0.0.0', port=port, app=app))
@@ -41,19 +78,149 @@ class NodeServer:
         except asyncio.CancelledError:
             await server.shutdown()
             raise
+        finally:
+            node_task.cancel()
+            if self._forwarding_session is not None:
+                await self._forwarding_session.close()
 
-    async def heartbeat(self, request: Request) -> JSONResponse:
-        await self._node.heartbeat()
-        return JSONResponse(status_code=200, content='')
+    async def append_entries(self, request: Request) -> JSONResponse:
+        request_data = await request.json()
+        response = await self._node.append_entries(AppendEntriesRequest(
+            prev_index=int(request_data['prev_index']),
+            entries=tuple(NO_OP if entry is None else entry for entry in request_data['entries']),
+            leader_commit=int(request_data['leader_commit']),
+            leader_address=request_data.get('leader_address'),
+            term=int(request_data.get('term', 0)),
+            prev_term=int(request_data.get('prev_term', 0)),
+            entry_terms=tuple(int(term) for term in request_data['entry_terms']) if 'entry_terms' in request_data else None,
+        ))
+        return JSONResponse(
+            status_code=200,
+            content={'success': response.success, 'match_index': response.match_index, 'term': response.term},
+        )
 
     async def request_vote(self, request: Request) -> JSONResponse:
-        vote = await self._node.request_vote()
-        return JSONResponse(status_code=200, content={'vote': vote})
+        request_data = await request.json()
+        response = await self._node.request_vote(VoteRequest(
+            term=int(request_data['term']),
+            candidate_id=int(request_data['candidate_id']),
+            last_log_index=int(request_data.get('last_log_index', 0)),
+            last_log_term=int(request_data.get('last_log_term', 0)),
+            pre_vote=bool(request_data.get('pre_vote', False)),
+            leadership_transfer=bool(request_data.get('leadership_transfer', False)),
+        ))
+        return JSONResponse(status_code=200, content={'term': response.term, 'vote': response.granted})
 
-    async def send_message(self, request: Request) -> JSONResponse:
-        await self._node.send_message((await request.json())['message'])
+    async def timeout_now(self, request: Request) -> JSONResponse:
+        await self._node.timeout_now(int((await request.json())['term']))
         return JSONResponse(status_code=200, content='')
 
+    async def transfer_leadership(self, request: Request) -> JSONResponse:
+        if not isinstance(self._node.role, Leader):
+            return JSONResponse(status_code=409, content={'error': 'not the leader', 'leader': self._node.leader_address})
+        outcome = await self._node.transfer_leadership(request.query_params.get('target'))
+        if isinstance(outcome, LeadershipTransferFailed):
+            return JSONResponse(status_code=503, content={'error': outcome.reason})
+        return JSONResponse(status_code=200, content={'leader': outcome.leader})
+
+    async def read_index(self, request: Request) -> JSONResponse:
+        return JSONResponse(status_code=200, content={'read_index': await self._node.read_index()})
+
+    async def send_message(self, request: Request) -> Response:
+        try:
+            handle = await self._node.submit_message((await request.json())['message'])
+        except NotLeader:
+            return await self._forward_to_leader(request)
+        except IngestionQueueFull:
+            return JSONResponse(status_code=429, content={'error': 'too many queued messages'}, headers={'Retry-After': '1'})
+        except LeadershipTransferInProgress:
+            return JSONResponse(status_code=503, content={'error': 'leadership transfer in progress'}, headers={'Retry-After': '1'})
+        if request.query_params.get('wait_for_commit', 'false') != 'true':
+            return JSONResponse(status_code=200, content='')
+        outcome = await handle
+        if isinstance(outcome, CommitFailed):
+            return JSONResponse(status_code=503, content={'error': 'message was not committed'})
+        if isinstance(outcome, CommitUnknown):
+            return JSONResponse(status_code=504, content={'error': 'message may still be committed'})
+        return JSONResponse(status_code=200, content={'index': outcome.index})
+
+    async def _forward_to_leader(self, request: Request) -> Response:
+        leader_address = self._node.leader_address
+        if leader_address is None or _FORWARDED_HEADER in request.headers:
+            return JSONResponse(status_code=503, content={'error': 'no known leader'}, headers={'Retry-After': '1'})
+        location = f'{leader_address}{request.url.path}'
+        if request.url.query:
+            location = f'{location}?{request.url.query}'
+        if isinstance(self._forwarding, RedirectToLeader):
+            return JSONResponse(status_code=307, content={'leader': leader_address}, headers={'Location': location})
+        if self._forwarding_session is None:
+            self._forwarding_session = aiohttp.ClientSession()
+        try:
+            async with self._forwarding_session.post(
+                location,
+                data=await request.body(),
+                headers={'Content-Type': 'application/json', _FORWARDED_HEADER: '1'},
+            ) as response:
+                headers = {'Retry-After': response.headers['Retry-After']} if 'Retry-After' in response.headers else {}
+                return Response(
+                    content=await response.read(),
+                    status_code=response.status,
+                    headers=headers,
+                    media_type='application/json',
+                )
+        except aiohttp.ClientError:
+            return JSONResponse(status_code=503, content={'error': 'leader unreachable'}, headers={'Retry-After': '1'})
+
     async def get_messages(self, request: Request) -> JSONResponse:
-        messages = await self._node.get_messages()
-        return JSONResponse(status_code=200, content={'messages': list(messages)})
+        try:
+            since_index = int(request.query_params.get('since_index', 0))
+            limit = int(request.query_params['limit']) if 'limit' in request.query_params else None
+        except ValueError:
+            return JSONResponse(status_code=400, content={'error': 'since_index and limit must be integers'})
+        if since_index < 0 or (limit is not None and limit < 0):
+            return JSONResponse(status_code=400, content={'error': 'since_index and limit must not be negative'})
+        if request.query_params.get('linearizable', 'false') == 'true':
+            maybe_page = await self._node.read_messages(since_index, limit)
+            if isinstance(maybe_page, ReadIndexUnavailable):
+                return JSONResponse(status_code=503, content={'error': 'no leader confirmed the read'})
+            page = maybe_page
+        else:
+            page = await self._node.get_messages(since_index, limit)
+        return JSONResponse(status_code=200, content={'messages': list(page.messages), 'next_index': page.next_index})
+
+    async def ingestion_queue(self, request: Request) -> JSONResponse:
+        ingestion_queue = self._node.message_box.ingestion_queue
+        return JSONResponse(status_code=200, content={
+            'depth': ingestion_queue.depth,
+            'capacity': ingestion_queue.capacity,
+            'rejected': ingestion_queue.rejected,
+            'dropped': ingestion_queue.dropped,
+        })
+
+    async def leader(self, request: Request) -> JSONResponse:
+        if isinstance(self._node.role, Leader):
+            return JSONResponse(status_code=200, content={'is_leader': True, 'leader': self._node.address})
+        return JSONResponse(status_code=200, content={'is_leader': False, 'leader': self._node.leader_address})
+
+    async def metrics(self, request: Request) -> PlainTextResponse:
+        exposition = PrometheusExposition()
+        self._node.metrics.expose(exposition)
+        message_box = self._node.message_box
+        ingestion_queue = message_box.ingestion_queue
+        exposition.gauge('quorum_is_leader', 'Whether this node is the leader.', isinstance(self._node.role, Leader))
+        exposition.gauge('quorum_term', 'Current term of this node.', self._node.current_term)
+        exposition.gauge('quorum_log_length', 'Entries in the log of this node.', len(message_box.log))
+        exposition.gauge('quorum_commit_index', 'Commit index of this node.', message_box.commit_index)
+        exposition.gauge('quorum_ingestion_queue_depth', 'Messages waiting to be batched.', ingestion_queue.depth)
+        exposition.counter('quorum_ingestion_queue_rejected_total', 'Messages rejected by a full queue.', ingestion_queue.rejected)
+        exposition.counter('quorum_ingestion_queue_dropped_total', 'Messages dropped by a full queue.', ingestion_queue.dropped)
+        return PlainTextResponse(exposition.render(), media_type='text/plain; version=0.0.4')
+
+    async def events(self, request: Request) -> JSONResponse:
+        try:
+            limit = int(request.query_params['limit']) if 'limit' in request.query_params else None
+        except ValueError:
+            return JSONResponse(status_code=400, content={'error': 'limit must be an integer'})
+        if limit is not None and limit < 0:
+            return JSONResponse(status_code=400, content={'error': 'limit must not be negative'})
+        return JSONResponse(status_code=200, content={'events': self._node.event_log.dump(limit)})
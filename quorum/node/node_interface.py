@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Generic, Any
 
 from quorum.cluster.message_type import MessageType
-from quorum.node.role.heartbeat_response import HeartbeatResponse
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.request_vote import VoteRequest, VoteResponse
 
 
 class PublicNode(ABC, Generic[MessageType]):
@@ -11,17 +13,25 @@ class PublicNode(ABC, Generic[MessageType]):
         pass
 
     @abstractmethod
-    async def get_messages(self) -> tuple[MessageType, ...]:
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
         pass
 
 
 class InternalNode(ABC, Generic[MessageType]):
     @abstractmethod
-    async def request_vote(self) -> bool:
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
         pass
 
     @abstractmethod
-    async def heartbeat(self) -> HeartbeatResponse:
+    async def append_entries(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
+        pass
+
+    @abstractmethod
+    async def read_index(self) -> int | None:
+        pass
+
+    @abstractmethod
+    async def timeout_now(self, term: int) -> None:
         pass
 
     @abstractmethod
@@ -29,13 +39,16 @@ class InternalNode(ABC, Generic[MessageType]):
         pass
 
     @abstractmethod
-    async def get_messages(self) -> tuple[MessageType, ...]:
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
         pass
 
     @abstractmethod
     def _get_id(self) -> int:
         pass
 
+    def metrics_label(self) -> str:
+        return str(self._get_id())
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, InternalNode):
             return False
@@ -43,3 +56,9 @@ class InternalNode(ABC, Generic[MessageType]):
 
     def __hash__(self) -> int:
         return hash(self._get_id())
+
+
+class GroupHost(ABC, Generic[MessageType]):
+    @abstractmethod
+    def group(self, group_id: int) -> InternalNode[MessageType]:
+        pass
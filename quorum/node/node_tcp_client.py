@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from contextlib import suppress
+from datetime import timedelta
+from typing import Generic
+from urllib.parse import urlparse
+
+from quorum.cluster.message_type import MessageType
+from quorum.node import framing
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.framing import Frame
+from quorum.node.message_box.codec import Codec
+from quorum.node.message_box.log import NoOp
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node_interface import InternalNode, GroupHost
+from quorum.node.not_leader import NotLeader
+from quorum.node.request_vote import VoteRequest, VoteResponse
+
+
+class NodeTcpClient(InternalNode[MessageType], GroupHost[MessageType], Generic[MessageType]):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        codec: Codec[MessageType],
+        group_id: int = 0,
+        connection: TcpConnection | None = None,
+        request_timeout: timedelta = timedelta(seconds=5),
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._codec = codec
+        self._group_id = group_id
+        self._connection = connection if connection is not None else TcpConnection(host, port, request_timeout)
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        codec: Codec[MessageType],
+        request_timeout: timedelta = timedelta(seconds=5),
+    ) -> NodeTcpClient[MessageType]:
+        parsed_url = urlparse(url)
+        if parsed_url.hostname is None or parsed_url.port is None:
+            raise ValueError(f'{url} does not contain a host and a port')
+        return cls(parsed_url.hostname, parsed_url.port, codec, request_timeout=request_timeout)
+
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        response = await self._call(framing.REQUEST_VOTE, framing.encode_vote_request(
+            request.term,
+            request.candidate_id,
+            request.last_log_index,
+            request.last_log_term,
+            request.pre_vote,
+            request.leadership_transfer,
+        ))
+        term, granted = framing.decode_vote_response(response)
+        return VoteResponse(term=term, granted=granted)
+
+    async def append_entries(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
+        response = await self._call(framing.APPEND_ENTRIES, framing.encode_append_entries_request(
+            request.prev_index,
+            request.leader_commit,
+            (b'' if isinstance(entry, NoOp) else self._codec.encode(entry) for entry in request.entries),
+            request.leader_address,
+            request.term,
+            request.prev_term,
+            request.terms,
+            tuple(isinstance(entry, NoOp) for entry in request.entries),
+        ))
+        success, match_index, term = framing.decode_append_entries_response(response)
+        return AppendEntriesResponse(success=success, match_index=match_index, term=term)
+
+    async def timeout_now(self, term: int) -> None:
+        await self._call(framing.TIMEOUT_NOW, framing.encode_timeout_now(term))
+
+    async def read_index(self) -> int | None:
+        return framing.decode_read_index(await self._call(framing.READ_INDEX, b''))
+
+    async def send_message(self, message: MessageType) -> None:
+        await self._call(framing.SEND_MESSAGE, self._codec.encode(message))
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
+        response = await self._call(framing.GET_MESSAGES, framing.encode_get_messages_request(since_index, limit))
+        next_index, records = framing.decode_messages_page(response)
+        return MessagesPage(messages=tuple(self._codec.decode(record) for record in records), next_index=next_index)
+
+    def group(self, group_id: int) -> NodeTcpClient[MessageType]:
+        return NodeTcpClient(self._host, self._port, self._codec, group_id=group_id, connection=self._connection)
+
+    def _get_id(self) -> int:
+        return hash((f'tcp://{self._host}:{self._port}', self._group_id))
+
+    def metrics_label(self) -> str:
+        return f'tcp://{self._host}:{self._port}'
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+    async def _call(self, kind: int, payload: bytes) -> bytes:
+        return await self._connection.call(kind, payload, self._group_id)
+
+
+class TcpConnection:
+    def __init__(self, host: str, port: int, request_timeout: timedelta = timedelta(seconds=5)) -> None:
+        self._host = host
+        self._port = port
+        self._request_timeout = request_timeout
+        self._correlation_ids = itertools.count()
+        self._pending: dict[int, asyncio.Future[Frame]] = {}
+        self._writer: asyncio.StreamWriter | None = None
+        self._connecting: asyncio.Lock | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+
+    async def call(self, kind: int, payload: bytes, group_id: int = 0) -> bytes:
+        correlation_id = next(self._correlation_ids) % 2 ** 32
+        request = Frame(correlation_id=correlation_id, kind=kind, payload=payload, group_id=group_id)
+        try:
+            frame = await asyncio.wait_for(self._exchange(request), timeout=self._request_timeout.total_seconds())
+        finally:
+            self._pending.pop(correlation_id, None)
+        if frame.kind == framing.NOT_LEADER:
+            raise NotLeader(frame.payload.decode() or None)
+        if frame.kind != framing.OK:
+            raise RemoteCallFailed(frame.payload.decode(errors='replace'))
+        return frame.payload
+
+    async def _exchange(self, request: Frame) -> Frame:
+        writer = await self._connect()
+        response: asyncio.Future[Frame] = asyncio.get_running_loop().create_future()
+        self._pending[request.correlation_id] = response
+        writer.write(framing.encode_frame(request))
+        await writer.drain()
+        return await response
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        if self._writer is not None:
+            return self._writer
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+        async with self._connecting:
+            if self._writer is None:
+                reader, writer = await asyncio.open_connection(self._host, self._port)
+                self._reader_task = asyncio.create_task(self._read_responses(reader, writer))
+                self._writer = writer
+        return self._writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                frame = await framing.read_frame(reader)
+                response = self._pending.get(frame.correlation_id)
+                if response is not None and not response.done():
+                    response.set_result(frame)
+        except (asyncio.IncompleteReadError, OSError):
+            pass
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            writer.close()
+            for response in self._pending.values():
+                if not response.done():
+                    response.set_exception(ConnectionResetError(f'connection to {self._host}:{self._port} lost'))
+
+
+class RemoteCallFailed(Exception):
+    pass
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Generic, Mapping
+
+from quorum.cluster.message_type import MessageType
+from quorum.node import framing
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.consensus_groups import ConsensusGroups, UnknownGroup
+from quorum.node.framing import Frame
+from quorum.node.message_box.codec import Codec
+from quorum.node.message_box.log import NO_OP
+from quorum.node.node import Node
+from quorum.node.not_leader import NotLeader
+from quorum.node.request_vote import VoteRequest
+
+
+class NodeTcpServer(Generic[MessageType]):
+    def __init__(self, node: Node[MessageType] | ConsensusGroups[MessageType], codec: Codec[MessageType]) -> None:
+        self._nodes: Mapping[int, Node[MessageType]] = node.nodes if isinstance(node, ConsensusGroups) else {0: node}
+        self._codec = codec
+
+    async def run(self, port: int, host: str = '0.0.0.0') -> None:
+        server = await asyncio.start_server(self._serve_connection, host=host, port=port)
+        async with server:
+            await server.serve_forever()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        handlers: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                frame = await framing.read_frame(reader)
+                handler = asyncio.create_task(self._handle(frame, writer))
+                handlers.add(handler)
+                handler.add_done_callback(handlers.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for handler in handlers:
+                handler.cancel()
+            writer.close()
+
+    async def _handle(self, frame: Frame, writer: asyncio.StreamWriter) -> None:
+        try:
+            response = Frame(
+                correlation_id=frame.correlation_id,
+                kind=framing.OK,
+                payload=await self._dispatch(frame),
+                group_id=frame.group_id,
+            )
+        except NotLeader:
+            leader_address = self._nodes[frame.group_id].leader_address
+            response = Frame(
+                correlation_id=frame.correlation_id,
+                kind=framing.NOT_LEADER,
+                payload=(leader_address or '').encode(),
+                group_id=frame.group_id,
+            )
+        except Exception as exception:
+            response = Frame(
+                correlation_id=frame.correlation_id,
+                kind=framing.ERROR,
+                payload=repr(exception).encode(),
+                group_id=frame.group_id,
+            )
+        writer.write(framing.encode_frame(response))
+        await writer.drain()
+
+    async def _dispatch(self, frame: Frame) -> bytes:
+        if frame.group_id not in self._nodes:
+            raise UnknownGroup(frame.group_id)
+        node = self._nodes[frame.group_id]
+        if frame.kind == framing.APPEND_ENTRIES:
+            prev_index, leader_commit, records, leader_address, term, prev_term, entry_terms, no_ops = \
+                framing.decode_append_entries_request(frame.payload)
+            response = await node.append_entries(AppendEntriesRequest(
+                prev_index=prev_index,
+                entries=tuple(NO_OP if no_op else self._codec.decode(record) for record, no_op in zip(records, no_ops)),
+                leader_commit=leader_commit,
+                leader_address=leader_address,
+                term=term,
+                prev_term=prev_term,
+                entry_terms=entry_terms,
+            ))
+            return framing.encode_append_entries_response(response.success, response.match_index, response.term)
+        if frame.kind == framing.REQUEST_VOTE:
+            term, candidate_id, last_log_index, last_log_term, pre_vote, leadership_transfer = \
+                framing.decode_vote_request(frame.payload)
+            vote = await node.request_vote(VoteRequest(
+                term=term,
+                candidate_id=candidate_id,
+                last_log_index=last_log_index,
+                last_log_term=last_log_term,
+                pre_vote=pre_vote,
+                leadership_transfer=leadership_transfer,
+            ))
+            return framing.encode_vote_response(vote.term, vote.granted)
+        if frame.kind == framing.SEND_MESSAGE:
+            await node.send_message(self._codec.decode(frame.payload))
+            return b''
+        if frame.kind == framing.GET_MESSAGES:
+            since_index, limit = framing.decode_get_messages_request(frame.payload)
+            page = await node.get_messages(since_index, limit)
+            return framing.encode_messages_page(page.next_index, (self._codec.encode(message) for message in page.messages))
+        if frame.kind == framing.TIMEOUT_NOW:
+            await node.timeout_now(framing.decode_timeout_now(frame.payload))
+            return b''
+        if frame.kind == framing.READ_INDEX:
+            return framing.encode_read_index(await node.read_index())
+        raise UnknownRemoteCall(frame.kind)
+
+
+class UnknownRemoteCall(Exception):
+    pass
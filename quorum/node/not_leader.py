@@ -0,0 +1,2 @@
+class NotLeader(Exception):
+    pass
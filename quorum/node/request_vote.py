@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class VoteRequest:
+    term: int
+    candidate_id: int
+    last_log_index: int = 0
+    last_log_term: int = 0
+    pre_vote: bool = False
+    leadership_transfer: bool = False
+
+
+@dataclass(frozen=True)
+class VoteResponse:
+    term: int
+    granted: bool
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import typing
+from contextlib import suppress
 
-from quorum.cluster.configuration import ClusterConfiguration
+from quorum.cluster.configuration import ClusterConfiguration, ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
+from quorum.node.request_vote import VoteRequest, VoteResponse
 from quorum.node.role.leader import Leader
 
 if typing.TYPE_CHECKING:
@@ -43,47 +45,118 @@ class BallotBox:
 
 
 class Candidate(Role[MessageType], typing.Generic[MessageType]):
-    def __init__(self, node: Node[MessageType]) -> None:
+    def __init__(self, node: Node[MessageType], term: int | None = None, leadership_transfer: bool = False) -> None:
         self._node = node
+        self._term = term
+        self._leadership_transfer = leadership_transfer
+        self._stopped = False
+        self._stopping = asyncio.Event()
+        self._ballots: set[asyncio.Task[None]] = set()
+        self._failed_elections = 0
 
     async def run(
         self,
         other_nodes: set[InternalNode[MessageType]],
         cluster_configuration: ClusterConfiguration,
     ) -> None:
+        won = await self._campaign(other_nodes, cluster_configuration.replication)
+        if self._stopped:
+            return
+        if won:
+            self._node.metrics.elections_won.increment()
+            self._node.change_role(Leader(self._node))
+            return
+
+        self._failed_elections += 1
+        backoff = cluster_configuration.election_timeout.backoff(self._failed_elections)
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stopping.wait(), timeout=backoff.total_seconds())
+
+    async def _campaign(
+        self,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> bool:
+        log = self._node.message_box.log
+        last_log_index, last_log_term = len(log), log.last_term
+        term, self._term = self._term, None
+        if term is None:
+            pre_vote = VoteRequest(
+                term=self._node.current_term + 1,
+                candidate_id=self._node._get_id(),
+                last_log_index=last_log_index,
+                last_log_term=last_log_term,
+                pre_vote=True,
+            )
+            if not await self._poll(other_nodes, pre_vote, configuration):
+                self._node.metrics.pre_votes_lost.increment()
+                return False
+            if self._stopped:
+                return False
+            term = self._node.start_election()
+        self._node.metrics.elections_started.increment()
+        vote = VoteRequest(
+            term=term,
+            candidate_id=self._node._get_id(),
+            last_log_index=last_log_index,
+            last_log_term=last_log_term,
+            leadership_transfer=self._leadership_transfer,
+        )
+        return await self._poll(other_nodes, vote, configuration) and self._node.current_term == term
+
+    async def _poll(
+        self,
+        other_nodes: set[InternalNode[MessageType]],
+        request: VoteRequest,
+        configuration: ReplicationConfiguration,
+    ) -> bool:
         ballot_box = BallotBox(electorate=len(other_nodes | {self._node}))
         for node in other_nodes | {self._node}:
-            asyncio.create_task(self._collect_vote_from(
+            ballot = asyncio.create_task(self._collect_vote_from(
                 ballot_box=ballot_box,
-                node=node
+                node=node,
+                request=request,
+                timeout=configuration.request_timeout.total_seconds(),
             ))
+            self._ballots.add(ballot)
+            ballot.add_done_callback(self._ballots.discard)
 
         await ballot_box.wait_for_vote_conclusive()
-        if ballot_box.majority_reached():
-            self._node.change_role(Leader(self._node))
-            return
-
-        from quorum.node.role.subject import Subject
-        self._node.change_role(Subject(self._node))
+        return ballot_box.majority_reached()
 
     async def _collect_vote_from(
         self,
         node: InternalNode[MessageType],
         ballot_box: BallotBox,
+        request: VoteRequest,
+        timeout: float,
     ) -> None:
         if node == self._node:
             ballot_box.vote(True)
-        else:
-            ballot_box.vote(await node.request_vote())
+            return
+        tracer = self._node.tracer
+        if not request.pre_vote:
+            tracer.vote_requested(node.metrics_label())
+        try:
+            response = await asyncio.wait_for(node.request_vote(request), timeout=timeout)
+        except Exception:
+            response = VoteResponse(term=0, granted=False)
+        if not request.pre_vote:
+            tracer.vote_answered(node.metrics_label(), response.granted)
+        self._node.observe_term(response.term)
+        ballot_box.vote(response.granted)
 
     def heartbeat(self) -> HeartbeatResponse:
+        self.step_down()
         return HeartbeatResponse()
 
     def stop_running(self) -> None:
-        pass
+        self._stopped = True
+        self._stopping.set()
 
-    def request_vote(self) -> bool:
-        return False
+    def step_down(self) -> None:
+        from quorum.node.role.subject import Subject
+        self._node.change_role(Subject(self._node))
 
     def __str__(self) -> str:
         return 'candidate'
@@ -2,14 +2,17 @@ from __future__ import annotations
 import asyncio
 
 import typing
+from datetime import timedelta
 
-from quorum.cluster.configuration import ClusterConfiguration
+from quorum.cluster.configuration import ClusterConfiguration, ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
 
 if typing.TYPE_CHECKING:
     from quorum.node.node import Node
     from quorum.node.node_interface import InternalNode
     from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy
+from quorum.node.leadership_transfer import LeadershipTransferOutcome, LeadershipTransferred, LeadershipTransferFailed
+from quorum.node.message_box.distribution_strategy.leader_distribution import LeaderDistribution
 from quorum.node.role.role import Role
 from quorum.node.role.heartbeat_response import HeartbeatResponse
 
@@ -17,37 +20,105 @@ from quorum.node.role.heartbeat_response import HeartbeatResponse
 class Leader(Role[MessageType], typing.Generic[MessageType]):
     def __init__(self, node: Node[MessageType]) -> None:
         self._stopped = False
+        self._stepped_down = asyncio.Event()
         self._node = node
+        self._ready_index: int | None = None
+        self._distribution: LeaderDistribution[MessageType] = LeaderDistribution(
+            node.address,
+            node.metrics,
+            node.tracer,
+            term=node.current_term,
+            on_higher_term=node.observe_term,
+        )
 
     async def run(
         self,
         other_nodes: set[InternalNode[MessageType]],
         cluster_configuration: ClusterConfiguration,
     ) -> None:
-        for node in other_nodes:
-            if self._stopped:
-                return
-            await node.heartbeat()
+        heartbeat_period = cluster_configuration.heartbeat_period.total_seconds()
+        if self._ready_index is None:
+            self._ready_index = await self._take_over_log()
         if self._stopped:
             return
-        await asyncio.sleep(cluster_configuration.heartbeat_period.total_seconds())
+        self._node.metrics.heartbeat_rounds.increment()
+        self._distribution.heartbeat(
+            self._node.message_box,
+            other_nodes,
+            cluster_configuration.replication,
+            idle_since=asyncio.get_running_loop().time() - heartbeat_period,
+        )
+        if self._stopped:
+            return
+        await asyncio.sleep(heartbeat_period)
+
+    async def _take_over_log(self) -> int:
+        message_box = self._node.message_box
+        if message_box.commit_index < len(message_box.log):
+            return await message_box.append_no_op()
+        return len(message_box.log)
 
     def heartbeat(self) -> HeartbeatResponse:
-        from quorum.node.role.subject import Subject
-        self._node.change_role(Subject(self._node))
+        self.step_down()
         return HeartbeatResponse()
 
     def stop_running(self) -> None:
         self._stopped = True
+        self._stepped_down.set()
+        self._distribution.stop()
 
-    def request_vote(self) -> bool:
+    def step_down(self) -> None:
         from quorum.node.role.subject import Subject
         self._node.change_role(Subject(self._node))
-        return True
+
+    def grants_pre_vote(self) -> bool:
+        return False
+
+    async def read_index(
+        self,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+        lease_duration: timedelta | None,
+    ) -> int | None:
+        commit_index = self._node.message_box.commit_index
+        if self._ready_index is None or commit_index < self._ready_index:
+            return None
+        if lease_duration is not None:
+            if self._distribution.holds_lease(other_nodes, lease_duration):
+                self._node.metrics.lease_hits.increment()
+                return commit_index
+            self._node.metrics.lease_misses.increment()
+        if await self._distribution.confirm_leadership(self._node.message_box, other_nodes, configuration):
+            return commit_index
+        return None
+
+    async def transfer_leadership(
+        self,
+        target: InternalNode[MessageType] | None,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> LeadershipTransferOutcome:
+        if target is None and other_nodes:
+            target = max(other_nodes, key=self._distribution.match_index)
+        if target is None or target not in other_nodes:
+            return LeadershipTransferFailed(reason='no follower to transfer leadership to')
+        message_box = self._node.message_box
+        try:
+            await asyncio.wait_for(
+                self._distribution.catch_up(message_box, target, other_nodes, configuration),
+                timeout=configuration.commit_timeout.total_seconds(),
+            )
+        except asyncio.TimeoutError:
+            return LeadershipTransferFailed(reason=f'{target.metrics_label()} did not catch up')
+        try:
+            await asyncio.wait_for(target.timeout_now(self._node.current_term), timeout=configuration.request_timeout.total_seconds())
+            await asyncio.wait_for(self._stepped_down.wait(), timeout=configuration.request_timeout.total_seconds())
+        except Exception:
+            return LeadershipTransferFailed(reason=f'{target.metrics_label()} did not take over')
+        return LeadershipTransferred(leader=target.metrics_label())
 
     def __str__(self) -> str:
         return 'leader'
 
     def get_distribution_strategy(self) -> DistributionStrategy[MessageType]:
-        from quorum.node.message_box.distribution_strategy.leader_distribution import LeaderDistribution
-        return LeaderDistribution()
+        return self._distribution
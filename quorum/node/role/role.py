@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import typing
+from datetime import timedelta
 from abc import ABC, abstractmethod
 
-from quorum.cluster.configuration import ClusterConfiguration
+from quorum.cluster.configuration import ClusterConfiguration, ReplicationConfiguration
 from quorum.cluster.message_type import MessageType
+from quorum.node.leadership_transfer import LeadershipTransferOutcome, LeadershipTransferFailed
 from quorum.node.node_interface import InternalNode
 from quorum.node.role.heartbeat_response import HeartbeatResponse
 
@@ -25,10 +27,28 @@ class Role(ABC, typing.Generic[MessageType]):
     def stop_running(self) -> None:
         pass
 
-    @abstractmethod
-    def request_vote(self) -> bool:
+    def step_down(self) -> None:
         pass
 
+    def grants_pre_vote(self) -> bool:
+        return True
+
+    async def read_index(
+        self,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+        lease_duration: timedelta | None,
+    ) -> int | None:
+        return None
+
+    async def transfer_leadership(
+        self,
+        target: InternalNode[MessageType] | None,
+        other_nodes: set[InternalNode[MessageType]],
+        configuration: ReplicationConfiguration,
+    ) -> LeadershipTransferOutcome:
+        return LeadershipTransferFailed(reason='not the leader')
+
     def get_distribution_strategy(self) -> DistributionStrategy[MessageType]:
         from quorum.node.message_box.distribution_strategy.no_distribution import NoDistribution
         return NoDistribution()
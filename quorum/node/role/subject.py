@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import typing
+from contextlib import suppress
 
 from quorum.cluster.configuration import ClusterConfiguration
 from quorum.cluster.message_type import MessageType
@@ -18,14 +20,16 @@ class Subject(Role[MessageType], typing.Generic[MessageType]):
         self._node = node
         self._beaten = False
         self._stopped = False
-        self._voted = False
+        self._stopping = asyncio.Event()
 
     async def run(
         self,
         other_nodes: set[InternalNode[MessageType]],
         cluster_configuration: ClusterConfiguration,
     ) -> None:
-        await cluster_configuration.election_timeout.wait()
+        timeout = cluster_configuration.election_timeout.draw()
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stopping.wait(), timeout=timeout.total_seconds())
         if self._stopped:
             return
         if not self._beaten:
@@ -34,16 +38,11 @@ class Subject(Role[MessageType], typing.Generic[MessageType]):
 
     def heartbeat(self) -> HeartbeatResponse:
         self._beaten = True
-        self._voted = False
         return HeartbeatResponse()
 
     def stop_running(self) -> None:
         self._stopped = True
-
-    def request_vote(self) -> bool:
-        vote = not self._voted
-        self._voted = True
-        return vote
+        self._stopping.set()
 
     def __str__(self) -> str:
         return 'subject'
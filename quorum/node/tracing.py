@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Generic, Sequence
+
+from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.commit_outcome import CommitHandle
+
+
+class Tracer(Generic[MessageType]):
+    def enqueued(self, handle: CommitHandle) -> None:
+        pass
+
+    def appended(self, first_index: int, batch: Sequence[tuple[MessageType, CommitHandle]]) -> None:
+        pass
+
+    def append_entries_sent(self, peer: str, request: AppendEntriesRequest[MessageType]) -> None:
+        pass
+
+    def append_entries_answered(
+        self,
+        peer: str,
+        request: AppendEntriesRequest[MessageType],
+        response: AppendEntriesResponse | None,
+    ) -> None:
+        pass
+
+    def quorum_reached(self, index: int) -> None:
+        pass
+
+    def committed(self, index: int) -> None:
+        pass
+
+    def vote_requested(self, peer: str) -> None:
+        pass
+
+    def vote_answered(self, peer: str, vote: bool) -> None:
+        pass
+
+
+@dataclass
+class MessageTrace:
+    index: int
+    enqueued: float
+    appended: float
+    first_sent: float | None = None
+    acknowledged: dict[str, float] = field(default_factory=dict)
+    quorum_reached: float | None = None
+    committed: float | None = None
+
+    def breakdown(self) -> dict[str, Any]:
+        return {
+            'index': self.index,
+            'queued': self.appended - self.enqueued,
+            'until_first_send': None if self.first_sent is None else self.first_sent - self.appended,
+            'until_quorum': None if self.quorum_reached is None else self.quorum_reached - self.appended,
+            'until_commit': None if self.committed is None or self.quorum_reached is None else self.committed - self.quorum_reached,
+            'total': None if self.committed is None else self.committed - self.enqueued,
+            'acknowledged': {peer: moment - self.appended for peer, moment in self.acknowledged.items()},
+        }
+
+
+@dataclass(frozen=True)
+class RpcSpan:
+    kind: str
+    peer: str
+    started: float
+    finished: float
+    entries: int
+    outcome: str
+
+
+class TraceRecorder(Tracer[MessageType], Generic[MessageType]):
+    def __init__(self, clock: Callable[[], float] | None = None) -> None:
+        self._clock = clock if clock is not None else _loop_time
+        self._enqueued: dict[CommitHandle, float] = {}
+        self._messages: dict[int, MessageTrace] = {}
+        self._unsent_from = 0
+        self._quorum_index = 0
+        self._commit_index = 0
+        self._in_flight: dict[tuple[str, int], float] = {}
+        self._votes: dict[str, float] = {}
+        self.spans: list[RpcSpan] = []
+
+    @property
+    def messages(self) -> list[MessageTrace]:
+        return [self._messages[index] for index in sorted(self._messages)]
+
+    def enqueued(self, handle: CommitHandle) -> None:
+        self._enqueued[handle] = self._clock()
+
+    def appended(self, first_index: int, batch: Sequence[tuple[MessageType, CommitHandle]]) -> None:
+        now = self._clock()
+        for offset, (_, handle) in enumerate(batch):
+            self._messages[first_index + offset] = MessageTrace(
+                index=first_index + offset,
+                enqueued=self._enqueued.pop(handle, now),
+                appended=now,
+            )
+
+    def append_entries_sent(self, peer: str, request: AppendEntriesRequest[MessageType]) -> None:
+        now = self._clock()
+        self._in_flight[(peer, id(request))] = now
+        for index in range(max(self._unsent_from, request.prev_index), request.prev_index + len(request.entries)):
+            if index in self._messages and self._messages[index].first_sent is None:
+                self._messages[index].first_sent = now
+        self._unsent_from = max(self._unsent_from, request.prev_index + len(request.entries))
+
+    def append_entries_answered(
+        self,
+        peer: str,
+        request: AppendEntriesRequest[MessageType],
+        response: AppendEntriesResponse | None,
+    ) -> None:
+        now = self._clock()
+        started = self._in_flight.pop((peer, id(request)), now)
+        kind = 'append_entries' if request.entries else 'heartbeat'
+        outcome = 'failed' if response is None else 'accepted' if response.success else 'rejected'
+        self.spans.append(RpcSpan(kind, peer, started, now, len(request.entries), outcome))
+        if response is None or not response.success:
+            return
+        for index in range(request.prev_index, request.prev_index + len(request.entries)):
+            if index in self._messages:
+                self._messages[index].acknowledged.setdefault(peer, now)
+
+    def quorum_reached(self, index: int) -> None:
+        now = self._clock()
+        for reached in range(self._quorum_index, index):
+            if reached in self._messages:
+                self._messages[reached].quorum_reached = now
+        self._quorum_index = max(self._quorum_index, index)
+
+    def committed(self, index: int) -> None:
+        now = self._clock()
+        for committed in range(self._commit_index, index):
+            if committed in self._messages:
+                self._messages[committed].committed = now
+        self._commit_index = max(self._commit_index, index)
+
+    def vote_requested(self, peer: str) -> None:
+        self._votes[peer] = self._clock()
+
+    def vote_answered(self, peer: str, vote: bool) -> None:
+        now = self._clock()
+        self.spans.append(RpcSpan('request_vote', peer, self._votes.pop(peer, now), now, 0, 'granted' if vote else 'denied'))
+
+    def breakdowns(self) -> list[dict[str, Any]]:
+        return [trace.breakdown() for trace in self.messages]
+
+    def dump(self, path: Path) -> None:
+        with path.open('w') as file:
+            for breakdown in self.breakdowns():
+                file.write(json.dumps({'type': 'message', **breakdown}) + '\n')
+            for span in self.spans:
+                file.write(json.dumps({'type': 'rpc', **asdict(span)}) + '\n')
+
+
+def _loop_time() -> float:
+    return asyncio.get_running_loop().time()
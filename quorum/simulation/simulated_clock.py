@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import selectors
+from datetime import timedelta
+from itertools import count
+from typing import Any, Coroutine, Iterator, Mapping, TypeVar
+
+Result = TypeVar('Result')
+
+
+class SimulatedClock:
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+        self.random = random.Random(seed)
+        self._now = 0.0
+
+    @property
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, duration: float) -> None:
+        self._now += duration
+
+    def randomization(self) -> Iterator[float]:
+        return (self.random.random() for _ in count())
+
+    def run(self, main: Coroutine[Any, Any, Result], timeout: timedelta | None = None) -> Result:
+        loop = _SimulatedEventLoop(self)
+        try:
+            if timeout is not None:
+                return loop.run_until_complete(asyncio.wait_for(main, timeout=timeout.total_seconds()))
+            return loop.run_until_complete(main)
+        finally:
+            remaining_tasks = asyncio.all_tasks(loop)
+            for task in remaining_tasks:
+                task.cancel()
+            if remaining_tasks:
+                loop.run_until_complete(asyncio.gather(*remaining_tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+class _SimulatedEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self, clock: SimulatedClock) -> None:
+        self._simulated_clock = clock
+        super().__init__(_InstantSelector(clock))
+
+    def time(self) -> float:
+        return self._simulated_clock.now
+
+
+class _InstantSelector(selectors.BaseSelector):
+    def __init__(self, clock: SimulatedClock) -> None:
+        self._clock = clock
+        self._selector = selectors.DefaultSelector()
+
+    def register(self, fileobj: Any, events: int, data: Any = None) -> selectors.SelectorKey:
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj: Any) -> selectors.SelectorKey:
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj: Any, events: int, data: Any = None) -> selectors.SelectorKey:
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: float | None = None) -> list[tuple[selectors.SelectorKey, int]]:
+        if timeout is None:
+            return self._selector.select(None)
+        ready = self._selector.select(0)
+        if not ready and timeout > 0:
+            self._clock.advance(timeout)
+        return ready
+
+    def get_map(self) -> Mapping[Any, selectors.SelectorKey]:
+        return self._selector.get_map()
+
+    def close(self) -> None:
+        self._selector.close()
@@ -1,24 +1,114 @@
+import argparse
 import asyncio
 import logging
 import math
-import sys
 from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlparse
 
-from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout, LeaseConfiguration
+from quorum.node.event_log import EventLog
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.ingestion_queue import IngestionQueue, OverflowPolicy, BlockWhenFull, RejectWhenFull, \
+    DropOldestWhenFull
+from quorum.node.message_box.snapshot import Snapshotter, SnapshotTrigger, SnapshotEveryEntries, SnapshotEveryBytes
+from quorum.node.message_box.write_ahead_log import WriteAheadLog, Durability, FsyncPerBatch, FsyncInterval, NoFsync
 from quorum.node.node import Node
 from quorum.node.node_http_client import NodeHttpClient
-from quorum.node.node_http_server import NodeServer
+from quorum.node.node_http_server import NodeServer, ProxyToLeader, RedirectToLeader
+from quorum.node.node_interface import InternalNode
+from quorum.node.node_tcp_client import NodeTcpClient
+from quorum.node.node_tcp_server import NodeTcpServer
 from quorum.node.role.subject import Subject
 
 
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('urls', nargs='*')
+    parser.add_argument('port', type=int)
+    parser.add_argument('--transport', choices=('http', 'tcp'), default='http')
+    parser.add_argument('--rpc-port', type=int, default=None)
+    parser.add_argument('--data-dir', type=Path, default=None)
+    parser.add_argument('--durability', choices=('batch', 'interval', 'none'), default='batch')
+    parser.add_argument('--fsync-interval-ms', type=int, default=10)
+    parser.add_argument('--leader-leases', action='store_true')
+    parser.add_argument('--advertised-url', default=None)
+    parser.add_argument('--forwarding', choices=('proxy', 'redirect'), default='proxy')
+    parser.add_argument('--max-queued-messages', type=int, default=None)
+    parser.add_argument('--overflow', choices=('block', 'reject', 'drop-oldest'), default='reject')
+    parser.add_argument('--event-log-size', type=int, default=1000)
+    snapshot_trigger = parser.add_mutually_exclusive_group()
+    snapshot_trigger.add_argument('--snapshot-every-entries', type=int, default=100_000)
+    snapshot_trigger.add_argument('--snapshot-every-bytes', type=int, default=None)
+    return parser.parse_args()
+
+
+def get_durability(arguments: argparse.Namespace) -> Durability:
+    if arguments.durability == 'interval':
+        return FsyncInterval(interval=timedelta(milliseconds=arguments.fsync_interval_ms))
+    if arguments.durability == 'none':
+        return NoFsync()
+    return FsyncPerBatch()
+
+
+def get_snapshot_trigger(arguments: argparse.Namespace) -> SnapshotTrigger:
+    if arguments.snapshot_every_bytes is not None:
+        return SnapshotEveryBytes(bytes=arguments.snapshot_every_bytes)
+    return SnapshotEveryEntries(entries=arguments.snapshot_every_entries)
+
+
+def get_overflow_policy(arguments: argparse.Namespace) -> OverflowPolicy:
+    if arguments.overflow == 'block':
+        return BlockWhenFull()
+    if arguments.overflow == 'drop-oldest':
+        return DropOldestWhenFull()
+    return RejectWhenFull()
+
+
+def get_rpc_port(arguments: argparse.Namespace) -> int:
+    return int(arguments.rpc_port) if arguments.rpc_port is not None else int(arguments.port) + 1
+
+
+def get_rpc_url(url: str, rpc_port_offset: int) -> str:
+    parsed_url = urlparse(url)
+    if parsed_url.scheme == 'tcp' or parsed_url.port is None:
+        return url
+    return f'tcp://{parsed_url.hostname}:{parsed_url.port + rpc_port_offset}'
+
+
+def create_remote_client(url: str, arguments: argparse.Namespace) -> InternalNode[str]:
+    if arguments.transport == 'tcp':
+        return NodeTcpClient[str].from_url(get_rpc_url(url, get_rpc_port(arguments) - arguments.port), JsonCodec())
+    return NodeHttpClient(url)
+
+
 async def main() -> None:
-    urls = sys.argv[1:-1]
-    port = int(sys.argv[-1])
+    arguments = parse_arguments()
     remote_clients = [
-        NodeHttpClient(url)
-        for url in urls
+        create_remote_client(url, arguments)
+        for url in arguments.urls
     ]
-    local_node = Node(lambda node: Subject[str](node))
+    write_ahead_log = None
+    snapshotter = None
+    if arguments.data_dir is not None:
+        write_ahead_log = WriteAheadLog[str](
+            directory=arguments.data_dir,
+            codec=JsonCodec(),
+            durability=get_durability(arguments),
+        )
+        snapshotter = Snapshotter[str](
+            directory=arguments.data_dir,
+            codec=JsonCodec(),
+            trigger=get_snapshot_trigger(arguments),
+        )
+    local_node = Node(
+        lambda node: Subject[str](node),
+        write_ahead_log=write_ahead_log,
+        snapshotter=snapshotter,
+        ingestion_queue=IngestionQueue(capacity=arguments.max_queued_messages, overflow=get_overflow_policy(arguments)),
+        address=arguments.advertised_url or f'http://localhost:{arguments.port}',
+        event_log=EventLog(capacity=arguments.event_log_size),
+    )
 
     logger = logging.getLogger()
     if len(logger.handlers) == 0:
@@ -36,9 +126,17 @@ async def main() -> None:
                 min_timeout=timedelta(seconds=3)
             ),
             heartbeat_period=timedelta(seconds=1),
-        )
+            leases=LeaseConfiguration(enabled=arguments.leader_leases),
+        ),
+        forwarding=RedirectToLeader() if arguments.forwarding == 'redirect' else ProxyToLeader(),
     )
-    await server.run(port)
+    if arguments.transport == 'tcp':
+        await asyncio.gather(
+            server.run(arguments.port),
+            NodeTcpServer(local_node, JsonCodec()).run(get_rpc_port(arguments)),
+        )
+    else:
+        await server.run(arguments.port)
     await asyncio.sleep(math.inf)
 
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
-from typing import Generic
+from typing import Callable, Generic
 
 from quorum.cluster.configuration import ClusterConfiguration
 from quorum.cluster.message_type import MessageType
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.messages_page import MessagesPage
 from quorum.node.node import Node
 from quorum.node.node_interface import InternalNode
-from quorum.node.role.heartbeat_response import HeartbeatResponse
+from quorum.node.read_index import ReadIndexUnavailable
+from quorum.node.request_vote import VoteRequest, VoteResponse
 from quorum.node.role.role import Role
 
 
@@ -15,6 +18,7 @@ class DownableNode(InternalNode[MessageType], Generic[MessageType]):
     def __init__(self, node: Node[MessageType]) -> None:
         self._actual_node = node
         self._down = False
+        self._role_change_listeners: list[Callable[[], None]] = []
 
     def _get_id(self) -> int:
         return self._actual_node._get_id()
@@ -22,15 +26,34 @@ class DownableNode(InternalNode[MessageType], Generic[MessageType]):
     def register_node(self, node: InternalNode[MessageType]) -> None:
         self._actual_node.register_node(node)
 
-    async def request_vote(self) -> bool:
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
         if self._down:
-            return False
-        return await self._actual_node.request_vote()
+            return VoteResponse(term=0, granted=False)
+        return await self._actual_node.request_vote(request)
 
-    async def heartbeat(self) -> HeartbeatResponse:
+    async def append_entries(self, request: AppendEntriesRequest[MessageType]) -> AppendEntriesResponse:
         if self._down:
-            return HeartbeatResponse()
-        return await self._actual_node.heartbeat()
+            return AppendEntriesResponse(success=False, match_index=0)
+        return await self._actual_node.append_entries(request)
+
+    async def timeout_now(self, term: int) -> None:
+        if self._down:
+            return
+        await self._actual_node.timeout_now(term)
+
+    async def read_index(self) -> int | None:
+        if self._down:
+            return None
+        return await self._actual_node.read_index()
+
+    async def read_messages(
+        self,
+        since_index: int = 0,
+        limit: int | None = None,
+    ) -> MessagesPage[MessageType] | ReadIndexUnavailable:
+        if self._down:
+            return ReadIndexUnavailable()
+        return await self._actual_node.read_messages(since_index, limit)
 
     async def send_message(self, message: MessageType) -> None:
         if self._down:
@@ -38,10 +61,14 @@ class DownableNode(InternalNode[MessageType], Generic[MessageType]):
             return
         return await self._actual_node.send_message(message)
 
-    async def get_messages(self) -> tuple[MessageType, ...]:
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[MessageType]:
         if self._down:
-            return tuple()
-        return await self._actual_node.get_messages()
+            return MessagesPage(messages=tuple(), next_index=since_index)
+        return await self._actual_node.get_messages(since_index, limit)
+
+    @property
+    def current_term(self) -> int:
+        return self._actual_node.current_term
 
     @property
     def role(self) -> Role[MessageType] | NodeIsDown:
@@ -49,14 +76,24 @@ class DownableNode(InternalNode[MessageType], Generic[MessageType]):
             return NodeIsDown()
         return self._actual_node.role
 
+    def on_role_change(self, listener: Callable[[], None]) -> None:
+        self._role_change_listeners.append(listener)
+        self._actual_node.on_role_change(listener)
+
     async def take_down(self) -> None:
         self._down = True
+        self._notify_role_change()
         await self._actual_node.pause()
 
     async def bring_back_up(self) -> None:
         self._down = False
+        self._notify_role_change()
         await self._actual_node.unpause()
 
+    def _notify_role_change(self) -> None:
+        for listener in self._role_change_listeners:
+            listener()
+
     async def run(self, cluster_configuration: ClusterConfiguration) -> None:
         await self._actual_node.run(cluster_configuration)
 
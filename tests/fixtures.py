@@ -23,6 +23,7 @@ def get_frozen_cluster(
             election_timeout=election_timeout,
             heartbeat_period=heartbeat_period,
         ),
+        check_single_leader=True,
     )
 
 
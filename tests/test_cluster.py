@@ -0,0 +1,52 @@
+import unittest
+from datetime import timedelta
+
+from quorum.cluster.cluster import Cluster, NoLeaderInCluster, TooManyLeaders
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+from tests.fixtures import create_leader_node, create_subject_node
+
+
+class TestCluster(unittest.IsolatedAsyncioTestCase):
+    def create_cluster(self, nodes: set[Node[str]], check_single_leader: bool = False) -> Cluster[str]:
+        return Cluster[str](
+            nodes=nodes,
+            cluster_configuration=ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=1),
+            ),
+            check_single_leader=check_single_leader,
+        )
+
+    async def test_leader_is_remembered_between_lookups(self) -> None:
+        leader, subject = create_leader_node(), create_subject_node()
+        cluster = self.create_cluster({leader, subject})
+
+        self.assertIs(cluster.take_me_to_a_leader(), leader)
+        subject._role = Leader(subject)
+
+        self.assertIs(cluster.take_me_to_a_leader(), leader)
+
+    async def test_role_change_makes_cluster_look_for_the_leader_again(self) -> None:
+        leader, subject = create_leader_node(), create_subject_node()
+        cluster = self.create_cluster({leader, subject})
+        cluster.take_me_to_a_leader()
+
+        leader.change_role(Subject(leader))
+        no_leader = cluster.take_me_to_a_leader()
+        subject.change_role(Leader(subject))
+
+        self.assertEqual(no_leader, NoLeaderInCluster())
+        self.assertIs(cluster.take_me_to_a_leader(), subject)
+
+    async def test_single_leader_check_looks_at_every_node(self) -> None:
+        leader, subject = create_leader_node(), create_subject_node()
+        cluster = self.create_cluster({leader, subject}, check_single_leader=True)
+        cluster.take_me_to_a_leader()
+
+        subject._role = Leader(subject)
+
+        with self.assertRaises(TooManyLeaders):
+            cluster.take_me_to_a_leader()
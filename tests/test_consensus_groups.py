@@ -0,0 +1,186 @@
+import asyncio
+import socket
+import unittest
+from collections import Counter
+from datetime import timedelta
+from typing import Any
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.consensus_groups import ConsensusGroups, KeyRouter, NotGroupLeader, UnknownGroup
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.commit_outcome import Committed
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node import Node
+from quorum.node.node_tcp_client import NodeTcpClient, RemoteCallFailed
+from quorum.node.node_tcp_server import NodeTcpServer
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+
+GROUPS = [0, 1, 2, 3, 4, 5]
+
+
+def create_host(host_index: int, hosts: int) -> ConsensusGroups[str]:
+    return ConsensusGroups[str](GROUPS, lambda group_id, node_id: Node(
+        lambda node: Leader(node) if group_id % hosts == host_index else Subject(node),
+        node_id=node_id,
+    ))
+
+
+def unused_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('localhost', 0))
+        return int(probe.getsockname()[1])
+
+
+class TestKeyRouter(unittest.TestCase):
+    def test_same_key_always_goes_to_the_same_group(self) -> None:
+        self.assertEqual(KeyRouter(GROUPS).group_for('user-42'), KeyRouter(GROUPS).group_for('user-42'))
+
+    def test_keys_spread_over_all_groups(self) -> None:
+        router = KeyRouter(GROUPS)
+
+        counts = Counter(router.group_for(f'user-{index}') for index in range(6000))
+
+        self.assertEqual(set(counts), set(GROUPS))
+        self.assertTrue(all(count > 700 for count in counts.values()))
+
+    def test_adding_a_group_only_moves_keys_to_the_new_group(self) -> None:
+        before, after = KeyRouter(GROUPS), KeyRouter([*GROUPS, 6])
+
+        moved = [key for key in map(str, range(1000)) if before.group_for(key) != after.group_for(key)]
+
+        self.assertTrue(all(after.group_for(key) == 6 for key in moved))
+
+    def test_router_needs_a_group(self) -> None:
+        with self.assertRaises(ValueError):
+            KeyRouter([])
+
+
+class TestConsensusGroups(unittest.IsolatedAsyncioTestCase):
+    async def _stop(self, task: asyncio.Task[Any]) -> None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def start_hosts(self, count: int) -> list[ConsensusGroups[str]]:
+        hosts = [create_host(index, count) for index in range(count)]
+        for host in hosts:
+            for other_host in hosts:
+                host.register_host(other_host)
+        for host in hosts:
+            task = asyncio.create_task(host.run(ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=10)),
+                heartbeat_period=timedelta(seconds=0.01),
+            )))
+            self.addAsyncCleanup(self._stop, task)
+        return hosts
+
+    async def test_leaders_are_spread_across_hosts(self) -> None:
+        hosts = await self.start_hosts(3)
+
+        self.assertListEqual([host.led_groups() for host in hosts], [[0, 3], [1, 4], [2, 5]])
+
+    async def test_message_is_replicated_within_its_group_only(self) -> None:
+        hosts = await self.start_hosts(3)
+        group_id = hosts[0].group_for('user-42')
+        leading_host = next(host for host in hosts if host.leads('user-42'))
+
+        outcome = await (await leading_host.submit_message('user-42', 'Milkshake'))
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(outcome, Committed(0))
+        for host in hosts:
+            for other_group_id, node in host.nodes.items():
+                expected = ('Milkshake',) if other_group_id == group_id else ()
+                self.assertEqual((await node.get_messages()).messages, expected)
+
+    async def test_groups_commit_independently(self) -> None:
+        hosts = await self.start_hosts(3)
+        keys = [f'user-{index}' for index in range(60)]
+
+        async def send(key: str) -> Any:
+            host = next(host for host in hosts if host.leads(key))
+            return await (await host.submit_message(key, key))
+
+        outcomes = await asyncio.gather(*(send(key) for key in keys))
+        await asyncio.sleep(0.1)
+
+        self.assertTrue(all(isinstance(outcome, Committed) for outcome in outcomes))
+        committed = [len((await node.get_messages()).messages) for node in hosts[0].nodes.values()]
+        self.assertEqual(sum(committed), len(keys))
+
+    async def test_host_refuses_keys_of_groups_it_does_not_lead(self) -> None:
+        hosts = await self.start_hosts(3)
+        following_host = next(host for host in hosts if not host.leads('user-42'))
+
+        with self.assertRaises(NotGroupLeader):
+            await following_host.submit_message('user-42', 'Milkshake')
+
+    async def test_nodes_of_one_group_on_different_hosts_have_different_ids(self) -> None:
+        hosts = [
+            ConsensusGroups[str](GROUPS, lambda group_id, node_id: Node(lambda node: Subject(node), node_id=node_id), address=address)
+            for address in ('tcp://host-a:8090', 'tcp://host-b:8090')
+        ]
+
+        self.assertNotEqual(hosts[0].group(1), hosts[1].group(1))
+        self.assertEqual(len({node for host in hosts for node in host.nodes.values()}), 2 * len(GROUPS))
+
+    async def test_unknown_group(self) -> None:
+        with self.assertRaises(UnknownGroup):
+            create_host(0, 1).group(len(GROUPS))
+
+
+class TestConsensusGroupsOverTcp(unittest.IsolatedAsyncioTestCase):
+    async def _stop(self, task: asyncio.Task[Any]) -> None:
+        task.cancel()
+        await asyncio.sleep(0.1)
+
+    async def start_server(self, host: ConsensusGroups[str]) -> NodeTcpClient[str]:
+        port = unused_port()
+        server_task = asyncio.create_task(NodeTcpServer(host, JsonCodec()).run(port=port, host='localhost'))
+        self.addAsyncCleanup(self._stop, server_task)
+        await asyncio.sleep(0.1)
+        client = NodeTcpClient.from_url(f'tcp://localhost:{port}', JsonCodec())
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def until_followers_commit(self, follower: ConsensusGroups[str], leader: ConsensusGroups[str], timeout: float = 5) -> None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            if all(node.message_box.commit_index >= leader.group(group_id).message_box.commit_index
+                   for group_id, node in follower.nodes.items()):
+                return
+            await asyncio.sleep(0.01)
+
+    async def test_calls_are_routed_to_their_group(self) -> None:
+        host = ConsensusGroups[str](GROUPS, lambda group_id, node_id: Node(lambda node: Subject(node), node_id=node_id))
+        client = await self.start_server(host)
+
+        await client.group(4).append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=1))
+
+        self.assertEqual(await client.group(4).get_messages(), MessagesPage(messages=('Milkshake',), next_index=1))
+        self.assertEqual(await client.group(0).get_messages(), MessagesPage(messages=(), next_index=0))
+
+    async def test_unknown_group_is_reported(self) -> None:
+        client = await self.start_server(create_host(0, 1))
+
+        with self.assertRaises(RemoteCallFailed):
+            await client.group(len(GROUPS)).get_messages()
+
+    async def test_groups_replicate_over_one_shared_connection(self) -> None:
+        follower = ConsensusGroups[str](GROUPS, lambda group_id, node_id: Node(lambda node: Subject(node), node_id=node_id))
+        client = await self.start_server(follower)
+        leader = create_host(0, 1)
+        leader.register_host(client)
+        leader_task = asyncio.create_task(leader.run(ClusterConfiguration(
+            election_timeout=ElectionTimeout(timedelta(seconds=10)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )))
+        self.addAsyncCleanup(self._stop, leader_task)
+
+        outcomes = [await (await leader.submit_message(str(group_id), str(group_id))) for group_id in range(12)]
+        await self.until_followers_commit(follower, leader)
+
+        self.assertTrue(all(isinstance(outcome, Committed) for outcome in outcomes))
+        for group_id, node in follower.nodes.items():
+            self.assertEqual(await node.get_messages(), await leader.group(group_id).get_messages())
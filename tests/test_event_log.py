@@ -0,0 +1,74 @@
+import logging
+import unittest
+
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.event_log import EventLog, Voted, EntriesReceived
+from quorum.node.node import Node
+from quorum.node.request_vote import VoteRequest
+from quorum.node.role.subject import Subject
+
+
+class CountingSubject(Subject[str]):
+    formatted = 0
+
+    def __str__(self) -> str:
+        CountingSubject.formatted += 1
+        return 'subject'
+
+
+class TestEventLog(unittest.IsolatedAsyncioTestCase):
+    def create_logger(self, level: int) -> logging.Logger:
+        logger = logging.getLogger(f'test_event_log.{self.id()}')
+        logger.setLevel(level)
+        logger.propagate = False
+        return logger
+
+    def test_disabled_log_is_not_enabled(self) -> None:
+        self.assertFalse(EventLog(logger=self.create_logger(logging.WARNING)).enabled)
+        self.assertTrue(EventLog(capacity=1, logger=self.create_logger(logging.WARNING)).enabled)
+        self.assertTrue(EventLog(logger=self.create_logger(logging.DEBUG)).enabled)
+
+    def test_ring_buffer_keeps_the_most_recent_events(self) -> None:
+        event_log = EventLog(capacity=2, logger=self.create_logger(logging.WARNING))
+
+        for vote in (True, False, True):
+            event_log.record(1, 'subject', Voted(vote=vote))
+
+        self.assertListEqual([event.event for event in event_log.recent()], [Voted(vote=False), Voted(vote=True)])
+        self.assertListEqual([event.event for event in event_log.recent(1)], [Voted(vote=True)])
+
+    async def test_disabled_log_formats_nothing_on_the_hot_path(self) -> None:
+        node: Node[str] = Node(lambda node: CountingSubject(node), event_log=EventLog(logger=self.create_logger(logging.WARNING)))
+        CountingSubject.formatted = 0
+
+        await node.request_vote(VoteRequest(term=0, candidate_id=1000))
+        await node.append_entries(AppendEntriesRequest(prev_index=0, entries=tuple(), leader_commit=0))
+        await node.pause()
+
+        self.assertEqual(CountingSubject.formatted, 0)
+        self.assertListEqual(node.event_log.recent(), [])
+
+    def test_debug_logging_formats_the_event(self) -> None:
+        logger = self.create_logger(logging.DEBUG)
+        event_log = EventLog(logger=logger)
+
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            event_log.record(7, 'subject', Voted(vote=True))
+
+        self.assertListEqual(logs.output, [f'DEBUG:{logger.name}:subject 7: voting True'])
+
+    async def test_node_records_typed_events(self) -> None:
+        node: Node[str] = Node(lambda node: Subject(node), event_log=EventLog(capacity=10))
+
+        await node.request_vote(VoteRequest(term=1, candidate_id=1000))
+        await node.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+
+        self.assertListEqual(
+            [event.as_dict() | {'at': 0} for event in node.event_log.recent()],
+            [
+                {'at': 0, 'node_id': node._get_id(), 'role': 'subject', 'event': 'TermChanged', 'term': 1},
+                {'at': 0, 'node_id': node._get_id(), 'role': 'subject', 'event': 'Voted', 'vote': True},
+                {'at': 0, 'node_id': node._get_id(), 'role': 'subject', 'event': 'EntriesReceived', 'prev_index': 0, 'entries': 1},
+            ],
+        )
+        self.assertIsInstance(node.event_log.recent()[2].event, EntriesReceived)
@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+from quorum.node.message_box.commit_outcome import CommitFailed
+from quorum.node.message_box.distribution_strategy.no_distribution import NoDistribution
+from quorum.node.message_box.ingestion_queue import IngestionQueue, RejectWhenFull, DropOldestWhenFull, \
+    IngestionQueueFull
+from quorum.node.message_box.message_box import MessageBox
+
+
+class TestIngestionQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_blocks_when_full_by_default(self) -> None:
+        queue: IngestionQueue[str] = IngestionQueue(capacity=1)
+        await queue.put('Milkshake')
+
+        blocked_put = asyncio.create_task(queue.put('Fries'))
+        await asyncio.sleep(0.01)
+        blocked = not blocked_put.done()
+        await queue.get()
+        await blocked_put
+
+        self.assertTrue(blocked)
+        self.assertEqual(queue.depth, 1)
+
+    async def test_rejects_when_full(self) -> None:
+        queue: IngestionQueue[str] = IngestionQueue(capacity=1, overflow=RejectWhenFull())
+        await queue.put('Milkshake')
+
+        with self.assertRaises(IngestionQueueFull):
+            await queue.put('Fries')
+
+        self.assertEqual(queue.rejected, 1)
+        self.assertEqual(await queue.get(), 'Milkshake')
+
+    async def test_drops_oldest_when_full(self) -> None:
+        queue: IngestionQueue[str] = IngestionQueue(capacity=2, overflow=DropOldestWhenFull())
+        await queue.put('Milkshake')
+        await queue.put('Fries')
+
+        dropped = await queue.put('Burger')
+
+        self.assertEqual(dropped, 'Milkshake')
+        self.assertEqual(queue.dropped, 1)
+        self.assertListEqual([queue.get_nowait(), queue.get_nowait()], ['Fries', 'Burger'])
+
+    async def test_unbounded_without_capacity(self) -> None:
+        queue: IngestionQueue[int] = IngestionQueue(overflow=RejectWhenFull())
+
+        for index in range(10_000):
+            await queue.put(index)
+
+        self.assertEqual(queue.depth, 10_000)
+
+    def test_capacity_below_one_is_rejected(self) -> None:
+        for capacity in (0, -1):
+            with self.subTest(capacity=capacity), self.assertRaises(ValueError):
+                IngestionQueue[str](capacity=capacity)
+
+    async def test_dropped_message_fails_its_commit_handle(self) -> None:
+        message_box: MessageBox[str] = MessageBox(
+            distribution_strategy=NoDistribution(),
+            ingestion_queue=IngestionQueue(capacity=1, overflow=DropOldestWhenFull()),
+        )
+
+        dropped_handle = await message_box.append('Milkshake')
+        await message_box.append('Fries')
+
+        self.assertEqual(await dropped_handle, CommitFailed())
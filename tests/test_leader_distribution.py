@@ -0,0 +1,214 @@
+import asyncio
+import itertools
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from quorum.cluster.configuration import BatchConfiguration, ReplicationConfiguration
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.distribution_strategy.leader_distribution import LeaderDistribution
+from quorum.node.message_box.distribution_strategy.no_distribution import NoDistribution
+from quorum.node.message_box.message_box import MessageBox
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node_interface import InternalNode
+from quorum.node.request_vote import VoteRequest, VoteResponse
+
+_ids = itertools.count()
+
+
+class Follower(InternalNode[str]):
+    def __init__(self, delay: float = 0.0) -> None:
+        self.message_box: MessageBox[str] = MessageBox(distribution_strategy=NoDistribution())
+        self.delay = delay
+        self.down = False
+        self.requests: list[AppendEntriesRequest[str]] = []
+        self._id = next(_ids)
+
+    async def request_vote(self, request: VoteRequest) -> VoteResponse:
+        return VoteResponse(term=0, granted=False)
+
+    async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+        self.requests.append(request)
+        if self.down:
+            raise ConnectionError
+        await asyncio.sleep(self.delay)
+        return await self.message_box.replicate(request)
+
+    async def timeout_now(self, term: int) -> None:
+        pass
+
+    async def read_index(self) -> int | None:
+        return None
+
+    async def send_message(self, message: str) -> None:
+        pass
+
+    async def get_messages(self, since_index: int = 0, limit: int | None = None) -> MessagesPage[str]:
+        return await self.message_box.get_messages(since_index, limit)
+
+    def _get_id(self) -> int:
+        return self._id
+
+
+class TestLeaderDistribution(unittest.IsolatedAsyncioTestCase):
+    async def start_leader(
+        self,
+        followers: set[InternalNode[str]],
+        configuration: ReplicationConfiguration = ReplicationConfiguration(),
+    ) -> tuple[MessageBox[str], LeaderDistribution[str]]:
+        distribution: LeaderDistribution[str] = LeaderDistribution()
+        message_box = MessageBox(distribution_strategy=distribution)
+        run_task = asyncio.create_task(message_box.run(followers, BatchConfiguration(), configuration))
+        self.addAsyncCleanup(self._stop, run_task, distribution)
+        return message_box, distribution
+
+    async def _stop(self, task: asyncio.Task[Any], distribution: LeaderDistribution[str]) -> None:
+        task.cancel()
+        distribution.stop()
+        await asyncio.sleep(0)
+
+    async def test_slow_follower_does_not_hold_back_commit(self) -> None:
+        fast, slow = Follower(), Follower(delay=5)
+        message_box, _ = await self.start_leader({fast, slow})
+
+        await message_box.append('Milkshake')
+        await asyncio.sleep(0.05)
+
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Milkshake',))
+
+    async def test_match_index_tracks_what_each_follower_has(self) -> None:
+        fast, slow = Follower(), Follower(delay=5)
+        message_box, distribution = await self.start_leader({fast, slow})
+
+        for message in ('Milkshake', 'Fries'):
+            await message_box.append(message)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(distribution.match_index(fast), 2)
+        self.assertEqual(distribution.match_index(slow), 0)
+
+    async def test_lagging_follower_is_caught_up_from_its_own_position(self) -> None:
+        fast, lagging = Follower(), Follower()
+        lagging.down = True
+        message_box, distribution = await self.start_leader(
+            {fast, lagging},
+            ReplicationConfiguration(max_backoff=timedelta(seconds=0.02)),
+        )
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await message_box.append(message)
+        await asyncio.sleep(0.05)
+        lagging.down = False
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(distribution.match_index(lagging), 3)
+        self.assertTupleEqual(tuple(lagging.message_box.log.slice(0, 3)), ('Milkshake', 'Fries', 'Burger'))
+
+    async def test_entries_of_an_earlier_term_are_only_committed_with_one_of_the_current_term(self) -> None:
+        followers: set[InternalNode[str]] = {Follower(), Follower()}
+        distribution: LeaderDistribution[str] = LeaderDistribution(term=2)
+        message_box = MessageBox(distribution_strategy=distribution, current_term=lambda: 2)
+        for box in [message_box, *(follower.message_box for follower in followers if isinstance(follower, Follower))]:
+            await box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+        run_task = asyncio.create_task(message_box.run(followers, BatchConfiguration()))
+        self.addAsyncCleanup(self._stop, run_task, distribution)
+
+        distribution.heartbeat(message_box, followers, ReplicationConfiguration(), idle_since=float('inf'))
+        await asyncio.sleep(0.05)
+        commit_index_before = message_box.commit_index
+        await message_box.append('Fries')
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(commit_index_before, 0)
+        self.assertEqual(message_box.commit_index, 2)
+
+    async def test_in_flight_requests_per_follower_are_bounded(self) -> None:
+        fast, slow = Follower(), Follower(delay=5)
+        message_box, _ = await self.start_leader(
+            {fast, slow},
+            ReplicationConfiguration(max_in_flight=2),
+        )
+
+        for message in ('Milkshake', 'Fries', 'Burger', 'Shake'):
+            await message_box.append(message)
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(len(slow.requests), 2)
+
+    async def test_unreachable_follower_is_backed_off(self) -> None:
+        fast, unreachable = Follower(), Follower()
+        unreachable.down = True
+        message_box, _ = await self.start_leader(
+            {fast, unreachable},
+            ReplicationConfiguration(min_backoff=timedelta(seconds=0.05), max_backoff=timedelta(seconds=1)),
+        )
+
+        await message_box.append('Milkshake')
+        await asyncio.sleep(0.2)
+
+        self.assertLessEqual(len(unreachable.requests), 4)
+
+    async def test_restarted_follower_with_an_empty_log_is_caught_up(self) -> None:
+        fast, restarted = Follower(), Follower()
+        message_box, distribution = await self.start_leader(
+            {fast, restarted},
+            ReplicationConfiguration(max_backoff=timedelta(seconds=0.02)),
+        )
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await message_box.append(message)
+        await asyncio.sleep(0.05)
+
+        restarted.message_box = MessageBox(distribution_strategy=NoDistribution())
+        await message_box.append('Shake')
+        await asyncio.sleep(0.2)
+
+        self.assertEqual(distribution.match_index(restarted), 4)
+        self.assertTupleEqual(tuple(restarted.message_box.log.view()), ('Milkshake', 'Fries', 'Burger', 'Shake'))
+        self.assertLess(len(restarted.requests), 20)
+
+    async def test_rejecting_follower_is_backed_off(self) -> None:
+        class RejectingFollower(Follower):
+            rejecting = False
+
+            async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+                if not self.rejecting:
+                    return await super().append_entries(request)
+                self.requests.append(request)
+                return AppendEntriesResponse(success=False, match_index=0)
+
+        fast, rejecting = Follower(), RejectingFollower()
+        message_box, _ = await self.start_leader(
+            {fast, rejecting},
+            ReplicationConfiguration(min_backoff=timedelta(seconds=0.05), max_backoff=timedelta(seconds=1)),
+        )
+        await message_box.append('Milkshake')
+        await asyncio.sleep(0.05)
+
+        rejecting.rejecting = True
+        rejecting.requests.clear()
+        await message_box.append('Fries')
+        await asyncio.sleep(0.2)
+
+        self.assertLessEqual(len(rejecting.requests), 5)
+
+    async def test_lease_holds_after_majority_acknowledged(self) -> None:
+        followers: set[InternalNode[str]] = {Follower(), Follower()}
+        message_box, distribution = await self.start_leader(followers)
+
+        self.assertFalse(distribution.holds_lease(followers, timedelta(seconds=1)))
+        distribution.heartbeat(message_box, followers, ReplicationConfiguration(), idle_since=float('inf'))
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(distribution.holds_lease(followers, timedelta(seconds=1)))
+        self.assertFalse(distribution.holds_lease(followers, timedelta(seconds=0)))
+
+    async def test_lease_needs_a_majority(self) -> None:
+        reachable, unreachable, other_unreachable = Follower(), Follower(), Follower()
+        unreachable.down = other_unreachable.down = True
+        followers: set[InternalNode[str]] = {reachable, unreachable, other_unreachable}
+        message_box, distribution = await self.start_leader(followers)
+
+        distribution.heartbeat(message_box, followers, ReplicationConfiguration(), idle_since=float('inf'))
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(distribution.holds_lease(followers, timedelta(seconds=1)))
@@ -0,0 +1,44 @@
+import unittest
+
+from quorum.node.message_box.log import Log
+
+
+class TestLog(unittest.TestCase):
+    def test_appended_messages_are_indexed_in_order(self) -> None:
+        log = Log[str]()
+
+        log.append('Milkshake')
+        log.extend(('Fries', 'Burger'))
+
+        self.assertEqual(len(log), 3)
+        self.assertListEqual([log[0], log[1], log[2]], ['Milkshake', 'Fries', 'Burger'])
+
+    def test_view_does_not_see_later_appends(self) -> None:
+        log = Log(['Milkshake'])
+
+        view = log.view()
+        log.append('Fries')
+
+        self.assertTupleEqual(tuple(view), ('Milkshake',))
+
+    def test_slice_covers_index_range(self) -> None:
+        log = Log(['Milkshake', 'Fries', 'Burger', 'Shake'])
+
+        self.assertTupleEqual(tuple(log.slice(1, 3)), ('Fries', 'Burger'))
+        self.assertTupleEqual(tuple(log.slice(3, 10)), ('Shake',))
+        self.assertTupleEqual(tuple(log.slice(10, 20)), tuple())
+
+    def test_views_can_be_sliced_and_indexed(self) -> None:
+        view = Log(['Milkshake', 'Fries', 'Burger', 'Shake']).view()[1:]
+
+        self.assertEqual(view[0], 'Fries')
+        self.assertEqual(view[-1], 'Shake')
+        self.assertEqual(view[1:], ('Burger', 'Shake'))
+        with self.assertRaises(IndexError):
+            view[3]
+
+    def test_views_compare_equal_to_sequences_with_same_messages(self) -> None:
+        view = Log(['Milkshake', 'Fries']).view()
+
+        self.assertEqual(view, ('Milkshake', 'Fries'))
+        self.assertNotEqual(view, ('Milkshake',))
@@ -0,0 +1,347 @@
+import asyncio
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from quorum.cluster.configuration import BatchConfiguration, ReplicationConfiguration
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy, \
+    DistributionSuccessful, DistributionFailed
+from quorum.node.message_box.commit_outcome import Committed, CommitFailed, CommitUnknown
+from quorum.node.message_box.distribution_strategy.no_distribution import NoDistribution
+from quorum.node.message_box.message_box import MessageBox
+from quorum.node.node_interface import InternalNode
+
+
+class RecordingDistribution(DistributionStrategy[str]):
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, ...]] = []
+        self._distributed_index = 0
+
+    async def distribute(
+        self,
+        message_box: MessageBox[str],
+        up_to_index: int,
+        other_nodes: set[InternalNode[str]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionSuccessful | DistributionFailed:
+        self.batches.append(tuple(message_box.log.slice(self._distributed_index, up_to_index)))
+        self._distributed_index = up_to_index
+        return DistributionSuccessful()
+
+
+class TestMessageBox(unittest.IsolatedAsyncioTestCase):
+    async def start_message_box(self, batch_configuration: BatchConfiguration) -> tuple[MessageBox[str], RecordingDistribution]:
+        distribution = RecordingDistribution()
+        message_box = MessageBox(distribution_strategy=distribution)
+        run_task = asyncio.create_task(message_box.run(set(), batch_configuration))
+        self.addAsyncCleanup(self._stop, run_task)
+        return message_box, distribution
+
+    async def _stop(self, task: asyncio.Task[Any]) -> None:
+        task.cancel()
+        await asyncio.sleep(0)
+
+    async def test_queued_messages_are_distributed_in_one_batch(self) -> None:
+        message_box, distribution = await self.start_message_box(BatchConfiguration(max_batch_size=10))
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await message_box.append(message)
+        await asyncio.sleep(0.01)
+
+        self.assertListEqual(distribution.batches, [('Milkshake', 'Fries', 'Burger')])
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Milkshake', 'Fries', 'Burger'))
+
+    async def test_batches_do_not_exceed_max_batch_size(self) -> None:
+        message_box, distribution = await self.start_message_box(BatchConfiguration(max_batch_size=2))
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await message_box.append(message)
+        await asyncio.sleep(0.01)
+
+        self.assertListEqual(distribution.batches, [('Milkshake', 'Fries'), ('Burger',)])
+
+    async def test_batch_lingers_for_late_messages(self) -> None:
+        message_box, distribution = await self.start_message_box(
+            BatchConfiguration(max_batch_size=10, max_linger=timedelta(seconds=0.1)),
+        )
+
+        await message_box.append('Milkshake')
+        await asyncio.sleep(0.02)
+        await message_box.append('Fries')
+        await asyncio.sleep(0.2)
+
+        self.assertListEqual(distribution.batches, [('Milkshake', 'Fries')])
+
+    async def test_batch_does_not_wait_without_linger(self) -> None:
+        message_box, distribution = await self.start_message_box(BatchConfiguration(max_batch_size=10))
+
+        await message_box.append('Milkshake')
+        await asyncio.sleep(0.02)
+        await message_box.append('Fries')
+        await asyncio.sleep(0.02)
+
+        self.assertListEqual(distribution.batches, [('Milkshake',), ('Fries',)])
+
+    async def test_get_messages_since_index_with_limit(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await message_box.append(message)
+        await asyncio.sleep(0.01)
+        page = await message_box.get_messages(since_index=1, limit=1)
+        tail = await message_box.get_messages(since_index=page.next_index)
+
+        self.assertTupleEqual(tuple(page.messages), ('Fries',))
+        self.assertEqual(page.next_index, 2)
+        self.assertTupleEqual(tuple(tail.messages), ('Burger',))
+        self.assertEqual(tail.next_index, 3)
+
+    async def test_replicated_entries_are_only_served_once_committed(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=0))
+        uncommitted = await message_box.get_messages()
+        response = await message_box.replicate(AppendEntriesRequest(prev_index=2, entries=tuple(), leader_commit=1))
+        committed = await message_box.get_messages()
+
+        self.assertEqual(response, AppendEntriesResponse(success=True, match_index=2))
+        self.assertTupleEqual(tuple(uncommitted.messages), tuple())
+        self.assertTupleEqual(tuple(committed.messages), ('Milkshake',))
+
+    async def test_replication_past_the_end_of_the_log_is_rejected(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=1))
+        response = await message_box.replicate(AppendEntriesRequest(prev_index=3, entries=('Fries',), leader_commit=4))
+
+        self.assertEqual(response, AppendEntriesResponse(success=False, match_index=1))
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Milkshake',))
+
+    async def test_replication_repairs_a_divergent_prefix_below_the_commit_index(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=1))
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Shake', 'Burger'), leader_commit=2, term=1))
+
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Shake', 'Burger'))
+
+    async def test_stale_replication_does_not_cut_acknowledged_entries(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries', 'Burger', 'Shake'), leader_commit=0))
+        response = await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=0))
+
+        self.assertEqual(response, AppendEntriesResponse(success=True, match_index=2))
+        self.assertEqual(message_box.log.view(), ('Milkshake', 'Fries', 'Burger', 'Shake'))
+
+    async def test_replication_cuts_the_log_at_the_first_conflict(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries', 'Burger'), leader_commit=0))
+        await message_box.replicate(AppendEntriesRequest(
+            prev_index=0,
+            entries=('Milkshake', 'Shake'),
+            leader_commit=0,
+            term=1,
+            entry_terms=(0, 1),
+        ))
+
+        self.assertEqual(message_box.log.view(), ('Milkshake', 'Shake'))
+
+    async def test_replication_is_rejected_when_the_previous_terms_differ(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=1))
+        response = await message_box.replicate(AppendEntriesRequest(
+            prev_index=2,
+            entries=('Burger',),
+            leader_commit=1,
+            term=2,
+            prev_term=1,
+        ))
+
+        self.assertEqual(response, AppendEntriesResponse(success=False, match_index=0))
+        self.assertEqual(message_box.log.view(), ('Milkshake', 'Fries'))
+
+    async def test_previous_term_is_checked_below_the_commit_index_too(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=2, term=1))
+        response = await message_box.replicate(AppendEntriesRequest(
+            prev_index=1,
+            entries=('Burger',),
+            leader_commit=2,
+            term=2,
+            prev_term=2,
+        ))
+
+        self.assertEqual(response, AppendEntriesResponse(success=False, match_index=0))
+        self.assertEqual(message_box.log.view(), ('Milkshake', 'Fries'))
+
+    async def test_rejection_points_at_the_first_entry_of_the_conflicting_term(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+        await message_box.replicate(AppendEntriesRequest(
+            prev_index=1,
+            entries=('Fries', 'Burger', 'Shake'),
+            leader_commit=0,
+            term=2,
+            prev_term=1,
+        ))
+        response = await message_box.replicate(AppendEntriesRequest(prev_index=4, entries=(), leader_commit=0, term=3, prev_term=3))
+
+        self.assertEqual(response, AppendEntriesResponse(success=False, match_index=1))
+
+    async def test_entries_with_the_same_term_are_not_compared_by_content(self) -> None:
+        message_box, _ = await self.start_message_box(BatchConfiguration())
+
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=0, term=1))
+        await message_box.replicate(AppendEntriesRequest(prev_index=1, entries=('Fries',), leader_commit=0, term=1, prev_term=1))
+
+        self.assertEqual(message_box.log.view(), ('Milkshake', 'Fries'))
+        self.assertEqual(message_box.log.terms(0, 2), (1, 1))
+
+
+class SlowFirstDistribution(DistributionStrategy[str]):
+    def __init__(self) -> None:
+        self.concurrent_rounds = 0
+        self.max_concurrent_rounds = 0
+        self.commit_indices: list[int] = []
+
+    async def distribute(
+        self,
+        message_box: MessageBox[str],
+        up_to_index: int,
+        other_nodes: set[InternalNode[str]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionSuccessful | DistributionFailed:
+        self.concurrent_rounds += 1
+        self.max_concurrent_rounds = max(self.max_concurrent_rounds, self.concurrent_rounds)
+        await asyncio.sleep(0.2 if up_to_index == 1 else 0.01)
+        self.concurrent_rounds -= 1
+        self.commit_indices.append(message_box.commit_index)
+        return DistributionSuccessful()
+
+
+class TestPipelinedMessageBox(unittest.IsolatedAsyncioTestCase):
+    async def test_rounds_overlap_up_to_the_pipeline_depth(self) -> None:
+        distribution = SlowFirstDistribution()
+        message_box = MessageBox(distribution_strategy=distribution)
+        run_task = asyncio.create_task(message_box.run(set(), BatchConfiguration(max_batch_size=1, pipeline_depth=3)))
+
+        for message in ('Milkshake', 'Fries', 'Burger', 'Shake'):
+            await message_box.append(message)
+        await asyncio.sleep(0.3)
+        run_task.cancel()
+
+        self.assertEqual(distribution.max_concurrent_rounds, 3)
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Milkshake', 'Fries', 'Burger', 'Shake'))
+
+    async def test_later_rounds_finishing_first_commit_everything_before_them(self) -> None:
+        distribution = SlowFirstDistribution()
+        message_box = MessageBox(distribution_strategy=distribution)
+        run_task = asyncio.create_task(message_box.run(set(), BatchConfiguration(max_batch_size=1, pipeline_depth=2)))
+
+        await message_box.append('Milkshake')
+        await message_box.append('Fries')
+        await asyncio.sleep(0.05)
+        committed_early = await message_box.get_messages()
+        await asyncio.sleep(0.2)
+        run_task.cancel()
+
+        self.assertTupleEqual(tuple(committed_early.messages), ('Milkshake', 'Fries'))
+        self.assertListEqual(distribution.commit_indices, [0, 2])
+
+
+class FailingDistribution(DistributionStrategy[str]):
+    async def distribute(
+        self,
+        message_box: MessageBox[str],
+        up_to_index: int,
+        other_nodes: set[InternalNode[str]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionSuccessful | DistributionFailed:
+        return DistributionFailed()
+
+
+class TestCommitHandles(unittest.IsolatedAsyncioTestCase):
+    async def start_message_box(self, distribution: DistributionStrategy[str]) -> MessageBox[str]:
+        message_box = MessageBox(distribution_strategy=distribution)
+        run_task = asyncio.create_task(message_box.run(set(), BatchConfiguration()))
+        self.addCleanup(run_task.cancel)
+        return message_box
+
+    async def test_handle_resolves_with_committed_index(self) -> None:
+        message_box = await self.start_message_box(RecordingDistribution())
+
+        handles = [await message_box.append(message) for message in ('Milkshake', 'Fries')]
+
+        self.assertListEqual([await handle for handle in handles], [Committed(0), Committed(1)])
+
+    async def test_handle_resolves_as_unknown_when_distribution_fails(self) -> None:
+        message_box = await self.start_message_box(FailingDistribution())
+
+        handle = await message_box.append('Milkshake')
+
+        self.assertEqual(await handle, CommitUnknown())
+
+    async def test_non_leader_refuses_messages_without_appending_them(self) -> None:
+        message_box = await self.start_message_box(NoDistribution())
+
+        handle = await message_box.append('Rogue')
+
+        self.assertEqual(await handle, CommitFailed())
+        self.assertEqual(len(message_box.log), 0)
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ())
+
+    async def test_failing_round_leaves_the_handles_of_earlier_rounds_alone(self) -> None:
+        first_round_may_finish = asyncio.Event()
+
+        class FailingSecondRoundDistribution(FailingDistribution):
+            async def distribute(self, message_box: MessageBox[str], up_to_index: int, *args: Any) -> DistributionSuccessful | DistributionFailed:
+                if up_to_index > 1:
+                    return DistributionFailed()
+                await first_round_may_finish.wait()
+                return DistributionSuccessful()
+
+        message_box = MessageBox(distribution_strategy=FailingSecondRoundDistribution())
+        run_task = asyncio.create_task(message_box.run(set(), BatchConfiguration(max_batch_size=1, pipeline_depth=2)))
+        self.addCleanup(run_task.cancel)
+
+        first_handle = await message_box.append('Milkshake')
+        second_handle = await message_box.append('Fries')
+        second_outcome = await second_handle
+        first_was_resolved = first_handle.done()
+        first_round_may_finish.set()
+
+        self.assertEqual(second_outcome, CommitUnknown())
+        self.assertFalse(first_was_resolved)
+        self.assertEqual(await first_handle, Committed(0))
+
+    async def test_entry_whose_round_failed_is_still_committed_later(self) -> None:
+        message_box = await self.start_message_box(FailingDistribution())
+
+        handle = await message_box.append('Milkshake')
+        outcome = await handle
+        await message_box.commit(1)
+
+        self.assertEqual(outcome, CommitUnknown())
+        self.assertTupleEqual(tuple((await message_box.get_messages()).messages), ('Milkshake',))
+
+    async def test_handle_fails_when_its_entry_is_overwritten(self) -> None:
+        never_finishing = asyncio.Event()
+
+        class StuckDistribution(FailingDistribution):
+            async def distribute(self, *args: Any) -> DistributionSuccessful | DistributionFailed:
+                await never_finishing.wait()
+                return DistributionFailed()
+
+        message_box = await self.start_message_box(StuckDistribution())
+
+        handle = await message_box.append('Milkshake')
+        await asyncio.sleep(0.01)
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Fries',), leader_commit=1, term=1))
+
+        self.assertEqual(await handle, CommitFailed())
@@ -14,14 +14,14 @@ from tests.fixtures import get_running_cluster, create_downable_leader_node, get
 class TestMessaging(unittest.IsolatedAsyncioTestCase):
     async def assert_message_in_cluster(self, cluster: Cluster[str], message: str) -> None:
         messages = await cluster.get_messages()
-        self.assertIsInstance(messages, tuple)
-        assert isinstance(messages, tuple)
+        self.assertNotIsInstance(messages, NoLeaderInCluster)
+        assert not isinstance(messages, NoLeaderInCluster)
         self.assertIn(message, messages)
 
     async def assert_no_messages_in_cluster(self, cluster: Cluster[str]) -> None:
         messages = await cluster.get_messages()
-        assert isinstance(messages, tuple)
-        self.assertTupleEqual(messages, tuple())
+        assert not isinstance(messages, NoLeaderInCluster)
+        self.assertTupleEqual(tuple(messages), tuple())
 
     async def test_that_no_messages_sent_means_no_messages_returned(self) -> None:
         cluster = await get_running_cluster({create_downable_leader_node()})
@@ -95,6 +95,45 @@ class TestMessaging(unittest.IsolatedAsyncioTestCase):
         await self.eventually(self.assert_message_in_cluster, cluster, 'Milkshake')
         await self.eventually(self.assert_message_in_cluster, cluster, 'Fries')
 
+    async def test_many_messages_are_remembered_in_order(self) -> None:
+        cluster = await get_running_cluster({
+            create_downable_leader_node(),
+            create_downable_subject_node(),
+            create_downable_subject_node(),
+        })
+        messages = tuple(f'Milkshake {index}' for index in range(1000))
+
+        for message in messages:
+            await cluster.send_message(message)
+
+        async def assert_all_messages_in_cluster() -> None:
+            self.assertEqual(await cluster.get_messages(), messages)
+
+        await self.eventually(assert_all_messages_in_cluster)
+
+    async def test_follower_that_was_down_catches_up(self) -> None:
+        lagging_subject = create_downable_subject_node()
+        cluster = await get_running_cluster(
+            nodes={
+                create_downable_leader_node(),
+                create_downable_subject_node(),
+                lagging_subject,
+            },
+            election_timeout=ElectionTimeout(min_timeout=timedelta(seconds=0.5), max_timeout=timedelta(seconds=0.8)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+
+        await lagging_subject.take_down()
+        await cluster.send_message('Milkshake')
+        await asyncio.sleep(0.1)
+        await lagging_subject.bring_back_up()
+        await cluster.send_message('Fries')
+
+        async def assert_caught_up() -> None:
+            self.assertTupleEqual(tuple((await lagging_subject.get_messages()).messages), ('Milkshake', 'Fries'))
+
+        await self.eventually(assert_caught_up)
+
     async def test_only_remember_messages_when_consensus_reached(self) -> None:
         initial_leader = create_downable_leader_node()
         subject = create_downable_subject_node()
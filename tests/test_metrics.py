@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from datetime import timedelta
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.metrics import Histogram, PrometheusExposition, NodeMetrics
+from quorum.node.role.candidate import Candidate
+from quorum.node.role.leader import Leader
+from tests.fixtures import create_leader_node, create_subject_node
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    def test_histogram_counts_values_into_cumulative_buckets(self) -> None:
+        histogram = Histogram(buckets=(1.0, 5.0))
+        for value in (0.5, 1.0, 3.0, 7.0):
+            histogram.observe(value)
+        exposition = PrometheusExposition()
+
+        exposition.histogram('batch', 'Batch sizes.', histogram)
+
+        self.assertEqual(exposition.render(), '\n'.join([
+            '# HELP batch Batch sizes.',
+            '# TYPE batch histogram',
+            'batch_bucket{le="1"} 2',
+            'batch_bucket{le="5"} 3',
+            'batch_bucket{le="+Inf"} 4',
+            'batch_sum 11.5',
+            'batch_count 4',
+        ]) + '\n')
+
+    def test_labels_are_escaped(self) -> None:
+        metrics = NodeMetrics()
+        metrics.rpc_failures['http://"node"'].increment()
+        exposition = PrometheusExposition()
+
+        metrics.expose(exposition)
+
+        self.assertIn('quorum_append_entries_failures_total{peer="http://\\"node\\""} 1', exposition.render())
+
+    async def test_leader_records_batches_commits_and_follower_latency(self) -> None:
+        leader = create_leader_node()
+        subject = create_subject_node()
+        leader.register_node(subject)
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(timedelta(seconds=2)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        tasks = [asyncio.create_task(node.run(configuration)) for node in (leader, subject)]
+
+        await asyncio.gather(*[await leader.submit_message(f'Milkshake {index}') for index in range(10)])
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+
+        self.assertEqual(leader.metrics.messages_committed.value, 10)
+        self.assertEqual(leader.metrics.batch_size.sum, 10)
+        self.assertGreater(leader.metrics.commit_latency.count, 0)
+        self.assertGreater(leader.metrics.heartbeat_rounds.value, 0)
+        self.assertGreater(leader.metrics.rpc_latency[subject.metrics_label()].count, 0)
+
+    async def test_won_election_is_recorded(self) -> None:
+        node = create_subject_node()
+        task = asyncio.create_task(node.run(ClusterConfiguration(
+            election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=0.05), min_timeout=timedelta(seconds=0.05)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )))
+
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+        self.assertIsInstance(node.role, Leader)
+        self.assertEqual(node.metrics.elections_started.value, 1)
+        self.assertEqual(node.metrics.elections_won.value, 1)
+        self.assertEqual(node.metrics.role_transitions[('subject', 'candidate')].value, 1)
+        self.assertEqual(node.metrics.role_transitions[('candidate', 'leader')].value, 1)
+
+    async def test_leaderless_time_runs_from_the_last_leader_contact_until_a_leader_is_heard(self) -> None:
+        node = create_subject_node()
+        await node.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0, term=1))
+        await asyncio.sleep(0.1)
+
+        node.change_role(Candidate(node))
+        await asyncio.sleep(0.1)
+        await node.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0, term=1))
+        await node.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0, term=1))
+
+        self.assertGreaterEqual(node.metrics.leaderless_seconds.value, 0.2)
+        self.assertLess(node.metrics.leaderless_seconds.value, 0.5)
@@ -12,7 +12,20 @@ from quorum.node.role.candidate import Candidate
 from quorum.node.role.leader import Leader
 from quorum.node.role.role import Role
 from quorum.node.role.subject import Subject
-from tests.fixtures import create_downable_subject_node, create_downable_leader_node
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.leadership_transfer import LeadershipTransferred, LeadershipTransferFailed, LeadershipTransferInProgress
+from quorum.node.message_box.commit_outcome import CommitFailed
+from quorum.node.message_box.log import NoOp
+from quorum.node.node import Node
+from quorum.node.not_leader import NotLeader
+from quorum.node.request_vote import VoteRequest, VoteResponse
+from tests.fixtures import create_downable_subject_node, create_downable_leader_node, create_subject_node, create_leader_node
+
+
+class UnresponsiveNode(DownableNode[str]):
+    async def append_entries(self, request: AppendEntriesRequest[str]) -> AppendEntriesResponse:
+        await asyncio.sleep(10)
+        return AppendEntriesResponse(success=False, match_index=0)
 
 
 class TestNode(unittest.IsolatedAsyncioTestCase):
@@ -44,22 +57,160 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
             await asyncio.sleep(0.03)
         assertion()
 
-    async def test_requesting_vote_twice_yields_nay(self) -> None:
+    async def heartbeat(self, node: DownableNode[str] | Node[str]) -> AppendEntriesResponse:
+        return await node.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0, term=node.current_term))
+
+    async def test_second_candidate_in_the_same_term_gets_nay(self) -> None:
+        the_node = create_downable_subject_node()
+
+        await the_node.request_vote(VoteRequest(term=1, candidate_id=1000))
+        vote2 = await the_node.request_vote(VoteRequest(term=1, candidate_id=1001))
+
+        self.assertEqual(vote2, VoteResponse(term=1, granted=False))
+
+    async def test_nodes_without_an_address_get_distinct_ids(self) -> None:
+        nodes = [Node[str](lambda node: Subject(node)) for _ in range(500)]
+
+        self.assertEqual(len(set(nodes)), len(nodes))
+
+    async def test_node_id_is_derived_from_the_advertised_address(self) -> None:
+        first = Node[str](lambda node: Subject(node), address='http://node1:8080')
+        restarted = Node[str](lambda node: Subject(node), address='http://node1:8080')
+        other = Node[str](lambda node: Subject(node), address='http://node2:8080')
+
+        self.assertEqual(first, restarted)
+        self.assertNotEqual(first, other)
+
+    async def test_new_term_means_vote_again(self) -> None:
+        the_node = create_downable_subject_node()
+
+        await the_node.request_vote(VoteRequest(term=1, candidate_id=1000))
+        await self.heartbeat(the_node)
+        vote2 = await the_node.request_vote(VoteRequest(term=2, candidate_id=1001))
+
+        self.assertEqual(vote2, VoteResponse(term=2, granted=True))
+
+    async def test_candidate_from_an_older_term_gets_nay(self) -> None:
+        the_node = create_downable_subject_node()
+
+        await the_node.request_vote(VoteRequest(term=3, candidate_id=1000))
+        vote = await the_node.request_vote(VoteRequest(term=2, candidate_id=1001))
+
+        self.assertEqual(vote, VoteResponse(term=3, granted=False))
+
+    async def test_candidate_with_a_shorter_log_gets_nay(self) -> None:
+        the_node = create_downable_subject_node()
+        await the_node.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=0))
+
+        vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1000, last_log_index=1))
+
+        self.assertFalse(vote.granted)
+
+    async def test_candidate_with_a_longer_log_from_an_older_term_gets_nay(self) -> None:
+        the_node = create_downable_subject_node()
+        await the_node.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=2))
+
+        vote = await the_node.request_vote(VoteRequest(term=3, candidate_id=1000, last_log_index=5, last_log_term=1))
+
+        self.assertFalse(vote.granted)
+
+    async def test_pre_vote_neither_changes_term_nor_uses_up_the_vote(self) -> None:
+        the_node = create_downable_subject_node()
+
+        pre_vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1000, pre_vote=True))
+        vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1001))
+
+        self.assertEqual(pre_vote, VoteResponse(term=0, granted=True))
+        self.assertTrue(vote.granted)
+
+    async def test_pre_vote_is_refused_while_the_leader_is_heard(self) -> None:
+        the_node = create_downable_subject_node()
+        asyncio.create_task(the_node.run(
+            ClusterConfiguration(
+                election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01)
+            ))
+        )
+        await asyncio.sleep(0.01)
+
+        await self.heartbeat(the_node)
+        pre_vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1000, pre_vote=True))
+
+        self.assertFalse(pre_vote.granted)
+        self.assertEqual(the_node.current_term, 0)
+
+    async def test_vote_is_refused_while_the_leader_is_heard(self) -> None:
+        the_node = create_downable_subject_node()
+        asyncio.create_task(the_node.run(
+            ClusterConfiguration(
+                election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01)
+            ))
+        )
+        await asyncio.sleep(0.01)
+
+        await self.heartbeat(the_node)
+        vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1000))
+
+        self.assertFalse(vote.granted)
+        self.assertEqual(the_node.current_term, 0)
+
+    async def test_vote_for_a_leadership_transfer_is_granted_while_the_leader_is_heard(self) -> None:
+        the_node = create_downable_subject_node()
+        asyncio.create_task(the_node.run(
+            ClusterConfiguration(
+                election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01)
+            ))
+        )
+        await asyncio.sleep(0.01)
+
+        await self.heartbeat(the_node)
+        vote = await the_node.request_vote(VoteRequest(term=1, candidate_id=1000, leadership_transfer=True))
+
+        self.assertTrue(vote.granted)
+        self.assertEqual(the_node.current_term, 1)
+
+    async def test_timeout_now_from_a_newer_term_is_ignored_while_the_leader_is_heard(self) -> None:
         the_node = create_downable_subject_node()
+        asyncio.create_task(the_node.run(
+            ClusterConfiguration(
+                election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01)
+            ))
+        )
+        await asyncio.sleep(0.01)
 
-        await the_node.request_vote()
-        vote2 = await the_node.request_vote()
+        await self.heartbeat(the_node)
+        await the_node.timeout_now(term=5)
 
-        self.assertFalse(vote2)
+        self.assert_is_subject(the_node)
+        self.assertEqual(the_node.current_term, 0)
 
-    async def test_new_heartbeat_means_vote_again(self) -> None:
+    async def test_append_entries_from_an_older_term_are_rejected(self) -> None:
         the_node = create_downable_subject_node()
+        await the_node.request_vote(VoteRequest(term=2, candidate_id=1000))
+
+        response = await the_node.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+
+        self.assertEqual(response, AppendEntriesResponse(success=False, match_index=0, term=2))
+        self.assertEqual((await the_node.get_messages()).messages, tuple())
 
-        await the_node.request_vote()
-        await the_node.heartbeat()
-        vote2 = await the_node.request_vote()
+    async def test_stale_leader_steps_down_when_a_follower_knows_a_newer_term(self) -> None:
+        leader = create_downable_leader_node()
+        subject = create_downable_subject_node()
+        leader.register_node(subject)
+        await subject.request_vote(VoteRequest(term=3, candidate_id=1000))
 
-        self.assertTrue(vote2)
+        asyncio.create_task(leader.run(
+            ClusterConfiguration(
+                election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01)
+            ))
+        )
+
+        await self.eventually(lambda: self.assert_is_subject(leader))
+        self.assertEqual(leader.current_term, 3)
 
     async def test_subject_who_feels_no_heartbeat_becomes_leader(self) -> None:
         the_node = create_downable_subject_node()
@@ -83,7 +234,7 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
             ))
         )
 
-        await the_node.heartbeat()
+        await self.heartbeat(the_node)
 
         await self.eventually(lambda: self.assert_is_leader(the_node))
 
@@ -92,7 +243,7 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
 
         async def many_heartbeats() -> None:
             for _ in range(40):
-                await the_node.heartbeat()
+                await self.heartbeat(the_node)
                 await asyncio.sleep(0.05)
         asyncio.create_task(many_heartbeats())
 
@@ -105,6 +256,24 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
 
         await self.remains_true(lambda: self.assert_is_subject(the_node))
 
+    async def test_candidate_backing_off_stops_as_soon_as_it_steps_down(self) -> None:
+        the_node = create_subject_node()
+        peers = {create_downable_subject_node(), create_downable_subject_node()}
+        for peer in peers:
+            the_node.register_node(peer)
+            await peer.take_down()
+        candidate = Candidate(the_node)
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(min_timeout=timedelta(seconds=10), max_timeout=timedelta(seconds=20)),
+            heartbeat_period=timedelta(seconds=1),
+        )
+        campaign = asyncio.create_task(candidate.run(set(peers), configuration))
+        await asyncio.sleep(0.05)
+
+        candidate.stop_running()
+
+        await asyncio.wait_for(campaign, timeout=0.5)
+
     async def test_leader_who_feels_heartbeat_steps_down(self) -> None:
         the_node = create_downable_leader_node()
 
@@ -115,7 +284,7 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
             ))
         )
 
-        await the_node.heartbeat()
+        await self.heartbeat(the_node)
 
         await self.eventually(lambda: self.assert_is_subject(the_node))
 
@@ -129,10 +298,25 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
             ))
         )
 
-        await the_node.request_vote()
+        await the_node.request_vote(VoteRequest(term=1, candidate_id=1000))
 
         self.assert_is_subject(the_node)
 
+    async def test_subject_refuses_to_take_messages(self) -> None:
+        the_node = create_subject_node()
+
+        with self.assertRaises(NotLeader):
+            await the_node.submit_message('Rogue')
+
+    async def test_leader_who_steps_down_fails_its_queued_messages(self) -> None:
+        the_node = create_leader_node()
+        handles = [await the_node.submit_message(f'Milkshake {index}') for index in range(5)]
+
+        the_node.change_role(Subject(the_node))
+
+        self.assertListEqual(await asyncio.wait_for(asyncio.gather(*handles), timeout=1), [CommitFailed()] * 5)
+        self.assertEqual(len(the_node.message_box.log), 0)
+
     async def test_leaders_stay_leader_when_no_heartbeat(self) -> None:
         the_node = create_downable_leader_node()
 
@@ -144,3 +328,75 @@ class TestNode(unittest.IsolatedAsyncioTestCase):
         )
 
         await self.remains_true(lambda: self.assert_is_leader(the_node))
+
+    async def test_unresponsive_node_does_not_hold_back_heartbeats_to_others(self) -> None:
+        leader = create_downable_leader_node()
+        subject = create_downable_subject_node()
+        leader.register_node(UnresponsiveNode(create_subject_node()))
+        leader.register_node(subject)
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=0.1), min_timeout=timedelta(seconds=0.05)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+
+        asyncio.create_task(leader.run(configuration))
+        asyncio.create_task(subject.run(configuration))
+
+        await self.remains_true(lambda: self.assert_is_subject(subject))
+
+    async def start_cluster_of_three(self) -> tuple[Node[str], Node[str], Node[str]]:
+        leader = create_leader_node()
+        subjects = create_subject_node(), create_subject_node()
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(max_timeout=timedelta(seconds=1), min_timeout=timedelta(seconds=1)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        for node in (leader, *subjects):
+            for other_node in (leader, *subjects):
+                node.register_node(other_node)
+            task = asyncio.create_task(node.run(configuration))
+            self.addCleanup(task.cancel)
+        return leader, *subjects
+
+    async def test_leadership_is_transferred_to_the_chosen_follower_within_an_election_timeout(self) -> None:
+        leader, subject, other_subject = await self.start_cluster_of_three()
+        await asyncio.gather(*[await leader.submit_message(f'Milkshake {index}') for index in range(10)])
+        transfer_started = asyncio.get_running_loop().time()
+
+        outcome = await leader.transfer_leadership(subject.metrics_label())
+
+        self.assertEqual(outcome, LeadershipTransferred(leader=subject.metrics_label()))
+        self.assertLess(asyncio.get_running_loop().time() - transfer_started, 0.5)
+        self.assertIsInstance(subject.role, Leader)
+        self.assertIsInstance(leader.role, Subject)
+        self.assertEqual(subject.message_box.log.slice(0, 10), [f'Milkshake {index}' for index in range(10)])
+        await (await subject.submit_message('Fries'))
+        self.assertEqual(
+            [message for message in other_subject.message_box.log.view() if not isinstance(message, NoOp)],
+            [*(f'Milkshake {index}' for index in range(10)), 'Fries'],
+        )
+
+    async def test_writes_are_refused_while_leadership_is_transferred(self) -> None:
+        leader, subject, _ = await self.start_cluster_of_three()
+
+        transfer = asyncio.create_task(leader.transfer_leadership(subject.metrics_label()))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(LeadershipTransferInProgress):
+            await leader.submit_message('Milkshake')
+        self.assertIsInstance(await transfer, LeadershipTransferred)
+
+    async def test_only_the_leader_can_transfer_leadership(self) -> None:
+        _, subject, other_subject = await self.start_cluster_of_three()
+
+        outcome = await subject.transfer_leadership(other_subject.metrics_label())
+
+        self.assertEqual(outcome, LeadershipTransferFailed(reason='not the leader'))
+
+    async def test_leadership_cannot_be_transferred_outside_the_cluster(self) -> None:
+        leader, _, _ = await self.start_cluster_of_three()
+
+        outcome = await leader.transfer_leadership('http://elsewhere:8080')
+
+        self.assertIsInstance(outcome, LeadershipTransferFailed)
+        self.assertIsInstance(leader.role, Leader)
@@ -3,12 +3,20 @@ from datetime import timedelta
 from typing import Iterable, Callable, Awaitable, Any
 import unittest
 
+import aiohttp
+
 from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.event_log import EventLog
+from quorum.node.message_box.commit_outcome import Committed
+from quorum.node.message_box.log import NO_OP, NoOp
+from quorum.node.message_box.messages_page import MessagesPage
 from quorum.node.node import Node
 from quorum.node.node_interface import InternalNode
 from tests.downable_node import DownableNode
 from quorum.node.node_http_client import NodeHttpClient
-from quorum.node.node_http_server import NodeServer
+from quorum.node.node_http_server import NodeServer, Forwarding, ProxyToLeader, RedirectToLeader
+from quorum.node.request_vote import VoteRequest, VoteResponse
 from quorum.node.role.candidate import Candidate
 from quorum.node.role.leader import Leader
 from quorum.node.role.subject import Subject
@@ -34,37 +42,58 @@ class TestNodeServer(unittest.IsolatedAsyncioTestCase):
         node: Node[str],
         election_timeout: timedelta = timedelta(seconds=0.1),
         remote_nodes: Iterable[InternalNode[str]] = tuple(),
+        port: int = 8080,
+        forwarding: Forwarding = ProxyToLeader(),
     ) -> None:
         server = NodeServer(
             node=node,
             cluster_configuration=self.get_cluster_configuration(election_timeout),
-            remote_nodes=remote_nodes
+            remote_nodes=remote_nodes,
+            forwarding=forwarding,
         )
-        server_task = asyncio.create_task(server.run(8080))
+        server_task = asyncio.create_task(server.run(port))
         await asyncio.sleep(0.5)
         self.addAsyncCleanup(self._kill_server, server_task)
 
-    async def send_heartbeat(self, port: int) -> None:
+    async def send_heartbeat(self, port: int, term: int = 0) -> None:
         client = NodeHttpClient(f'http://localhost:{port}')
-        await client.heartbeat()
+        await client.append_entries(AppendEntriesRequest(prev_index=0, entries=tuple(), leader_commit=0, term=term))
 
     async def send_message(self, port: int, message: str) -> None:
         client = NodeHttpClient(f'http://localhost:{port}')
         await client.send_message(message)
 
-    async def request_vote(self, port: int) -> bool:
+    async def request_vote(self, port: int, request: VoteRequest) -> VoteResponse:
         client = NodeHttpClient(f'http://localhost:{port}')
-        return await client.request_vote()
+        return await client.request_vote(request)
 
-    async def get_messages(self, port: int) -> tuple[str, ...]:
+    async def get_messages(self, port: int, since_index: int = 0, limit: int | None = None) -> MessagesPage[str]:
         client = NodeHttpClient(f'http://localhost:{port}')
-        return await client.get_messages()
+        return await client.get_messages(since_index, limit)
 
     async def remains_true(self, assertion: Callable[..., Awaitable[None]], *args: Any) -> None:
         for _ in range(34):
             await assertion(*args)
             await asyncio.sleep(0.03)
 
+    async def test_append_entries_carries_terms_and_no_op_entries(self) -> None:
+        node = create_subject_node()
+        await self.start_node_server(node, election_timeout=timedelta(seconds=10))
+        client = NodeHttpClient('http://localhost:8080')
+
+        await client.append_entries(AppendEntriesRequest(
+            prev_index=0,
+            entries=('Milkshake', NO_OP),
+            leader_commit=2,
+            term=2,
+            entry_terms=(1, 2),
+        ))
+        await client.close()
+
+        self.assertEqual(node.message_box.log.terms(0, 2), (1, 2))
+        self.assertIsInstance(node.message_box.log[1], NoOp)
+        self.assertEqual(await self.get_messages(8080), MessagesPage(messages=('Milkshake',), next_index=2))
+
     async def test_running_the_app_runs_the_node(self) -> None:
         node = create_subject_node()
         await self.start_node_server(node)
@@ -77,7 +106,7 @@ class TestNodeServer(unittest.IsolatedAsyncioTestCase):
 
         async def send_many_heartbeats() -> None:
             for _ in range(100):
-                await self.send_heartbeat(port=8080)
+                await self.send_heartbeat(port=8080, term=100)
                 await asyncio.sleep(0.01)
 
         heartbeat_task = asyncio.create_task(send_many_heartbeats())
@@ -92,19 +121,19 @@ class TestNodeServer(unittest.IsolatedAsyncioTestCase):
         node = create_subject_node()
         await self.start_node_server(node)
 
-        vote = await self.request_vote(port=8080)
+        vote = await self.request_vote(port=8080, request=VoteRequest(term=node.current_term + 1, candidate_id=1000))
 
-        self.assertTrue(vote)
+        self.assertEqual(vote, VoteResponse(term=node.current_term, granted=True))
 
     async def test_request_vote_when_already_voted(self) -> None:
         node = create_subject_node()
         await self.start_node_server(node, election_timeout=timedelta(seconds=2))
 
-        await node.request_vote()
+        await node.request_vote(VoteRequest(term=1, candidate_id=1000))
 
-        vote = await self.request_vote(port=8080)
+        vote = await self.request_vote(port=8080, request=VoteRequest(term=1, candidate_id=1001))
 
-        self.assertFalse(vote)
+        self.assertFalse(vote.granted)
 
     async def test_send_and_get_messages(self) -> None:
         node = create_leader_node()
@@ -113,9 +142,73 @@ class TestNodeServer(unittest.IsolatedAsyncioTestCase):
 
         await self.send_message(8080, 'hi')
         await asyncio.sleep(0.5)
-        messages = await self.get_messages(8080)
+        page = await self.get_messages(8080)
+
+        self.assertTupleEqual(tuple(page.messages), ('hi',))
+
+    async def test_get_messages_in_pages(self) -> None:
+        node = create_leader_node()
+
+        await self.start_node_server(node)
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await self.send_message(8080, message)
+        await asyncio.sleep(0.5)
+        first_page = await self.get_messages(8080, limit=2)
+        second_page = await self.get_messages(8080, since_index=first_page.next_index, limit=2)
+        third_page = await self.get_messages(8080, since_index=second_page.next_index, limit=2)
+
+        self.assertEqual(first_page, MessagesPage(messages=('Milkshake', 'Fries'), next_index=2))
+        self.assertEqual(second_page, MessagesPage(messages=('Burger',), next_index=3))
+        self.assertEqual(third_page, MessagesPage(messages=tuple(), next_index=3))
+
+    async def test_send_message_waiting_for_commit(self) -> None:
+        node = create_leader_node()
+
+        await self.start_node_server(node)
+
+        client = NodeHttpClient('http://localhost:8080')
+        outcomes = [await client.send_message_and_wait(message) for message in ('Milkshake', 'Fries')]
+
+        self.assertListEqual(outcomes, [Committed(0), Committed(1)])
+
+    async def test_lone_leader_gives_its_commit_index_as_read_index(self) -> None:
+        node = create_leader_node()
+
+        await self.start_node_server(node)
+
+        await self.send_message(8080, 'hi')
+        await asyncio.sleep(0.5)
+        read_index = await NodeHttpClient('http://localhost:8080').read_index()
+
+        self.assertEqual(read_index, 1)
+
+    async def test_metrics_are_exposed_in_prometheus_format(self) -> None:
+        node = create_leader_node()
+        await self.start_node_server(node)
+        client = NodeHttpClient('http://localhost:8080')
+        await client.send_message_and_wait('Milkshake')
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get('http://localhost:8080/metrics') as response:
+                content_type, body = response.headers['Content-Type'], await response.text()
 
-        self.assertTupleEqual(messages, ('hi',))
+        self.assertTrue(content_type.startswith('text/plain'))
+        self.assertIn('quorum_messages_committed_total 1', body.splitlines())
+        self.assertIn('quorum_is_leader 1', body.splitlines())
+        self.assertIn('# TYPE quorum_commit_latency_seconds histogram', body.splitlines())
+
+    async def test_recent_events_are_served(self) -> None:
+        node: Node[str] = Node(lambda node: Subject(node), event_log=EventLog(capacity=10))
+        await self.start_node_server(node, election_timeout=timedelta(seconds=2))
+        await self.request_vote(port=8080, request=VoteRequest(term=1, candidate_id=1000))
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get('http://localhost:8080/events', params={'limit': 1}) as response:
+                events = (await response.json())['events']
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['event'], 'Voted')
 
     async def test_server_registers_remote_nodes_with_local_node(self) -> None:
         subject = create_subject_node()
@@ -130,3 +223,59 @@ class TestNodeServer(unittest.IsolatedAsyncioTestCase):
             self.assertIsInstance(subject.role, Subject)
 
         await self.remains_true(assert_subject_still_subject)
+
+    async def start_leader_and_follower_servers(self, forwarding: Forwarding) -> Node[str]:
+        leader: Node[str] = Node(lambda node: Leader(node), address='http://localhost:8081')
+        subject = create_subject_node()
+        await asyncio.gather(
+            self.start_node_server(leader, election_timeout=timedelta(seconds=2), remote_nodes={subject}, port=8081),
+            self.start_node_server(subject, election_timeout=timedelta(seconds=2), forwarding=forwarding),
+        )
+        return leader
+
+    async def test_follower_proxies_writes_to_leader(self) -> None:
+        leader = await self.start_leader_and_follower_servers(ProxyToLeader())
+
+        outcome = await NodeHttpClient('http://localhost:8080').send_message_and_wait('Milkshake')
+
+        self.assertEqual(outcome, Committed(0))
+        self.assertTupleEqual(tuple((await leader.get_messages()).messages), ('Milkshake',))
+
+    async def test_follower_redirects_writes_to_leader(self) -> None:
+        await self.start_leader_and_follower_servers(RedirectToLeader())
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                'http://localhost:8080/send_message',
+                json={'message': 'Milkshake'},
+                allow_redirects=False,
+            ) as response:
+                status, location = response.status, response.headers['Location']
+
+        self.assertEqual(status, 307)
+        self.assertEqual(location, 'http://localhost:8081/send_message')
+
+    async def test_leadership_is_transferred_over_http(self) -> None:
+        leader: Node[str] = Node(lambda node: Leader(node), address='http://localhost:8081')
+        subject: Node[str] = Node(lambda node: Subject(node), address='http://localhost:8080')
+        leader_client = NodeHttpClient('http://localhost:8081')
+        subject_client = NodeHttpClient('http://localhost:8080')
+        self.addAsyncCleanup(leader_client.close)
+        self.addAsyncCleanup(subject_client.close)
+        await asyncio.gather(
+            self.start_node_server(leader, election_timeout=timedelta(seconds=2), remote_nodes={subject_client}, port=8081),
+            self.start_node_server(subject, election_timeout=timedelta(seconds=2), remote_nodes={leader_client}),
+        )
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post('http://localhost:8080/transfer_leadership') as response:
+                self.assertEqual(response.status, 409)
+            async with session.post(
+                'http://localhost:8081/transfer_leadership',
+                params={'target': 'http://localhost:8080'},
+            ) as response:
+                self.assertEqual(response.status, 200)
+                self.assertEqual(await response.json(), {'leader': 'http://localhost:8080'})
+
+        self.assertIsInstance(subject.role, Leader)
+        self.assertIsInstance(leader.role, Subject)
@@ -0,0 +1,196 @@
+import asyncio
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.append_entries import AppendEntriesRequest, AppendEntriesResponse
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.log import NO_OP, NoOp
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node import Node
+from quorum.node.node_tcp_client import NodeTcpClient
+from quorum.node.node_tcp_server import NodeTcpServer
+from quorum.node.not_leader import NotLeader
+from quorum.node.request_vote import VoteRequest, VoteResponse
+from quorum.node.role.subject import Subject
+from tests.fixtures import create_subject_node, create_leader_node
+
+
+class TestNodeTcpServer(unittest.IsolatedAsyncioTestCase):
+    async def _stop(self, task: asyncio.Task[Any]) -> None:
+        task.cancel()
+        await asyncio.sleep(0.1)
+
+    async def start_node_tcp_server(
+        self,
+        node: Node[str],
+        run_node: bool = False,
+        server: NodeTcpServer[str] | None = None,
+    ) -> NodeTcpClient[str]:
+        server = server if server is not None else NodeTcpServer(node, JsonCodec())
+        server_task = asyncio.create_task(server.run(port=8090, host='localhost'))
+        self.addAsyncCleanup(self._stop, server_task)
+        if run_node:
+            node_task = asyncio.create_task(node.run(ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=2)),
+                heartbeat_period=timedelta(seconds=0.01),
+            )))
+            self.addAsyncCleanup(self._stop, node_task)
+        await asyncio.sleep(0.1)
+        client = NodeTcpClient.from_url('tcp://localhost:8090', JsonCodec())
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_request_vote(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+
+        self.assertEqual(await client.request_vote(VoteRequest(term=1, candidate_id=1000)), VoteResponse(term=1, granted=True))
+        self.assertFalse((await client.request_vote(VoteRequest(term=1, candidate_id=1001))).granted)
+
+    async def test_append_entries(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+
+        response = await client.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=2))
+
+        self.assertEqual(response, AppendEntriesResponse(success=True, match_index=2))
+        self.assertEqual(await client.get_messages(), MessagesPage(messages=('Milkshake', 'Fries'), next_index=2))
+
+    async def test_follower_redirects_messages_to_the_leader(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+        await client.append_entries(AppendEntriesRequest(
+            prev_index=0,
+            entries=(),
+            leader_commit=0,
+            leader_address='tcp://leader:8090',
+            term=1,
+        ))
+
+        with self.assertRaises(NotLeader) as raised:
+            await client.send_message('Rogue')
+
+        self.assertEqual(raised.exception.args, ('tcp://leader:8090',))
+        self.assertEqual(len(node.message_box.log), 0)
+
+    async def test_append_entries_carries_the_term_of_every_entry(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+
+        await client.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+        response = await client.append_entries(AppendEntriesRequest(
+            prev_index=1,
+            entries=('Fries', 'Burger'),
+            leader_commit=0,
+            term=3,
+            prev_term=1,
+            entry_terms=(2, 3),
+        ))
+
+        self.assertTrue(response.success)
+        self.assertEqual(node.message_box.log.terms(0, 3), (1, 2, 3))
+
+    async def test_append_entries_carries_no_op_entries(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+
+        await client.append_entries(AppendEntriesRequest(prev_index=0, entries=('Milkshake', NO_OP, 'Fries'), leader_commit=3))
+
+        self.assertIsInstance(node.message_box.log[1], NoOp)
+        self.assertEqual(await client.get_messages(), MessagesPage(messages=('Milkshake', 'Fries'), next_index=3))
+
+    async def test_append_entries_tells_follower_the_leader_address(self) -> None:
+        node = create_subject_node()
+        client = await self.start_node_tcp_server(node)
+
+        await client.append_entries(AppendEntriesRequest(
+            prev_index=0,
+            entries=('Milkshake',),
+            leader_commit=0,
+            leader_address='http://leader:8080',
+        ))
+
+        self.assertEqual(node.leader_address, 'http://leader:8080')
+
+    async def test_read_index_of_lone_leader(self) -> None:
+        client = await self.start_node_tcp_server(create_leader_node(), run_node=True)
+
+        self.assertEqual(await client.read_index(), 0)
+
+    async def test_subject_has_no_read_index(self) -> None:
+        client = await self.start_node_tcp_server(create_subject_node())
+
+        self.assertIsNone(await client.read_index())
+
+    async def test_heartbeat(self) -> None:
+        node = create_leader_node()
+        client = await self.start_node_tcp_server(node)
+
+        await client.append_entries(AppendEntriesRequest(prev_index=0, entries=(), leader_commit=0))
+
+        self.assertIsInstance(node.role, Subject)
+
+    async def test_send_and_get_messages(self) -> None:
+        node = create_leader_node()
+        client = await self.start_node_tcp_server(node, run_node=True)
+
+        for message in ('Milkshake', 'Fries', 'Burger'):
+            await client.send_message(message)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(
+            await client.get_messages(since_index=1, limit=5),
+            MessagesPage(messages=('Fries', 'Burger'), next_index=3),
+        )
+
+    async def test_concurrent_calls_share_one_connection(self) -> None:
+        node = create_leader_node()
+        server = CountingNodeTcpServer(node, JsonCodec())
+        client = await self.start_node_tcp_server(node, run_node=True, server=server)
+
+        await asyncio.gather(*[client.send_message(f'Milkshake {index}') for index in range(100)])
+        await asyncio.sleep(0.1)
+        pages = await asyncio.gather(*[client.get_messages(since_index=index, limit=1) for index in range(100)])
+
+        self.assertSetEqual(
+            {message for page in pages for message in page.messages},
+            {f'Milkshake {index}' for index in range(100)},
+        )
+        self.assertEqual(server.connections, 1)
+
+    async def test_call_times_out_when_the_peer_does_not_answer(self) -> None:
+        silent_server = await asyncio.start_server(lambda reader, writer: None, host='localhost', port=8091)
+        self.addAsyncCleanup(silent_server.wait_closed)
+        self.addCleanup(silent_server.close)
+        client = NodeTcpClient.from_url('tcp://localhost:8091', JsonCodec(), request_timeout=timedelta(seconds=0.1))
+        self.addAsyncCleanup(client.close)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await client.read_index()
+
+    async def test_client_reconnects_after_the_connection_is_lost(self) -> None:
+        node = create_subject_node()
+        server = CountingNodeTcpServer(node, JsonCodec())
+        client = await self.start_node_tcp_server(node, server=server)
+        await client.read_index()
+
+        for writer in server.writers:
+            writer.close()
+        await asyncio.sleep(0.1)
+
+        self.assertIsNone(await client.read_index())
+        self.assertEqual(server.connections, 2)
+
+
+class CountingNodeTcpServer(NodeTcpServer[str]):
+    def __init__(self, node: Node[str], codec: JsonCodec) -> None:
+        super().__init__(node, codec)
+        self.connections = 0
+        self.writers: list[asyncio.StreamWriter] = []
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.writers.append(writer)
+        await super()._serve_connection(reader, writer)
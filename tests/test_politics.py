@@ -14,6 +14,7 @@ from quorum.node.role.candidate import Candidate
 from quorum.node.role.leader import Leader
 from quorum.node.role.role import Role
 from quorum.node.role.subject import Subject
+from quorum.simulation.simulated_clock import SimulatedClock
 from tests.fixtures import get_running_cluster, create_downable_subject_node, create_downable_leader_node, create_downable_candidate_node
 
 
@@ -199,6 +200,47 @@ class TestCluster(unittest.IsolatedAsyncioTestCase):
 
         await self.remains_true(assertion)
 
+    def test_that_a_leaderless_cluster_will_never_have_more_than_one_leader_in_simulated_time(self) -> None:
+        async def scenario() -> None:
+            nodes = {create_downable_subject_node() for _ in range(3)}
+            await get_running_cluster(
+                nodes=nodes,
+                election_timeout=ElectionTimeout(
+                    max_timeout=timedelta(seconds=0.2),
+                    min_timeout=timedelta(seconds=0.2)
+                ),
+                heartbeat_period=timedelta(seconds=0.03),
+            )
+
+            def assertion() -> None:
+                leaders = {node for node in nodes if isinstance(node.role, Leader)}
+                self.assertLessEqual(len(leaders), 1)
+
+            await self.remains_true(assertion)
+
+        SimulatedClock().run(scenario())
+
+    def test_simultaneous_candidates_do_not_stall_elections(self) -> None:
+        async def scenario() -> None:
+            nodes = {create_downable_candidate_node() for _ in range(4)}
+            await get_running_cluster(
+                nodes=nodes,
+                election_timeout=ElectionTimeout(
+                    max_timeout=timedelta(seconds=0.2),
+                    min_timeout=timedelta(seconds=0.2),
+                    randomization=cycle((0.0, 0.3, 0.6, 0.9, 0.1, 0.8)),
+                ),
+                heartbeat_period=timedelta(seconds=0.03),
+            )
+
+            def assertion() -> None:
+                leaders = {node for node in nodes if isinstance(node.role, Leader)}
+                self.assertEqual(len(leaders), 1)
+
+            await self.eventually(assertion, timeout=5)
+
+        SimulatedClock().run(scenario())
+
     async def test_that_with_majority_down_no_leader_is_elected(self) -> None:
         live_nodes = {
             create_downable_subject_node(),
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from quorum.client.quorum_client import QuorumClient, RetryConfiguration, NoLeaderAvailable
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.message_box.commit_outcome import Committed, CommitFailed, CommitUnknown
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.node import Node
+from quorum.node.node_http_server import NodeServer, Forwarding, ProxyToLeader, RedirectToLeader
+from quorum.node.role.leader import Leader
+from tests.fixtures import create_subject_node, create_downable_subject_node
+
+FAST_RETRY = RetryConfiguration(attempts=3, min_backoff=timedelta(seconds=0.01), max_backoff=timedelta(seconds=0.02))
+
+
+class TestQuorumClient(unittest.IsolatedAsyncioTestCase):
+    async def _kill_server(self, server_task: asyncio.Task[Any]) -> None:
+        server_task.cancel()
+        await asyncio.sleep(1)
+
+    async def start_leader_and_follower_servers(self, forwarding: Forwarding = ProxyToLeader()) -> Node[str]:
+        leader: Node[str] = Node(lambda node: Leader(node), address='http://localhost:8081')
+        subject = create_subject_node()
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(timedelta(seconds=2), timedelta(seconds=2)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        for node, port, remote_nodes in ((leader, 8081, {subject}), (subject, 8080, set())):
+            server_task = asyncio.create_task(NodeServer(node, remote_nodes, configuration, forwarding).run(port))
+            self.addAsyncCleanup(self._kill_server, server_task)
+        await asyncio.sleep(0.5)
+        return leader
+
+    def create_client(self, *urls: str) -> QuorumClient:
+        client = QuorumClient(urls, retry=FAST_RETRY, seed=0)
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_client_discovers_the_leader(self) -> None:
+        await self.start_leader_and_follower_servers()
+        client = self.create_client('http://localhost:8080', 'http://localhost:8081')
+
+        outcome = await client.send_message('Milkshake')
+
+        self.assertEqual(outcome, Committed(0))
+        self.assertEqual(client.leader, 'http://localhost:8081')
+
+    async def test_client_learns_the_leader_from_a_follower(self) -> None:
+        leader = await self.start_leader_and_follower_servers(RedirectToLeader())
+        client = self.create_client('http://localhost:8080')
+
+        outcome = await client.send_message('Milkshake')
+
+        self.assertEqual(outcome, Committed(0))
+        self.assertTupleEqual(tuple((await leader.get_messages()).messages), ('Milkshake',))
+
+    async def test_concurrent_messages_all_commit(self) -> None:
+        leader = await self.start_leader_and_follower_servers()
+        client = self.create_client('http://localhost:8080', 'http://localhost:8081')
+
+        outcomes = await asyncio.gather(*[client.send_message(f'Milkshake {index}') for index in range(100)])
+
+        self.assertSetEqual({outcome for outcome in outcomes}, {Committed(index) for index in range(100)})
+        self.assertSetEqual(set((await leader.get_messages()).messages), {f'Milkshake {index}' for index in range(100)})
+
+    async def test_get_messages_reads_from_the_leader(self) -> None:
+        await self.start_leader_and_follower_servers()
+        client = self.create_client('http://localhost:8080')
+        await client.send_message('Milkshake')
+        await client.send_message('Fries')
+
+        page = await client.get_messages(since_index=1)
+
+        self.assertEqual(page, MessagesPage(messages=('Fries',), next_index=2))
+
+    async def test_gives_up_when_no_node_is_reachable(self) -> None:
+        client = self.create_client('http://localhost:8080', 'http://localhost:8081')
+
+        self.assertEqual(await client.send_message('Milkshake'), CommitFailed())
+        self.assertEqual(await client.get_messages(), NoLeaderAvailable())
+
+    async def test_write_that_timed_out_is_not_sent_again(self) -> None:
+        leader: Node[str] = Node(lambda node: Leader(node), address='http://localhost:8081')
+        follower = create_downable_subject_node()
+        await follower.take_down()
+        configuration = ClusterConfiguration(
+            election_timeout=ElectionTimeout(timedelta(seconds=2), timedelta(seconds=2)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        server_task = asyncio.create_task(NodeServer(leader, {follower}, configuration).run(8081))
+        self.addAsyncCleanup(self._kill_server, server_task)
+        await asyncio.sleep(0.5)
+        client = QuorumClient(['http://localhost:8081'], retry=FAST_RETRY, request_timeout=timedelta(seconds=0.3), seed=0)
+        self.addAsyncCleanup(client.close)
+
+        outcome = await client.send_message('Milkshake')
+
+        self.assertEqual(outcome, CommitUnknown())
+        self.assertTupleEqual(tuple(leader.message_box.log.slice(0, len(leader.message_box.log))), ('Milkshake',))
@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from datetime import timedelta
+
+from quorum.cluster.cluster import Cluster
+from quorum.cluster.configuration import ElectionTimeout, LeaseConfiguration, ClusterConfiguration
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.message_box.messages_page import MessagesPage
+from quorum.node.read_index import ReadIndexUnavailable
+from tests.fixtures import get_running_cluster, create_downable_leader_node, create_downable_subject_node, \
+    create_leader_node, create_subject_node
+
+
+class TestReadIndex(unittest.IsolatedAsyncioTestCase):
+    async def test_follower_serves_committed_messages(self) -> None:
+        subject = create_downable_subject_node()
+        await get_running_cluster(
+            nodes={create_downable_leader_node(), create_downable_subject_node(), subject},
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(await subject.read_messages(), MessagesPage(messages=tuple(), next_index=0))
+
+    async def test_follower_read_waits_for_what_the_leader_committed(self) -> None:
+        leader = create_downable_leader_node()
+        subject = create_downable_subject_node()
+        await get_running_cluster(
+            nodes={leader, create_downable_subject_node(), subject},
+            election_timeout=ElectionTimeout(timedelta(seconds=10)),
+            heartbeat_period=timedelta(seconds=10),
+        )
+        await asyncio.sleep(0.05)
+
+        await leader.send_message('Milkshake')
+        await asyncio.sleep(0.05)
+        page = await subject.read_messages()
+
+        assert not isinstance(page, ReadIndexUnavailable)
+        self.assertTupleEqual(tuple(page.messages), ('Milkshake',))
+
+    async def test_leader_cut_off_from_majority_gives_no_read_index(self) -> None:
+        leader = create_downable_leader_node()
+        subjects = [create_downable_subject_node(), create_downable_subject_node()]
+        await get_running_cluster(
+            nodes={leader, *subjects},
+            election_timeout=ElectionTimeout(timedelta(seconds=0.3)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+        await asyncio.sleep(0.05)
+
+        for subject in subjects:
+            await subject.take_down()
+
+        self.assertIsNone(await leader.read_index())
+
+    async def test_new_leader_gives_no_read_index_before_an_entry_of_its_term_is_committed(self) -> None:
+        leader = create_leader_node()
+        subjects = [create_subject_node(), create_subject_node()]
+        for node in (leader, *subjects):
+            for other_node in (leader, *subjects):
+                node.register_node(other_node)
+            await node.message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0))
+
+        read_index_before = await leader.read_index()
+        cluster = Cluster[str](
+            nodes={leader, *subjects},
+            cluster_configuration=ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=10)),
+                heartbeat_period=timedelta(seconds=0.01),
+            ),
+        )
+        asyncio.create_task(cluster.run())
+        await asyncio.sleep(0.1)
+
+        self.assertIsNone(read_index_before)
+        self.assertEqual(await leader.read_index(), 2)
+        self.assertEqual(await leader.get_messages(), MessagesPage(messages=('Milkshake',), next_index=2))
+
+    async def test_no_leader_means_no_follower_reads(self) -> None:
+        subject = create_downable_subject_node()
+        await get_running_cluster(
+            nodes={create_downable_subject_node(), subject},
+            election_timeout=ElectionTimeout(timedelta(seconds=10)),
+        )
+
+        self.assertEqual(await subject.read_messages(), ReadIndexUnavailable())
+
+    async def test_leader_lease_answers_without_confirmation(self) -> None:
+        leader = create_leader_node()
+        cluster = Cluster[str](
+            nodes={leader, create_subject_node(), create_subject_node()},
+            cluster_configuration=ClusterConfiguration(
+                election_timeout=ElectionTimeout(timedelta(seconds=10), min_timeout=timedelta(seconds=1)),
+                heartbeat_period=timedelta(seconds=0.01),
+                leases=LeaseConfiguration(enabled=True),
+            ),
+        )
+        asyncio.create_task(cluster.run())
+        await asyncio.sleep(0.05)
+
+        await leader.read_messages()
+
+        self.assertEqual(leader.metrics.lease_hits.value, 1)
+        self.assertEqual(leader.metrics.lease_misses.value, 0)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+import unittest
+from collections import defaultdict
+from datetime import timedelta
+from typing import Callable
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+from quorum.simulation.simulated_clock import SimulatedClock
+from tests.downable_node import DownableNode
+
+RoleHistory = list[tuple[float, int, str, int]]
+
+
+async def partition_randomly(clock: SimulatedClock, cluster_size: int, partitions: int) -> tuple[RoleHistory, int]:
+    configuration = ClusterConfiguration(
+        election_timeout=ElectionTimeout(
+            max_timeout=timedelta(seconds=0.3),
+            min_timeout=timedelta(seconds=0.15),
+            randomization=clock.randomization(),
+        ),
+        heartbeat_period=timedelta(seconds=0.05),
+    )
+    nodes: list[DownableNode[str]] = [DownableNode(Node(lambda node: Subject(node), node_id=node_id)) for node_id in range(cluster_size)]
+    history: RoleHistory = []
+
+    def record_role_of(node: DownableNode[str]) -> Callable[[], None]:
+        return lambda: history.append((clock.now, node._get_id(), str(node.role), node.current_term))
+
+    for node in nodes:
+        for other_node in nodes:
+            node.register_node(other_node)
+        node.on_role_change(record_role_of(node))
+    for node in nodes:
+        asyncio.create_task(node.run(configuration))
+
+    down: set[DownableNode[str]] = set()
+    for _ in range(partitions):
+        await asyncio.sleep(clock.random.uniform(0.01, 0.5))
+        node = clock.random.choice(nodes)
+        if node in down:
+            down.remove(node)
+            await node.bring_back_up()
+        elif len(down) < (cluster_size - 1) // 2:
+            down.add(node)
+            await node.take_down()
+    for node in down:
+        await node.bring_back_up()
+    await asyncio.sleep(5)
+    return history, sum(isinstance(node.role, Leader) for node in nodes)
+
+
+def simulate(seed: int, cluster_size: int, partitions: int) -> tuple[RoleHistory, int]:
+    clock = SimulatedClock(seed)
+    return clock.run(partition_randomly(clock, cluster_size, partitions))
+
+
+class TestSimulatedClock(unittest.TestCase):
+    def test_time_advances_without_waiting(self) -> None:
+        clock = SimulatedClock()
+        started = time.perf_counter()
+
+        clock.run(asyncio.sleep(3600))
+
+        self.assertEqual(clock.now, 3600)
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_timers_fire_in_virtual_time_order(self) -> None:
+        clock = SimulatedClock()
+        fired: list[tuple[str, float]] = []
+
+        async def scenario() -> None:
+            loop = asyncio.get_running_loop()
+            loop.call_later(2, lambda: fired.append(('late', clock.now)))
+            loop.call_later(1, lambda: fired.append(('early', clock.now)))
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.Event().wait(), timeout=1.5)
+            fired.append(('timeout', loop.time()))
+            await asyncio.sleep(1)
+
+        clock.run(scenario())
+
+        self.assertListEqual(fired, [('early', 1), ('timeout', 1.5), ('late', 2)])
+
+    def test_same_seed_replays_the_same_elections(self) -> None:
+        history, _ = simulate(seed=7, cluster_size=5, partitions=20)
+        replayed_history, _ = simulate(seed=7, cluster_size=5, partitions=20)
+        other_history, _ = simulate(seed=8, cluster_size=5, partitions=20)
+
+        self.assertGreater(len(history), 0)
+        self.assertListEqual(replayed_history, history)
+        self.assertNotEqual(other_history, history)
+
+    def test_seeded_partitions_always_heal_to_one_leader(self) -> None:
+        for seed in range(50):
+            with self.subTest(seed=seed):
+                _, leaders = simulate(seed, cluster_size=5, partitions=10)
+
+                self.assertEqual(leaders, 1)
+
+    def test_no_term_ever_has_two_leaders(self) -> None:
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                history, _ = simulate(seed, cluster_size=5, partitions=20)
+                leaders_per_term: defaultdict[int, set[int]] = defaultdict(set)
+                for _, node_id, role, term in history:
+                    if role == 'leader':
+                        leaders_per_term[term].add(node_id)
+
+                self.assertGreater(len(leaders_per_term), 0)
+                self.assertTrue(all(len(leaders) == 1 for leaders in leaders_per_term.values()))
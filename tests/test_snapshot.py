@@ -0,0 +1,168 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+from quorum.cluster.configuration import BatchConfiguration, ReplicationConfiguration
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.distribution_strategy.distribution_strategy import DistributionStrategy, \
+    DistributionSuccessful, DistributionFailed
+from quorum.node.message_box.log import Log, NO_OP, NoOp
+from quorum.node.message_box.message_box import MessageBox
+from quorum.node.message_box.snapshot import Snapshot, Snapshotter, SnapshotEveryEntries, SnapshotEveryBytes, \
+    SnapshotTrigger, write_snapshot
+from quorum.node.message_box.write_ahead_log import WriteAheadLog
+from quorum.node.node_interface import InternalNode
+
+
+class SingleNodeDistribution(DistributionStrategy[str]):
+    async def distribute(
+        self,
+        message_box: MessageBox[str],
+        up_to_index: int,
+        other_nodes: set[InternalNode[str]],
+        configuration: ReplicationConfiguration,
+    ) -> DistributionSuccessful | DistributionFailed:
+        return DistributionSuccessful()
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self) -> None:
+        self.encoded = 0
+
+    def encode(self, message: Any) -> bytes:
+        self.encoded += 1
+        return super().encode(message)
+
+
+class TestSnapshot(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def create_message_box(self, trigger: SnapshotTrigger) -> MessageBox[str]:
+        return MessageBox(
+            distribution_strategy=SingleNodeDistribution(),
+            write_ahead_log=WriteAheadLog(directory=self.directory, codec=JsonCodec(), segment_size=64),
+            snapshotter=Snapshotter(directory=self.directory, codec=JsonCodec(), trigger=trigger),
+        )
+
+    async def run_message_box(self, message_box: MessageBox[str], messages: list[str]) -> None:
+        run_task = asyncio.create_task(message_box.run(set(), BatchConfiguration(max_batch_size=1)))
+        handles = [await message_box.append(message) for message in messages]
+        await asyncio.wait_for(asyncio.gather(*handles), timeout=5)
+        await asyncio.sleep(0.05)
+        run_task.cancel()
+
+    def test_snapshot_is_read_back(self) -> None:
+        path = self.directory / 'messages.snapshot'
+
+        write_snapshot(path, None, ['Milkshake', 'Fries'], JsonCodec())
+        snapshot = Snapshot(path, JsonCodec())
+
+        self.assertEqual(len(snapshot), 2)
+        self.assertListEqual([snapshot[0], snapshot[1]], ['Milkshake', 'Fries'])
+
+    def test_snapshot_extends_base_snapshot(self) -> None:
+        base_path = self.directory / 'base.snapshot'
+        path = self.directory / 'messages.snapshot'
+        write_snapshot(base_path, None, ['Milkshake'], JsonCodec())
+
+        write_snapshot(path, Snapshot(base_path, JsonCodec()), ['Fries', 'Burger'], JsonCodec())
+
+        self.assertListEqual(list(Snapshot(path, JsonCodec()).iterate(0, 3)), ['Milkshake', 'Fries', 'Burger'])
+
+    def test_extending_a_snapshot_writes_only_the_new_entries(self) -> None:
+        base_path = self.directory / 'base.snapshot'
+        path = self.directory / 'messages.snapshot'
+        write_snapshot(base_path, None, ['x' * 10_000], JsonCodec())
+
+        write_snapshot(path, Snapshot(base_path, JsonCodec()), ['Fries'], JsonCodec())
+
+        self.assertLess(path.stat().st_size, 1000)
+        self.assertEqual(Snapshot(path, JsonCodec())[0], 'x' * 10_000)
+
+    def test_snapshot_keeps_the_term_of_every_entry(self) -> None:
+        base_path = self.directory / 'base.snapshot'
+        path = self.directory / 'messages.snapshot'
+        write_snapshot(base_path, None, ['Milkshake'], JsonCodec(), terms=[1])
+
+        write_snapshot(path, Snapshot(base_path, JsonCodec()), ['Fries', 'Burger'], JsonCodec(), terms=[1, 2])
+        log = Log[str](snapshot=Snapshot(path, JsonCodec()))
+
+        self.assertEqual(log.terms(0, 3), (1, 1, 2))
+        self.assertEqual(log.last_term, 2)
+
+    def test_snapshot_keeps_no_op_entries(self) -> None:
+        base_path = self.directory / 'base.snapshot'
+        path = self.directory / 'messages.snapshot'
+        write_snapshot(base_path, None, ['Milkshake', NO_OP], JsonCodec(), terms=[1, 2])
+
+        write_snapshot(path, Snapshot(base_path, JsonCodec()), ['Fries', NO_OP], JsonCodec(), terms=[2, 3])
+        snapshot = Snapshot(path, JsonCodec())
+
+        self.assertListEqual(snapshot.no_op_indices(), [1, 3])
+        self.assertEqual(snapshot[2], 'Fries')
+        self.assertIsInstance(snapshot[3], NoOp)
+        self.assertTrue(Log[str](snapshot=snapshot).contains_no_op(2, 4))
+
+    def test_compacted_log_keeps_its_indices_and_views(self) -> None:
+        path = self.directory / 'messages.snapshot'
+        log = Log(['Milkshake', 'Fries', 'Burger'])
+        view = log.view()
+        write_snapshot(path, None, ['Milkshake', 'Fries'], JsonCodec())
+
+        log.compact(Snapshot(path, JsonCodec()))
+        log.append('Shake')
+
+        self.assertEqual(len(log), 4)
+        self.assertEqual(log.tail_length, 2)
+        self.assertListEqual([log[index] for index in range(4)], ['Milkshake', 'Fries', 'Burger', 'Shake'])
+        self.assertEqual(log.slice(1, 4), ('Fries', 'Burger', 'Shake'))
+        self.assertEqual(view, ('Milkshake', 'Fries', 'Burger'))
+
+    async def test_message_box_snapshots_after_enough_entries(self) -> None:
+        message_box = self.create_message_box(SnapshotEveryEntries(5))
+
+        await self.run_message_box(message_box, [f'Milkshake {index}' for index in range(12)])
+
+        self.assertEqual(len(list(self.directory.glob('*.snapshot'))), 2)
+        self.assertEqual(
+            (await message_box.get_messages()).messages,
+            tuple(f'Milkshake {index}' for index in range(12)),
+        )
+
+    async def test_message_box_snapshots_after_enough_bytes(self) -> None:
+        message_box = self.create_message_box(SnapshotEveryBytes(1000))
+
+        await self.run_message_box(message_box, ['Milkshake'] * 10)
+        self.assertListEqual(list(self.directory.glob('*.snapshot')), [])
+
+        await self.run_message_box(message_box, ['x' * 1000])
+        self.assertEqual(len(list(self.directory.glob('*.snapshot'))), 1)
+
+    async def test_byte_trigger_reuses_the_write_ahead_log_encoding(self) -> None:
+        codec = CountingCodec()
+        message_box = MessageBox(
+            distribution_strategy=SingleNodeDistribution(),
+            write_ahead_log=WriteAheadLog(directory=self.directory, codec=codec),
+            snapshotter=Snapshotter(directory=self.directory, codec=codec, trigger=SnapshotEveryBytes(1_000_000)),
+        )
+
+        await self.run_message_box(message_box, ['Milkshake'] * 10)
+
+        self.assertEqual(codec.encoded, 10)
+
+    async def test_restart_recovers_from_snapshot_and_write_ahead_log(self) -> None:
+        message_box = self.create_message_box(SnapshotEveryEntries(5))
+        await self.run_message_box(message_box, [f'Milkshake {index}' for index in range(7)])
+
+        recovered_message_box = self.create_message_box(SnapshotEveryEntries(5))
+
+        self.assertEqual(
+            (await recovered_message_box.get_messages()).messages,
+            tuple(f'Milkshake {index}' for index in range(7)),
+        )
+        self.assertLessEqual(len(list(self.directory.glob('*.wal'))), 2)
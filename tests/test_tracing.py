@@ -0,0 +1,88 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+from quorum.node.role.subject import Subject
+from quorum.node.tracing import TraceRecorder
+from tests.fixtures import create_subject_node
+
+
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+    def get_cluster_configuration(self, election_timeout: timedelta = timedelta(seconds=2)) -> ClusterConfiguration:
+        return ClusterConfiguration(
+            election_timeout=ElectionTimeout(election_timeout, election_timeout),
+            heartbeat_period=timedelta(seconds=0.01),
+        )
+
+    async def run_traced_leader(self, recorder: TraceRecorder[str]) -> Node[str]:
+        leader: Node[str] = Node(lambda node: Leader(node), tracer=recorder)
+        subject = create_subject_node()
+        leader.register_node(subject)
+        for node in (leader, subject):
+            task = asyncio.create_task(node.run(self.get_cluster_configuration()))
+            self.addCleanup(task.cancel)
+        return leader
+
+    async def test_message_life_is_recorded_in_order(self) -> None:
+        recorder = TraceRecorder[str]()
+        leader = await self.run_traced_leader(recorder)
+
+        await asyncio.gather(*[await leader.submit_message(f'Milkshake {index}') for index in range(5)])
+
+        self.assertListEqual([trace.index for trace in recorder.messages], list(range(5)))
+        for trace in recorder.messages:
+            assert trace.first_sent is not None and trace.quorum_reached is not None and trace.committed is not None
+            self.assertLessEqual(trace.enqueued, trace.appended)
+            self.assertLessEqual(trace.appended, trace.first_sent)
+            self.assertLessEqual(trace.first_sent, trace.quorum_reached)
+            self.assertLessEqual(trace.quorum_reached, trace.committed)
+            self.assertEqual(len(trace.acknowledged), 1)
+
+    async def test_heartbeats_are_recorded_as_spans(self) -> None:
+        recorder = TraceRecorder[str]()
+        await self.run_traced_leader(recorder)
+
+        await asyncio.sleep(0.1)
+
+        heartbeats = [span for span in recorder.spans if span.kind == 'heartbeat']
+        self.assertGreater(len(heartbeats), 0)
+        self.assertTrue(all(span.outcome == 'accepted' and span.finished >= span.started for span in heartbeats))
+
+    async def test_votes_are_recorded_as_spans(self) -> None:
+        recorder = TraceRecorder[str]()
+        candidate: Node[str] = Node(lambda node: Subject(node), tracer=recorder)
+        voter = create_subject_node()
+        candidate.register_node(voter)
+        task = asyncio.create_task(candidate.run(self.get_cluster_configuration(timedelta(seconds=0.05))))
+        self.addCleanup(task.cancel)
+
+        for _ in range(100):
+            if isinstance(candidate.role, Leader):
+                break
+            await asyncio.sleep(0.02)
+
+        votes = [span for span in recorder.spans if span.kind == 'request_vote']
+        self.assertEqual(len(votes), 1)
+        self.assertEqual(votes[0].outcome, 'granted')
+
+    async def test_dump_writes_one_json_line_per_message_and_rpc(self) -> None:
+        recorder = TraceRecorder[str]()
+        leader = await self.run_traced_leader(recorder)
+        await (await leader.submit_message('Milkshake'))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'trace.jsonl'
+            recorder.dump(path)
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+        messages = [line for line in lines if line['type'] == 'message']
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0]['index'], 0)
+        self.assertGreaterEqual(messages[0]['total'], 0)
+        self.assertEqual(len(lines) - 1, len(recorder.spans))
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from quorum.node.append_entries import AppendEntriesRequest
+from quorum.node.message_box.codec import JsonCodec
+from quorum.node.message_box.distribution_strategy.no_distribution import NoDistribution
+from quorum.node.message_box.log import NoOp
+from quorum.node.message_box.message_box import MessageBox
+from quorum.node.message_box.write_ahead_log import WriteAheadLog, Durability, FsyncPerBatch, FsyncInterval, NoFsync
+from quorum.cluster.configuration import ClusterConfiguration, ElectionTimeout
+from quorum.node.node import Node
+from quorum.node.role.leader import Leader
+
+
+class TestWriteAheadLog(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def open_write_ahead_log(self, durability: Durability = FsyncPerBatch(), segment_size: int = 1024) -> WriteAheadLog[str]:
+        return WriteAheadLog(
+            directory=self.directory,
+            codec=JsonCodec(),
+            durability=durability,
+            segment_size=segment_size,
+        )
+
+    async def test_fresh_log_recovers_nothing(self) -> None:
+        write_ahead_log = self.open_write_ahead_log()
+
+        self.assertListEqual(write_ahead_log.recover(), [])
+        await write_ahead_log.close()
+
+    async def test_appended_messages_are_recovered(self) -> None:
+        for durability in (FsyncPerBatch(), FsyncInterval(timedelta(seconds=0.01)), NoFsync()):
+            with self.subTest(durability):
+                for segment in self.directory.iterdir():
+                    segment.unlink()
+                write_ahead_log = self.open_write_ahead_log(durability)
+                write_ahead_log.recover()
+                await write_ahead_log.append(('Milkshake', 'Fries'))
+                await write_ahead_log.append(('Burger',))
+                await write_ahead_log.close()
+
+                self.assertListEqual(self.open_write_ahead_log().recover(), ['Milkshake', 'Fries', 'Burger'])
+
+    async def test_log_is_split_into_segments(self) -> None:
+        write_ahead_log = self.open_write_ahead_log(segment_size=64)
+        write_ahead_log.recover()
+
+        for index in range(20):
+            await write_ahead_log.append((f'Milkshake {index}',))
+        await write_ahead_log.close()
+
+        self.assertGreater(len(list(self.directory.glob('*.wal'))), 1)
+        self.assertListEqual(self.open_write_ahead_log().recover(), [f'Milkshake {index}' for index in range(20)])
+
+    async def test_torn_record_at_the_end_is_discarded(self) -> None:
+        write_ahead_log = self.open_write_ahead_log()
+        write_ahead_log.recover()
+        await write_ahead_log.append(('Milkshake', 'Fries'))
+        await write_ahead_log.close()
+        segment = next(self.directory.glob('*.wal'))
+        os.truncate(segment, segment.stat().st_size - 2)
+
+        recovered_log = self.open_write_ahead_log()
+        self.assertListEqual(recovered_log.recover(), ['Milkshake'])
+        await recovered_log.append(('Burger',))
+        await recovered_log.close()
+
+        self.assertListEqual(self.open_write_ahead_log().recover(), ['Milkshake', 'Burger'])
+
+    async def test_truncated_messages_are_not_recovered(self) -> None:
+        write_ahead_log = self.open_write_ahead_log(segment_size=64)
+        write_ahead_log.recover()
+        for index in range(10):
+            await write_ahead_log.append((f'Milkshake {index}',))
+
+        write_ahead_log.truncate(3)
+        await write_ahead_log.append(('Fries',))
+        await write_ahead_log.close()
+
+        self.assertListEqual(self.open_write_ahead_log().recover(), ['Milkshake 0', 'Milkshake 1', 'Milkshake 2', 'Fries'])
+
+    async def test_follower_persists_entries_before_acknowledging_them(self) -> None:
+        message_box = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=1))
+
+        restarted = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+
+        self.assertEqual(restarted.log.view(), ('Milkshake', 'Fries'))
+        self.assertEqual(restarted.commit_index, 1)
+        self.assertTupleEqual(tuple((await restarted.get_messages()).messages), ('Milkshake',))
+
+    async def test_follower_persists_conflict_truncation(self) -> None:
+        message_box = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake', 'Fries'), leader_commit=0))
+        await message_box.replicate(AppendEntriesRequest(prev_index=1, entries=('Burger',), leader_commit=0, term=1))
+
+        restarted = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+
+        self.assertEqual(restarted.log.view(), ('Milkshake', 'Burger'))
+        self.assertEqual(restarted.log.terms(0, 2), (0, 1))
+
+    async def test_no_op_entries_are_recovered_but_not_served(self) -> None:
+        message_box = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+        await message_box.replicate(AppendEntriesRequest(prev_index=0, entries=('Milkshake',), leader_commit=0, term=1))
+        await message_box.append_no_op()
+        await message_box.commit(2)
+
+        restarted = MessageBox[str](distribution_strategy=NoDistribution(), write_ahead_log=self.open_write_ahead_log())
+
+        self.assertIsInstance(restarted.log[1], NoOp)
+        self.assertEqual(restarted.log.terms(0, 2), (1, 0))
+        self.assertTupleEqual(tuple((await restarted.get_messages()).messages), ('Milkshake',))
+        self.assertEqual((await restarted.get_messages()).next_index, 2)
+
+    async def test_concurrent_appends_share_fsyncs(self) -> None:
+        write_ahead_log = self.open_write_ahead_log(segment_size=1024 * 1024)
+        write_ahead_log.recover()
+
+        with mock.patch('os.fsync', wraps=os.fsync) as fsync:
+            await asyncio.gather(*[write_ahead_log.append((f'Milkshake {index}',)) for index in range(100)])
+
+        self.assertLess(fsync.call_count, 100)
+        await write_ahead_log.close()
+
+    async def test_restarted_node_remembers_messages(self) -> None:
+        node: Node[str] = Node(lambda node: Leader(node), write_ahead_log=self.open_write_ahead_log())
+        await node.send_message('Milkshake')
+        await node.send_message('Fries')
+        node_task = asyncio.create_task(node.run(ClusterConfiguration(
+            election_timeout=ElectionTimeout(timedelta(seconds=1)),
+            heartbeat_period=timedelta(seconds=0.01),
+        )))
+        await asyncio.sleep(0.1)
+        node_task.cancel()
+
+        restarted_node: Node[str] = Node(lambda node: Leader(node), write_ahead_log=self.open_write_ahead_log())
+
+        self.assertTupleEqual(tuple((await restarted_node.get_messages()).messages), ('Milkshake', 'Fries'))